@@ -8,8 +8,13 @@ This module provides specialized query methods for:
 - Analyzing entity networks and connections
 """
 
+import asyncio
+import copy
+import functools
 import logging
-from typing import Dict, List, Optional, Any, Set
+import re
+from collections import OrderedDict
+from typing import Dict, FrozenSet, List, Optional, Any, Set
 from dataclasses import dataclass
 
 from .cognee_graph import CogneeKnowledgeGraph, QueryResult
@@ -18,6 +23,58 @@ from .cognee_graph import CogneeKnowledgeGraph, QueryResult
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Capitalized words that start sentences rather than names
+_STOPWORDS = frozenset({'The', 'A', 'An'})
+
+# A word of 3+ characters starting with a letter, optionally followed on the
+# same line by another word starting with a letter. The follower is captured
+# in a lookahead so it is still scanned as a candidate name in its own right.
+# Letters match in any script; _parse_entities keeps the capitalized ones.
+_NAME_RE = re.compile(r'(?<!\S)([^\W\d_]\S{2,})(?:[^\S\n]+(?=([^\W\d_]\S*)))?')
+
+
+def _memoize(maxsize: int = 256):
+    """
+    Cache an idempotent async query method per querier instance.
+
+    Results are keyed by method name and call arguments and kept in an LRU
+    of at most maxsize entries. Callers receive a shallow copy so mutating a
+    returned list or dict cannot corrupt the cached value.
+
+    Concurrent misses on the same key are coalesced: the first caller starts
+    the query as a shared task and every caller, the first included, awaits
+    it through asyncio.shield, so cancelling one caller never cancels the
+    query under the others. Failures propagate to every waiter uncached.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            key = (method.__name__, args, tuple(sorted(kwargs.items())))
+            cache = self._memo
+            if key in cache:
+                cache.move_to_end(key)
+                return copy.copy(cache[key])
+
+            pending = self._inflight.get(key)
+            if pending is None:
+                async def run():
+                    try:
+                        result = await method(self, *args, **kwargs)
+                    finally:
+                        del self._inflight[key]
+                    cache[key] = result
+                    if len(cache) > maxsize:
+                        cache.popitem(last=False)
+                    return result
+
+                pending = self._inflight[key] = asyncio.ensure_future(run())
+
+            return copy.copy(await asyncio.shield(pending))
+
+        return wrapper
+
+    return decorator
+
 
 @dataclass
 class EntityEvolution:
@@ -57,6 +114,56 @@ class EntityQuerier:
             knowledge_graph: CogneeKnowledgeGraph instance
         """
         self.kg = knowledge_graph
+        self._memo: OrderedDict = OrderedDict()
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+
+    def clear_cache(self):
+        """Forget memoized results (e.g. after new documents are cognified)."""
+        self._memo.clear()
+
+    def _parse_entities(
+        self,
+        answer: str,
+        *,
+        exclude: Optional[str] = None,
+        include_single: bool = True,
+        stopwords: FrozenSet[str] = _STOPWORDS,
+    ) -> List[str]:
+        """
+        Parse entity names from a free-text query answer.
+
+        This is a simple implementation - could be enhanced with NER.
+        Two adjacent capitalized words are treated as a full name; a lone
+        capitalized word is kept as a single-word name when include_single
+        is set.
+
+        Args:
+            answer: Answer text returned by the knowledge graph
+            exclude: Entity name to leave out (usually the queried entity)
+            include_single: Whether to keep single-word names
+            stopwords: Capitalized words that are never treated as names
+
+        Returns:
+            Unique entity names in order of first appearance
+        """
+        entities = []
+        seen = {exclude}
+        for match in _NAME_RE.finditer(answer):
+            word, next_word = match.groups()
+            if not word[0].isupper():
+                continue
+            if next_word and next_word[0].isupper():
+                # Two capitalized words = likely full name
+                name = f"{word} {next_word}"
+            elif include_single and word not in stopwords:
+                name = word
+            else:
+                continue
+            if name not in seen:
+                seen.add(name)
+                entities.append(name)
+
+        return entities
 
     async def get_all_characters(
         self,
@@ -79,25 +186,7 @@ class EntityQuerier:
         query = "List all character names in the story"
         result = await self.kg.query(query, volume=volume)
 
-        # Parse character names from result
-        # This is a simple implementation - could be enhanced with NER
-        characters = []
-        lines = result.answer.split('\n')
-        for line in lines:
-            # Look for names (capitalized words)
-            words = line.strip().split()
-            for i, word in enumerate(words):
-                if word[0].isupper() and len(word) > 2:
-                    # Could be a name
-                    if i + 1 < len(words) and words[i+1][0].isupper():
-                        # Two capitalized words = likely full name
-                        name = f"{word} {words[i+1]}"
-                        if name not in characters:
-                            characters.append(name)
-                    elif word not in characters and word not in ['The', 'A', 'An']:
-                        characters.append(word)
-
-        return characters
+        return self._parse_entities(result.answer)
 
     async def get_character_psychology(
         self,
@@ -375,17 +464,9 @@ class EntityQuerier:
         for connection_type, query_text in queries.items():
             try:
                 result = await self.kg.query(query_text)
-                # Parse entity names from result (simple implementation)
-                entities = []
-                for line in result.answer.split('\n'):
-                    words = line.strip().split()
-                    for i, word in enumerate(words):
-                        if word[0].isupper() and len(word) > 2:
-                            if i + 1 < len(words) and words[i+1][0].isupper():
-                                name = f"{word} {words[i+1]}"
-                                if name not in entities and name != entity_name:
-                                    entities.append(name)
-
+                entities = self._parse_entities(
+                    result.answer, exclude=entity_name, include_single=False
+                )
                 network[connection_type] = entities[:max_connections]
             except Exception as e:
                 logger.warning(f"Could not get {connection_type} for {entity_name}: {e}")
@@ -402,6 +483,9 @@ class EntityQuerier:
         """
         Find entities similar to the given entity.
 
+        Results are memoized per (entity_name, entity_type) for the lifetime
+        of the querier; call clear_cache() after the graph changes.
+
         Args:
             entity_name: Name of the entity
             entity_type: Type filter (character, location, concept)
@@ -414,31 +498,27 @@ class EntityQuerier:
             >>> similar = await querier.find_similar_entities("Mickey Bardot")
             >>> print(similar)  # Other gamblers or quantum users
         """
-        type_filter = f"{entity_type}s" if entity_type else "entities"
-        query = f"Find {type_filter} similar to {entity_name}"
-
         try:
-            result = await self.kg.query(query)
-
-            # Parse entity names
-            entities = []
-            for line in result.answer.split('\n'):
-                words = line.strip().split()
-                for i, word in enumerate(words):
-                    if word[0].isupper() and len(word) > 2:
-                        if i + 1 < len(words) and words[i+1][0].isupper():
-                            name = f"{word} {words[i+1]}"
-                            if name not in entities and name != entity_name:
-                                entities.append(name)
-                        elif word not in entities and word != entity_name:
-                            entities.append(word)
-
+            entities = await self._find_similar_entities(entity_name, entity_type)
             return entities[:limit]
 
         except Exception as e:
             logger.error(f"Could not find similar entities: {e}")
             return []
 
+    @_memoize()
+    async def _find_similar_entities(
+        self,
+        entity_name: str,
+        entity_type: Optional[str],
+    ) -> List[str]:
+        """Query and parse similar entities (failures propagate, uncached)."""
+        type_filter = f"{entity_type}s" if entity_type else "entities"
+        query = f"Find {type_filter} similar to {entity_name}"
+
+        result = await self.kg.query(query)
+        return self._parse_entities(result.answer, exclude=entity_name)
+
     async def get_worldbuilding_mechanics(
         self,
         topic: str,
@@ -446,6 +526,10 @@ class EntityQuerier:
         """
         Get detailed worldbuilding mechanics for a specific topic.
 
+        Answers are memoized per topic and aspect for the lifetime of the
+        querier; an aspect whose query failed comes back as "" and is
+        retried on the next call.
+
         Args:
             topic: Worldbuilding topic (e.g., "bi-location", "The Line")
 
@@ -472,14 +556,19 @@ class EntityQuerier:
         mechanics = {}
         for aspect, query_text in queries.items():
             try:
-                result = await self.kg.query(query_text, categories=['worldbuilding'])
-                mechanics[aspect] = result.answer
+                mechanics[aspect] = await self._query_worldbuilding(query_text)
             except Exception as e:
                 logger.warning(f"Could not get {aspect} for {topic}: {e}")
                 mechanics[aspect] = ""
 
         return mechanics
 
+    @_memoize()
+    async def _query_worldbuilding(self, query_text: str) -> str:
+        """Answer a worldbuilding question (failures propagate, uncached)."""
+        result = await self.kg.query(query_text, categories=['worldbuilding'])
+        return result.answer
+
     async def analyze_character_arc(
         self,
         character_name: str,
@@ -14,6 +14,7 @@ Integrates with NotebookLM for canonical reference verification.
 from .models import (
     ConsistencyIssue,
     ConsistencyReport,
+    IssueStore,
     VolumeConsistencyReport,
     CharacterState,
     RelationshipState
@@ -26,6 +27,7 @@ from .volume1_checker import Volume1ConsistencyChecker
 __all__ = [
     'ConsistencyIssue',
     'ConsistencyReport',
+    'IssueStore',
     'VolumeConsistencyReport',
     'CharacterState',
     'RelationshipState',
@@ -4,19 +4,313 @@ Character State Tracker
 Tracks character state evolution across scenes to detect inconsistencies.
 """
 
-from typing import Dict, List, Optional, Tuple
+import bisect
+import functools
+import itertools
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, FrozenSet, List, Optional, Tuple
 from pathlib import Path
 from collections import defaultdict
+from dataclasses import dataclass, field
+
+# Numba JIT for the ordinal scans (optional, pip install numba)
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator when Numba is not installed."""
+        def decorator(func):
+            return func
+        return decorator
 
 from .models import (
     CharacterState,
     RelationshipState,
     ConsistencyIssue,
     IssueSeverity,
-    IssueCategory
+    IssueCategory,
+    _intern,
+    _relationship_key
 )
 
 
+# Timeline states below which check_all() skips the process pool
+PARALLEL_CHECK_MIN_STATES = 50000
+
+# Morphic resonance range as ordinal values for progression checks
+_RANGE_VALUES = {
+    "touch": 0,
+    "close": 1,
+    "medium": 2,
+    "far": 3
+}
+
+# Relationship trust levels as ordinal values (keys are lowercase)
+_TRUST_LEVELS = {
+    'none': 0,
+    'low': 1,
+    'medium': 2,
+    'high': 3,
+    'complete': 4
+}
+
+# Emotional state keywords by category, checked in priority order
+_EMOTIONAL_KEYWORDS = {
+    'positive': ['hopeful', 'optimistic', 'happy', 'content', 'peaceful'],
+    'negative': ['desperate', 'hopeless', 'depressed', 'cynical', 'angry'],
+    'neutral': ['focused', 'analytical', 'calm', 'professional']
+}
+
+# One compiled alternation per category: a single C-level scan replaces the
+# per-keyword substring checks. Kept per category (not one combined pattern)
+# so the first matching category still wins regardless of match position.
+_EMOTION_PATTERNS = [
+    (category, re.compile('|'.join(map(re.escape, keywords))))
+    for category, keywords in _EMOTIONAL_KEYWORDS.items()
+]
+
+
+def _categorize_emotion(emotional_state: str) -> str:
+    """Categorize emotional state as positive, negative, neutral or unknown."""
+    state_lower = emotional_state.lower()
+    for category, pattern in _EMOTION_PATTERNS:
+        if pattern.search(state_lower):
+            return category
+    return 'unknown'
+
+
+@functools.lru_cache(maxsize=4096)
+def _scene_sort_key(scene_id: str) -> Tuple[int, ...]:
+    """
+    Convert scene ID to sortable tuple (memoized, scene IDs repeat heavily).
+
+    Examples:
+        "1.3.2" → (1, 3, 2)
+        "1.15.1" → (1, 15, 1)
+        "test-1" → (0, 0, 0)
+    """
+    try:
+        parts = scene_id.split('.')
+        return tuple(int(p) for p in parts)
+    except (ValueError, AttributeError):
+        return (0, 0, 0)
+
+
+class _Missing:
+    """Sentinel type; pickles by reference so identity survives worker processes."""
+
+    def __reduce__(self):
+        return '_MISSING'
+
+
+# Marks a state that does not carry a tracked attribute
+_MISSING = _Missing()
+
+
+_FNV_PRIME = 1099511628211
+_HASH_MASK = (1 << 64) - 1
+
+
+def _mix_signature(signature: int, item) -> int:
+    """Fold one state's fields into a rolling FNV-style timeline signature."""
+    return ((signature * _FNV_PRIME) ^ hash(item)) & _HASH_MASK
+
+
+@dataclass
+class CharacterColumns:
+    """
+    Column-wise (struct-of-arrays) mirror of one character's timeline.
+
+    Each list is parallel to the CharacterState timeline, so consistency
+    checks can walk the few fields they need without touching the state
+    objects or their attribute dicts. States are treated as immutable once
+    added to the tracker.
+    """
+
+    scene_ids: List[str] = field(default_factory=list)
+    sobriety: List[object] = field(default_factory=list)   # days or _MISSING
+    resonance: List[object] = field(default_factory=list)  # range or _MISSING
+    resonance_vals: List[int] = field(default_factory=list)
+    abilities: List[FrozenSet[str]] = field(default_factory=list)
+    emotional_states: List[str] = field(default_factory=list)
+    emotion_categories: List[Optional[str]] = field(default_factory=list)
+    rows_md: List[str] = field(default_factory=list)  # pre-rendered timeline table rows
+    signature: int = 0  # rolling hash of every inserted state
+
+    def insert(self, idx: int, state: CharacterState):
+        """Insert a state's columns at timeline position idx."""
+        resonance = state.attributes.get('morphic_resonance_range', _MISSING)
+        sobriety = state.attributes.get('sobriety_days', _MISSING)
+        abilities = frozenset(state.abilities)
+
+        self.signature = _mix_signature(self.signature, (
+            idx, state.scene_id, state.emotional_state, abilities,
+            repr(sobriety), repr(resonance)
+        ))
+
+        self.scene_ids.insert(idx, state.scene_id)
+        self.sobriety.insert(idx, sobriety)
+        self.resonance.insert(idx, resonance)
+        self.resonance_vals.insert(
+            idx, -1 if resonance is _MISSING else _RANGE_VALUES.get(resonance, -1)
+        )
+        self.abilities.insert(idx, abilities)
+        self.emotional_states.insert(idx, state.emotional_state)
+        self.emotion_categories.insert(
+            idx, _categorize_emotion(state.emotional_state) if state.emotional_state else None
+        )
+
+        abilities_str = ", ".join(state.abilities) if state.abilities else "-"
+        attrs_str = ", ".join(f"{k}={v}" for k, v in itertools.islice(state.attributes.items(), 3))
+        if not attrs_str:
+            attrs_str = "-"
+
+        self.rows_md.insert(
+            idx,
+            f"| {state.scene_id} | {state.story_phase} | "
+            f"{state.emotional_state or '-'} | {abilities_str} | {attrs_str} |"
+        )
+
+
+@dataclass
+class RelationshipColumns:
+    """Column-wise mirror of one relationship timeline (see CharacterColumns)."""
+
+    scene_ids: List[str] = field(default_factory=list)
+    trust_levels: List[str] = field(default_factory=list)
+    trust_vals: List[int] = field(default_factory=list)
+    rows_md: List[str] = field(default_factory=list)  # pre-rendered timeline table rows
+    signature: int = 0  # rolling hash of every inserted state
+
+    def insert(self, idx: int, state: RelationshipState):
+        """Insert a state's columns at timeline position idx."""
+        self.signature = _mix_signature(
+            self.signature, (idx, state.scene_id, state.trust_level)
+        )
+        self.scene_ids.insert(idx, state.scene_id)
+        self.trust_levels.insert(idx, state.trust_level)
+        self.trust_vals.insert(idx, _TRUST_LEVELS.get(state.trust_level.lower(), -1))
+        self.rows_md.insert(
+            idx,
+            f"| {state.scene_id} | {state.story_phase} | "
+            f"{state.relationship_type} | {state.dynamic} | "
+            f"{state.trust_level} | {state.notes[:50] if state.notes else '-'} |"
+        )
+
+
+@njit(cache=True)
+def _find_jumps(vals, max_step, start):
+    """Indices i >= start where vals[i] rises more than max_step over vals[i-1]."""
+    out = []
+    for i in range(start, len(vals)):
+        if vals[i] > vals[i-1] + max_step:
+            out.append(i)
+    return out
+
+
+@njit(cache=True)
+def _find_drops(vals, start):
+    """Indices i >= start where vals[i] falls below vals[i-1]."""
+    out = []
+    for i in range(start, len(vals)):
+        if vals[i] < vals[i-1]:
+            out.append(i)
+    return out
+
+
+def _ordinal_array(values: List[int]):
+    """Prepare an ordinal column for the scan kernels (int8 array under Numba)."""
+    if NUMBA_AVAILABLE:
+        return np.asarray(values, dtype=np.int8)
+    return values
+
+
+@dataclass
+class _CharacterCheckProgress:
+    """Issues found so far for a character plus the rolling state to resume from."""
+
+    checked: int = 0  # number of timeline states already examined
+    signature: Optional[int] = None  # timeline signature when issues was built
+    issues: List[ConsistencyIssue] = field(default_factory=list)
+    attribute_issues: List[ConsistencyIssue] = field(default_factory=list)
+    ability_issues: List[ConsistencyIssue] = field(default_factory=list)
+    emotional_issues: List[ConsistencyIssue] = field(default_factory=list)
+    prev_scene: Optional[str] = None
+    prev_abilities: Optional[FrozenSet[str]] = None
+    prev_attr: Optional[tuple] = None     # (scene_id, value, ordinal) of last state carrying the attribute
+    prev_emotion: Optional[tuple] = None  # (scene_id, category, emotional_state)
+
+
+@dataclass
+class _RelationshipCheckProgress:
+    """Issues found so far for a relationship (see _CharacterCheckProgress)."""
+
+    checked: int = 0
+    signature: Optional[int] = None
+    issues: List[ConsistencyIssue] = field(default_factory=list)
+    intimacy_issues: List[ConsistencyIssue] = field(default_factory=list)
+    trust_issues: List[ConsistencyIssue] = field(default_factory=list)
+
+
+def _check_sobriety_step(character_name: str, prev: Tuple[str, int, int],
+                         curr: Tuple[str, int, int]) -> Optional[ConsistencyIssue]:
+    """Check for illogical sobriety counts (recovery then regression without cause)."""
+    prev_scene, prev_days, _ = prev
+    curr_scene, curr_days, _ = curr
+
+    # If sobriety count decreased without reset to 0, that's suspicious
+    if curr_days < prev_days and curr_days > 0:
+        return ConsistencyIssue(
+            category=IssueCategory.CHARACTER_STATE,
+            severity=IssueSeverity.MODERATE,
+            description=f"{character_name} Sobriety Count Inconsistency",
+            scenes_affected=[prev_scene, curr_scene],
+            problem_details_fmt="Scene {} shows {} days sober, "
+                                "but later scene {} shows {} days sober. "
+                                "Regression without narrative cause (expected reset to 0 or progression).",
+            problem_details_args=(prev_scene, prev_days, curr_scene, curr_days),
+            recommendation=f"Verify timeline: either fix sobriety count progression or "
+                          f"add relapse scene between {prev_scene} and {curr_scene}"
+        )
+    return None
+
+
+def _check_resonance_step(character_name: str, prev: Tuple[str, str, int],
+                          curr: Tuple[str, str, int]) -> Optional[ConsistencyIssue]:
+    """Check for sudden ability jumps in morphic resonance range."""
+    prev_scene, prev_range, prev_val = prev
+    curr_scene, curr_range, curr_val = curr
+
+    # Flag if ability jumps more than 1 level suddenly
+    if curr_val > prev_val + 1:
+        return ConsistencyIssue(
+            category=IssueCategory.CHARACTER_STATE,
+            severity=IssueSeverity.MODERATE,
+            description=f"{character_name} Ability Jump Without Progression",
+            scenes_affected=[prev_scene, curr_scene],
+            problem_details_fmt="Scene {} shows morphic resonance range '{}', "
+                                "but scene {} shows '{}'. "
+                                "This is a significant jump that may need justification.",
+            problem_details_args=(prev_scene, prev_range, curr_scene, curr_range),
+            recommendation=f"Verify ability progression is earned/explained, or add intermediate "
+                          f"scene showing growth between {prev_scene} and {curr_scene}"
+        )
+    return None
+
+
+# Character-specific attribute checks (Mickey: addiction, Noni: abilities).
+# Maps character name → (raw value column, ordinal column, per-pair check).
+_ATTR_CHECKERS = {
+    "Mickey Bardot": ('sobriety', 'sobriety', _check_sobriety_step),
+    "Noni": ('resonance', 'resonance_vals', _check_resonance_step),
+}
+
+
 class CharacterStateTracker:
     """
     Tracks character states across scenes to detect evolution inconsistencies.
@@ -33,8 +327,23 @@ class CharacterStateTracker:
         self.character_timeline: Dict[str, List[CharacterState]] = defaultdict(list)
         self.relationship_timeline: Dict[str, List[RelationshipState]] = defaultdict(list)
 
-        # Known characters (Volume 1 focus)
-        self.known_characters = [
+        # Sort keys parallel to each timeline, kept in order for bisect insertion
+        self._char_keys: Dict[str, List[Tuple[int, ...]]] = defaultdict(list)
+        self._rel_keys: Dict[str, List[Tuple[int, ...]]] = defaultdict(list)
+
+        # Columnar mirror of character_timeline used by consistency checks
+        self._char_columns: Dict[str, CharacterColumns] = defaultdict(CharacterColumns)
+        self._rel_columns: Dict[str, RelationshipColumns] = defaultdict(RelationshipColumns)
+
+        # Incremental check progress: only states added after the last check
+        # are examined; an out-of-order insert before that point resets it
+        self._char_progress: Dict[str, _CharacterCheckProgress] = {}
+        self._rel_progress: Dict[str, Dict[Tuple[str, str], _RelationshipCheckProgress]] = {}
+
+        # Known characters (Volume 1 focus). A tuple, not a frozenset: callers
+        # iterate it to order timelines and issues in reports, and set order
+        # would vary with the string hash seed from run to run
+        self.known_characters = (
             "Mickey Bardot",
             "Noni",
             "Sadie",
@@ -42,7 +351,7 @@ class CharacterStateTracker:
             "Ken",
             "Jillian",
             "Vance"
-        ]
+        )
 
     def add_character_state(self, state: CharacterState):
         """
@@ -51,12 +360,21 @@ class CharacterStateTracker:
         Args:
             state: CharacterState for a specific scene
         """
-        self.character_timeline[state.character_name].append(state)
-
-        # Sort by scene ID (assumes format like "1.3.2")
-        self.character_timeline[state.character_name].sort(
-            key=lambda s: self._scene_sort_key(s.scene_id)
-        )
+        state.character_name = name = _intern(state.character_name)
+        state.scene_id = _intern(state.scene_id)
+
+        # Insert in scene order (assumes format like "1.3.2"); bisect_right keeps
+        # states with equal scene IDs in insertion order, matching a stable sort
+        sort_key = _scene_sort_key(state.scene_id)
+        keys = self._char_keys[name]
+        idx = bisect.bisect_right(keys, sort_key)
+        keys.insert(idx, sort_key)
+        self.character_timeline[name].insert(idx, state)
+        self._char_columns[name].insert(idx, state)
+
+        progress = self._char_progress.get(name)
+        if progress is not None and idx < progress.checked:
+            del self._char_progress[name]
 
     def add_relationship_state(self, state: RelationshipState):
         """
@@ -65,28 +383,26 @@ class CharacterStateTracker:
         Args:
             state: RelationshipState for a specific scene
         """
-        key = state.relationship_key
-        self.relationship_timeline[key].append(state)
-
-        # Sort by scene ID
-        self.relationship_timeline[key].sort(
-            key=lambda s: self._scene_sort_key(s.scene_id)
-        )
-
-    def _scene_sort_key(self, scene_id: str) -> Tuple[int, ...]:
-        """
-        Convert scene ID to sortable tuple.
-
-        Examples:
-            "1.3.2" → (1, 3, 2)
-            "1.15.1" → (1, 15, 1)
-            "test-1" → (0, 0, 0)
-        """
-        try:
-            parts = scene_id.split('.')
-            return tuple(int(p) for p in parts)
-        except (ValueError, AttributeError):
-            return (0, 0, 0)
+        state.character_a = _intern(state.character_a)
+        state.character_b = _intern(state.character_b)
+        state.scene_id = _intern(state.scene_id)
+        state.relationship_type = _intern(state.relationship_type)
+        state.dynamic = _intern(state.dynamic)
+        state.trust_level = _intern(state.trust_level)
+
+        key = _relationship_key(state.character_a, state.character_b)
+
+        # Insert in scene order
+        sort_key = _scene_sort_key(state.scene_id)
+        keys = self._rel_keys[key]
+        idx = bisect.bisect_right(keys, sort_key)
+        keys.insert(idx, sort_key)
+        self.relationship_timeline[key].insert(idx, state)
+        self._rel_columns[key].insert(idx, state)
+
+        for pair, progress in list(self._rel_progress.get(key, {}).items()):
+            if idx < progress.checked:
+                del self._rel_progress[key][pair]
 
     def get_character_timeline(self, character_name: str) -> List[CharacterState]:
         """Get chronological timeline for a character."""
@@ -94,196 +410,139 @@ class CharacterStateTracker:
 
     def get_relationship_timeline(self, char_a: str, char_b: str) -> List[RelationshipState]:
         """Get chronological timeline for a relationship."""
-        chars = sorted([char_a, char_b])
-        key = f"{chars[0]} ↔ {chars[1]}"
-        return self.relationship_timeline.get(key, [])
+        return self.relationship_timeline.get(_relationship_key(char_a, char_b), [])
 
     def check_character_consistency(self, character_name: str) -> List[ConsistencyIssue]:
         """
         Check a character's timeline for inconsistencies.
 
+        Attribute progression, ability loss and psychological coherence are
+        checked in a single pass over the character's timeline columns,
+        carrying the last value seen for each check. The pass resumes where
+        the previous check stopped, so repeated checks only examine newly
+        added states.
+
         Args:
             character_name: Character to check
 
         Returns:
             List of consistency issues found
         """
-        issues = []
-        timeline = self.get_character_timeline(character_name)
-
-        if len(timeline) < 2:
-            return issues  # Need at least 2 states to compare
-
-        # Check for attribute inconsistencies
-        issues.extend(self._check_attribute_progression(character_name, timeline))
-
-        # Check for ability inconsistencies
-        issues.extend(self._check_ability_consistency(character_name, timeline))
-
-        # Check for psychological regression without cause
-        issues.extend(self._check_psychological_coherence(character_name, timeline))
-
-        return issues
-
-    def _check_attribute_progression(self, character_name: str,
-                                    timeline: List[CharacterState]) -> List[ConsistencyIssue]:
-        """Check for illogical attribute changes (e.g., addiction recovery then relapse without cause)."""
-        issues = []
-
-        # Mickey-specific: Addiction tracking
-        if character_name == "Mickey Bardot":
-            sobriety_timeline = []
-
-            for state in timeline:
-                if 'sobriety_days' in state.attributes:
-                    sobriety_timeline.append((
-                        state.scene_id,
-                        state.attributes['sobriety_days']
-                    ))
-
-            # Check for illogical sobriety counts
-            for i in range(1, len(sobriety_timeline)):
-                prev_scene, prev_days = sobriety_timeline[i-1]
-                curr_scene, curr_days = sobriety_timeline[i]
-
-                # If sobriety count decreased without reset to 0, that's suspicious
-                if curr_days < prev_days and curr_days > 0:
-                    issues.append(ConsistencyIssue(
-                        category=IssueCategory.CHARACTER_STATE,
-                        severity=IssueSeverity.MODERATE,
-                        description=f"{character_name} Sobriety Count Inconsistency",
-                        scenes_affected=[prev_scene, curr_scene],
-                        problem_details=f"Scene {prev_scene} shows {prev_days} days sober, "
-                                       f"but later scene {curr_scene} shows {curr_days} days sober. "
-                                       f"Regression without narrative cause (expected reset to 0 or progression).",
-                        recommendation=f"Verify timeline: either fix sobriety count progression or "
-                                      f"add relapse scene between {prev_scene} and {curr_scene}"
-                    ))
-
-        # Noni-specific: Ability progression checks
-        elif character_name == "Noni":
-            ability_timeline = []
-
-            for state in timeline:
-                if 'morphic_resonance_range' in state.attributes:
-                    ability_timeline.append((
-                        state.scene_id,
-                        state.attributes['morphic_resonance_range'],
-                        state.story_phase
-                    ))
-
-            # Check for sudden ability jumps
-            for i in range(1, len(ability_timeline)):
-                prev_scene, prev_range, prev_phase = ability_timeline[i-1]
-                curr_scene, curr_range, curr_phase = ability_timeline[i]
-
-                # Convert range strings to numeric values for comparison
-                range_values = {
-                    "touch": 0,
-                    "close": 1,
-                    "medium": 2,
-                    "far": 3
-                }
-
-                prev_val = range_values.get(prev_range, -1)
-                curr_val = range_values.get(curr_range, -1)
-
-                # Flag if ability jumps more than 1 level suddenly
-                if curr_val > prev_val + 1:
-                    issues.append(ConsistencyIssue(
-                        category=IssueCategory.CHARACTER_STATE,
-                        severity=IssueSeverity.MODERATE,
-                        description=f"{character_name} Ability Jump Without Progression",
-                        scenes_affected=[prev_scene, curr_scene],
-                        problem_details=f"Scene {prev_scene} shows morphic resonance range '{prev_range}', "
-                                       f"but scene {curr_scene} shows '{curr_range}'. "
-                                       f"This is a significant jump that may need justification.",
-                        recommendation=f"Verify ability progression is earned/explained, or add intermediate "
-                                      f"scene showing growth between {prev_scene} and {curr_scene}"
-                    ))
-
-        return issues
-
-    def _check_ability_consistency(self, character_name: str,
-                                   timeline: List[CharacterState]) -> List[ConsistencyIssue]:
-        """Check for characters losing abilities without explanation."""
-        issues = []
-
-        # Track which abilities appear in each scene
-        ability_history = []
-
-        for state in timeline:
-            ability_history.append((state.scene_id, set(state.abilities)))
-
-        # Check for lost abilities
-        for i in range(1, len(ability_history)):
-            prev_scene, prev_abilities = ability_history[i-1]
-            curr_scene, curr_abilities = ability_history[i]
-
-            lost_abilities = prev_abilities - curr_abilities
-
-            if lost_abilities:
-                issues.append(ConsistencyIssue(
-                    category=IssueCategory.CHARACTER_STATE,
-                    severity=IssueSeverity.MODERATE,
-                    description=f"{character_name} Lost Abilities Without Explanation",
-                    scenes_affected=[prev_scene, curr_scene],
-                    problem_details=f"Scene {prev_scene} shows abilities: {list(lost_abilities)}, "
-                                   f"but these are missing in later scene {curr_scene} without explanation.",
-                    recommendation=f"Verify if {character_name} should still have these abilities in {curr_scene}, "
-                                  f"or add narrative explanation for why abilities were lost"
-                ))
-
-        return issues
-
-    def _check_psychological_coherence(self, character_name: str,
-                                      timeline: List[CharacterState]) -> List[ConsistencyIssue]:
-        """Check for sudden psychological shifts without cause."""
-        issues = []
+        cols = self._char_columns.get(character_name)
+
+        if cols is None or len(cols.scene_ids) < 2:
+            return []  # Need at least 2 states to compare
+
+        progress = self._char_progress.get(character_name)
+        if progress is None:
+            progress = self._char_progress[character_name] = _CharacterCheckProgress()
+        elif progress.signature == cols.signature:
+            return list(progress.issues)  # Timeline unchanged since last check
+
+        # Character-specific attribute check, if any. Checks compare ordinal
+        # values; messages use the raw values
+        attr_values = None
+        attr_ordinals = None
+        attr_check = None
+        attr_spec = _ATTR_CHECKERS.get(character_name)
+        if attr_spec is not None:
+            values_column, ordinals_column, attr_check = attr_spec
+            attr_values = getattr(cols, values_column)
+            attr_ordinals = getattr(cols, ordinals_column)
+
+        prev_scene = progress.prev_scene
+        prev_abilities = progress.prev_abilities
+        prev_attr = progress.prev_attr
+        prev_emotion = progress.prev_emotion
+
+        for i in range(progress.checked, len(cols.scene_ids)):
+            scene_id = cols.scene_ids[i]
+            abilities = cols.abilities[i]
+            emotional_state = cols.emotional_states[i]
+
+            if attr_values is not None and attr_values[i] is not _MISSING:
+                curr_attr = (scene_id, attr_values[i], attr_ordinals[i])
+                if prev_attr is not None:
+                    issue = attr_check(character_name, prev_attr, curr_attr)
+                    if issue:
+                        progress.attribute_issues.append(issue)
+                prev_attr = curr_attr
+
+            if prev_scene is not None:
+                issue = self._check_ability_step(
+                    character_name, (prev_scene, prev_abilities), (scene_id, abilities)
+                )
+                if issue:
+                    progress.ability_issues.append(issue)
+
+            if emotional_state:
+                curr_emotion = (scene_id, cols.emotion_categories[i], emotional_state)
+                if prev_emotion is not None:
+                    issue = self._check_emotion_step(character_name, prev_emotion, curr_emotion)
+                    if issue:
+                        progress.emotional_issues.append(issue)
+                prev_emotion = curr_emotion
+
+            prev_scene = scene_id
+            prev_abilities = abilities
+
+        progress.checked = len(cols.scene_ids)
+        progress.prev_scene = prev_scene
+        progress.prev_abilities = prev_abilities
+        progress.prev_attr = prev_attr
+        progress.prev_emotion = prev_emotion
+
+        # Per-check issue lists keep the report grouped by check type
+        progress.signature = cols.signature
+        progress.issues = (
+            progress.attribute_issues + progress.ability_issues + progress.emotional_issues
+        )
+        return list(progress.issues)
+
+    def _check_ability_step(self, character_name: str, prev: Tuple[str, FrozenSet[str]],
+                            curr: Tuple[str, FrozenSet[str]]) -> Optional[ConsistencyIssue]:
+        """Check for a character losing abilities without explanation."""
+        prev_scene, prev_abilities = prev
+        curr_scene, curr_abilities = curr
+
+        lost_abilities = prev_abilities - curr_abilities
+
+        if lost_abilities:
+            return ConsistencyIssue(
+                category=IssueCategory.CHARACTER_STATE,
+                severity=IssueSeverity.MODERATE,
+                description=f"{character_name} Lost Abilities Without Explanation",
+                scenes_affected=[prev_scene, curr_scene],
+                problem_details_fmt="Scene {} shows abilities: {}, "
+                                    "but these are missing in later scene {} without explanation.",
+                problem_details_args=(prev_scene, list(lost_abilities), curr_scene),
+                recommendation=f"Verify if {character_name} should still have these abilities in {curr_scene}, "
+                              f"or add narrative explanation for why abilities were lost"
+            )
+        return None
 
-        # This is more heuristic - flag major emotional state changes
-        emotional_keywords = {
-            'positive': ['hopeful', 'optimistic', 'happy', 'content', 'peaceful'],
-            'negative': ['desperate', 'hopeless', 'depressed', 'cynical', 'angry'],
-            'neutral': ['focused', 'analytical', 'calm', 'professional']
-        }
-
-        def categorize_emotion(emotional_state: str) -> str:
-            """Categorize emotional state."""
-            state_lower = emotional_state.lower()
-            for category, keywords in emotional_keywords.items():
-                if any(kw in state_lower for kw in keywords):
-                    return category
-            return 'unknown'
-
-        emotional_timeline = []
-        for state in timeline:
-            if state.emotional_state:
-                category = categorize_emotion(state.emotional_state)
-                emotional_timeline.append((state.scene_id, category, state.emotional_state))
+    def _check_emotion_step(self, character_name: str, prev: Tuple[str, str, str],
+                            curr: Tuple[str, str, str]) -> Optional[ConsistencyIssue]:
+        """Check for a sudden psychological shift without cause."""
+        prev_scene, prev_category, prev_state = prev
+        curr_scene, curr_category, curr_state = curr
 
         # Flag sudden positive to negative or vice versa without intermediate
-        for i in range(1, len(emotional_timeline)):
-            prev_scene, prev_category, prev_state = emotional_timeline[i-1]
-            curr_scene, curr_category, curr_state = emotional_timeline[i]
-
-            # Check for dramatic shift
-            if (prev_category == 'positive' and curr_category == 'negative') or \
-               (prev_category == 'negative' and curr_category == 'positive'):
-
-                issues.append(ConsistencyIssue(
-                    category=IssueCategory.CHARACTER_STATE,
-                    severity=IssueSeverity.MINOR,
-                    description=f"{character_name} Sudden Emotional Shift",
-                    scenes_affected=[prev_scene, curr_scene],
-                    problem_details=f"Scene {prev_scene} shows {character_name} as '{prev_state}', "
-                                   f"but scene {curr_scene} shows '{curr_state}'. "
-                                   f"Verify this dramatic shift is narratively justified.",
-                    recommendation=f"Review emotional progression between {prev_scene} and {curr_scene} "
-                                  f"to ensure shift is earned/explained"
-                ))
-
-        return issues
+        if (prev_category == 'positive' and curr_category == 'negative') or \
+           (prev_category == 'negative' and curr_category == 'positive'):
+            return ConsistencyIssue(
+                category=IssueCategory.CHARACTER_STATE,
+                severity=IssueSeverity.MINOR,
+                description=f"{character_name} Sudden Emotional Shift",
+                scenes_affected=[prev_scene, curr_scene],
+                problem_details_fmt="Scene {} shows {} as '{}', "
+                                    "but scene {} shows '{}'. "
+                                    "Verify this dramatic shift is narratively justified.",
+                problem_details_args=(prev_scene, character_name, prev_state, curr_scene, curr_state),
+                recommendation=f"Review emotional progression between {prev_scene} and {curr_scene} "
+                              f"to ensure shift is earned/explained"
+            )
+        return None
 
     def check_relationship_consistency(self, char_a: str, char_b: str) -> List[ConsistencyIssue]:
         """
@@ -296,141 +555,188 @@ class CharacterStateTracker:
         Returns:
             List of consistency issues found
         """
-        issues = []
-        timeline = self.get_relationship_timeline(char_a, char_b)
+        key = _relationship_key(char_a, char_b)
+        cols = self._rel_columns.get(key)
 
-        if len(timeline) < 2:
-            return issues
+        if cols is None or len(cols.scene_ids) < 2:
+            return []
+
+        # Issue text names the characters in call order, so track per pair
+        pair_progress = self._rel_progress.setdefault(key, {})
+        progress = pair_progress.get((char_a, char_b))
+        if progress is None:
+            progress = pair_progress[(char_a, char_b)] = _RelationshipCheckProgress()
+        elif progress.signature == cols.signature:
+            return list(progress.issues)  # Timeline unchanged since last check
+
+        # Only pairs ending at a state added since the last check are new
+        start = max(1, progress.checked)
 
         # Check for sudden intimacy jumps
-        issues.extend(self._check_intimacy_progression(char_a, char_b, timeline))
+        progress.intimacy_issues.extend(
+            self._check_intimacy_progression(char_a, char_b, cols, start)
+        )
 
         # Check for trust level reversals
-        issues.extend(self._check_trust_consistency(char_a, char_b, timeline))
+        progress.trust_issues.extend(
+            self._check_trust_consistency(char_a, char_b, cols, start)
+        )
 
-        return issues
+        progress.checked = len(cols.scene_ids)
+        progress.signature = cols.signature
+        progress.issues = progress.intimacy_issues + progress.trust_issues
+        return list(progress.issues)
 
     def _check_intimacy_progression(self, char_a: str, char_b: str,
-                                   timeline: List[RelationshipState]) -> List[ConsistencyIssue]:
+                                   cols: RelationshipColumns,
+                                   start: int = 1) -> List[ConsistencyIssue]:
         """Check for sudden relationship intimacy changes."""
         issues = []
-
-        # Track trust level progression
-        trust_levels = {
-            'none': 0,
-            'low': 1,
-            'medium': 2,
-            'high': 3,
-            'complete': 4
-        }
-
-        trust_timeline = []
-        for state in timeline:
-            trust_val = trust_levels.get(state.trust_level.lower(), -1)
-            trust_timeline.append((state.scene_id, trust_val, state.trust_level))
+        scene_ids, trust_vals, trust_levels = cols.scene_ids, cols.trust_vals, cols.trust_levels
 
         # Flag sudden trust jumps (more than 1 level)
-        for i in range(1, len(trust_timeline)):
-            prev_scene, prev_val, prev_trust = trust_timeline[i-1]
-            curr_scene, curr_val, curr_trust = trust_timeline[i]
-
-            if curr_val > prev_val + 1:
-                issues.append(ConsistencyIssue(
-                    category=IssueCategory.RELATIONSHIP,
-                    severity=IssueSeverity.MODERATE,
-                    description=f"{char_a}/{char_b} Sudden Intimacy Jump",
-                    scenes_affected=[prev_scene, curr_scene],
-                    problem_details=f"Scene {prev_scene} shows trust level '{prev_trust}', "
-                                   f"but scene {curr_scene} shows '{curr_trust}'. "
-                                   f"This jump may need intermediate development.",
-                    recommendation=f"Add scene(s) showing relationship development between "
-                                  f"{prev_scene} and {curr_scene}, or reduce trust level in {curr_scene}"
-                ))
+        for i in _find_jumps(_ordinal_array(trust_vals), 1, start):
+            prev_scene, curr_scene = scene_ids[i-1], scene_ids[i]
+            issues.append(ConsistencyIssue(
+                category=IssueCategory.RELATIONSHIP,
+                severity=IssueSeverity.MODERATE,
+                description=f"{char_a}/{char_b} Sudden Intimacy Jump",
+                scenes_affected=[prev_scene, curr_scene],
+                problem_details_fmt="Scene {} shows trust level '{}', "
+                                    "but scene {} shows '{}'. "
+                                    "This jump may need intermediate development.",
+                problem_details_args=(prev_scene, trust_levels[i-1], curr_scene, trust_levels[i]),
+                recommendation=f"Add scene(s) showing relationship development between "
+                              f"{prev_scene} and {curr_scene}, or reduce trust level in {curr_scene}"
+            ))
 
         return issues
 
     def _check_trust_consistency(self, char_a: str, char_b: str,
-                                timeline: List[RelationshipState]) -> List[ConsistencyIssue]:
+                                cols: RelationshipColumns,
+                                start: int = 1) -> List[ConsistencyIssue]:
         """Check for trust reversals without cause."""
         issues = []
+        scene_ids, trust_vals, trust_levels = cols.scene_ids, cols.trust_vals, cols.trust_levels
 
         # Flag any trust level decreases (should have narrative cause)
-        trust_levels = {
-            'none': 0,
-            'low': 1,
-            'medium': 2,
-            'high': 3,
-            'complete': 4
-        }
-
-        for i in range(1, len(timeline)):
-            prev = timeline[i-1]
-            curr = timeline[i]
-
-            prev_val = trust_levels.get(prev.trust_level.lower(), -1)
-            curr_val = trust_levels.get(curr.trust_level.lower(), -1)
-
-            # Trust decrease should be noted
-            if curr_val < prev_val:
-                issues.append(ConsistencyIssue(
-                    category=IssueCategory.RELATIONSHIP,
-                    severity=IssueSeverity.MINOR,
-                    description=f"{char_a}/{char_b} Trust Reversal",
-                    scenes_affected=[prev.scene_id, curr.scene_id],
-                    problem_details=f"Trust decreased from '{prev.trust_level}' to '{curr.trust_level}'. "
-                                   f"Verify this is intentional and has narrative cause.",
-                    recommendation=f"Review scenes between {prev.scene_id} and {curr.scene_id} "
-                                  f"to ensure trust decrease is justified"
-                ))
+        for i in _find_drops(_ordinal_array(trust_vals), start):
+            prev_scene, curr_scene = scene_ids[i-1], scene_ids[i]
+            issues.append(ConsistencyIssue(
+                category=IssueCategory.RELATIONSHIP,
+                severity=IssueSeverity.MINOR,
+                description=f"{char_a}/{char_b} Trust Reversal",
+                scenes_affected=[prev_scene, curr_scene],
+                problem_details_fmt="Trust decreased from '{}' to '{}'. "
+                                    "Verify this is intentional and has narrative cause.",
+                problem_details_args=(trust_levels[i-1], trust_levels[i]),
+                recommendation=f"Review scenes between {prev_scene} and {curr_scene} "
+                              f"to ensure trust decrease is justified"
+            ))
 
         return issues
 
+    def check_all(self,
+                  characters: Optional[List[str]] = None,
+                  relationships: Optional[List[Tuple[str, str]]] = None,
+                  max_workers: Optional[int] = None) -> List[ConsistencyIssue]:
+        """
+        Check many character and relationship timelines in parallel.
+
+        Each check is independent, CPU-bound Python work, so checks are fanned
+        out across worker processes. The tracker is pickled once per worker.
+
+        Args:
+            characters: Characters to check (defaults to known_characters)
+            relationships: (char_a, char_b) pairs to check (defaults to every
+                tracked relationship)
+            max_workers: Worker process count (1 runs everything in-process;
+                None uses a pool only for at least PARALLEL_CHECK_MIN_STATES
+                timeline states)
+
+        Returns:
+            Character issues followed by relationship issues, in argument order
+        """
+        if characters is None:
+            characters = self.known_characters
+        if relationships is None:
+            relationships = [tuple(key.split(" ↔ ", 1)) for key in self.relationship_timeline]
+
+        if max_workers is None:
+            # Starting a process pool costs tens of milliseconds; below this
+            # many timeline states the checks finish sooner in-process
+            total_states = sum(len(cols.scene_ids) for cols in (
+                [self._char_columns.get(name) for name in characters]
+                + [self._rel_columns.get(_relationship_key(a, b)) for a, b in relationships]
+            ) if cols is not None)
+            if total_states < PARALLEL_CHECK_MIN_STATES:
+                max_workers = 1
+
+        if max_workers == 1 or len(characters) + len(relationships) < 2:
+            results = [self.check_character_consistency(name) for name in characters]
+            results += [self.check_relationship_consistency(a, b) for a, b in relationships]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     initializer=_init_check_worker,
+                                     initargs=(self,)) as executor:
+                futures = [executor.submit(_check_character_worker, name) for name in characters]
+                futures += [executor.submit(_check_relationship_worker, a, b)
+                            for a, b in relationships]
+                results = [future.result() for future in futures]
+
+        issues = []
+        for result in results:
+            issues.extend(result)
+        return issues
+
     def generate_character_timeline_markdown(self, character_name: str) -> str:
         """Generate markdown table of character state timeline."""
-        timeline = self.get_character_timeline(character_name)
+        cols = self._char_columns.get(character_name)
 
-        if not timeline:
+        if cols is None or not cols.rows_md:
             return f"No timeline data for {character_name}"
 
-        lines = [
-            f"### {character_name} Timeline",
-            "",
-            "| Scene | Phase | Emotional State | Abilities | Key Attributes |",
-            "|-------|-------|-----------------|-----------|----------------|"
-        ]
-
-        for state in timeline:
-            abilities_str = ", ".join(state.abilities) if state.abilities else "-"
-            attrs_str = ", ".join(f"{k}={v}" for k, v in list(state.attributes.items())[:3])
-            if not attrs_str:
-                attrs_str = "-"
-
-            lines.append(
-                f"| {state.scene_id} | {state.story_phase} | "
-                f"{state.emotional_state or '-'} | {abilities_str} | {attrs_str} |"
-            )
-
-        return '\n'.join(lines)
+        # Rows are rendered once at ingest (see CharacterColumns.insert)
+        header = (
+            f"### {character_name} Timeline\n"
+            "\n"
+            "| Scene | Phase | Emotional State | Abilities | Key Attributes |\n"
+            "|-------|-------|-----------------|-----------|----------------|\n"
+        )
+        return header + '\n'.join(cols.rows_md)
 
     def generate_relationship_timeline_markdown(self, char_a: str, char_b: str) -> str:
         """Generate markdown table of relationship timeline."""
-        timeline = self.get_relationship_timeline(char_a, char_b)
+        cols = self._rel_columns.get(_relationship_key(char_a, char_b))
 
-        if not timeline:
+        if cols is None or not cols.rows_md:
             return f"No timeline data for {char_a} ↔ {char_b}"
 
-        lines = [
-            f"### {char_a} ↔ {char_b} Relationship Timeline",
-            "",
-            "| Scene | Phase | Type | Dynamic | Trust Level | Notes |",
-            "|-------|-------|------|---------|-------------|-------|"
-        ]
-
-        for state in timeline:
-            lines.append(
-                f"| {state.scene_id} | {state.story_phase} | "
-                f"{state.relationship_type} | {state.dynamic} | "
-                f"{state.trust_level} | {state.notes[:50] if state.notes else '-'} |"
-            )
+        # Rows are rendered once at ingest (see RelationshipColumns.insert)
+        header = (
+            f"### {char_a} ↔ {char_b} Relationship Timeline\n"
+            "\n"
+            "| Scene | Phase | Type | Dynamic | Trust Level | Notes |\n"
+            "|-------|-------|------|---------|-------------|-------|\n"
+        )
+        return header + '\n'.join(cols.rows_md)
+
+
+# Tracker shared by check_all worker processes (set once per worker)
+_worker_tracker: Optional[CharacterStateTracker] = None
+
+
+def _init_check_worker(tracker: CharacterStateTracker):
+    """Install the pickled tracker in a check_all worker process."""
+    global _worker_tracker
+    _worker_tracker = tracker
+
+
+def _check_character_worker(character_name: str) -> List[ConsistencyIssue]:
+    """Run a character consistency check in a check_all worker."""
+    return _worker_tracker.check_character_consistency(character_name)
+
 
-        return '\n'.join(lines)
+def _check_relationship_worker(char_a: str, char_b: str) -> List[ConsistencyIssue]:
+    """Run a relationship consistency check in a check_all worker."""
+    return _worker_tracker.check_relationship_consistency(char_a, char_b)
@@ -4,10 +4,36 @@ Data models for consistency checking.
 Defines structured reports for consistency analysis results.
 """
 
+import codecs
+import json
+import sys
+from bisect import bisect_right
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import Any, BinaryIO, ClassVar, Iterable, Iterator, List, Dict, Optional
 from enum import Enum
+from functools import lru_cache
 from datetime import datetime
+from itertools import chain, islice
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Numba JIT for volume score aggregation (optional, pip install numba)
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator when Numba is not installed."""
+        def decorator(func):
+            return func
+        return decorator
 
 
 class IssueSeverity(Enum):
@@ -16,6 +42,10 @@ class IssueSeverity(Enum):
     MODERATE = "moderate"  # Should fix, impacts quality
     MINOR = "minor"        # Nice to fix, minor polish
 
+    def __init__(self, value: str):
+        # Display form used in reports, computed once per member
+        self.label = value.upper()
+
 
 class IssueCategory(Enum):
     """Categories of consistency issues."""
@@ -27,20 +57,144 @@ class IssueCategory(Enum):
     VOICE = "voice"
     MECHANICS = "mechanics"
 
-
-@dataclass
+    def __init__(self, value: str):
+        # Display form used in reports, computed once per member
+        self.display = value.replace('_', ' ').title()
+
+
+# Constant markdown blocks for VolumeConsistencyReport.to_markdown; each is
+# appended as a single entry of the '\n'-joined line list
+_CRITICAL_SECTION = (
+    "## Critical Issues (Must Fix)\n\n"
+    "*These issues must be resolved before publication.*\n"
+)
+_MODERATE_SECTION = (
+    "## Moderate Issues (Should Fix)\n\n"
+    "*These issues impact quality and should be addressed.*\n"
+)
+_MINOR_SECTION = (
+    "## Minor Issues (Nice to Fix)\n\n"
+    "*These are polish items that can be addressed as time permits.*\n"
+)
+_EMPTY_CRITICAL = "✅ No critical issues found!"
+_EMPTY_MODERATE = "✅ No moderate issues found!"
+_EMPTY_MINOR = "✅ No minor issues found!"
+_IMMEDIATE_HEADING = "### Immediate (Critical):"
+_SHORT_TERM_HEADING = "\n### Short-term (Moderate):"
+_LONG_TERM_HEADING = "\n### Long-term (Minor):"
+_RECOMMENDATIONS_HEADER = "## Recommendations by Priority\n"
+_CLEAN_RECOMMENDATIONS = "\n".join([
+    _RECOMMENDATIONS_HEADER,
+    _IMMEDIATE_HEADING, _EMPTY_CRITICAL,
+    _SHORT_TERM_HEADING, _EMPTY_MODERATE,
+    _LONG_TERM_HEADING, _EMPTY_MINOR,
+])
+_FILES_SECTION = "\n## Files to Review\n\nPriority order for manual review:\n"
+
+# Letter grades: a score >= _GRADE_CUTOFFS[i] earns at least _GRADES[i + 1]
+_GRADE_CUTOFFS = (70, 73, 77, 80, 83, 87, 90, 95)
+_GRADES = ('F', 'C', 'C+', 'B-', 'B', 'B+', 'A-', 'A', 'A+')
+
+
+def _intern(value):
+    """Intern a string field (scene IDs, names, paths repeat heavily)."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _to_dicts(items: List[Any]) -> List[Dict]:
+    """to_dict() every item into a list allocated once at its final size."""
+    out = [None] * len(items)
+    for i, item in enumerate(items):
+        out[i] = item.to_dict()
+    return out
+
+
+@lru_cache(maxsize=1024)
+def _relationship_key(char_a: str, char_b: str) -> str:
+    """Canonical relationship key: both names in alphabetical order."""
+    lo, hi = (char_a, char_b) if char_a <= char_b else (char_b, char_a)
+    return sys.intern(f"{lo} ↔ {hi}")
+
+
+@njit(cache=True)
+def _score_total(critical, moderate, minor):
+    """Sum per-scene scores from parallel severity-count columns."""
+    total = 0
+    for i in range(len(critical)):
+        score = 100 - critical[i] * 15 - moderate[i] * 5 - minor[i] * 2
+        if score > 0:
+            total += score
+    return total
+
+
+@dataclass(slots=True, init=False)
 class ConsistencyIssue:
-    """A single consistency issue found in a scene."""
+    """
+    A single consistency issue found in a scene.
+
+    problem_details is rendered on access from problem_details_fmt and
+    problem_details_args, so issues that are only counted never pay for
+    formatting. With no args the template is used verbatim (safe for free
+    text containing braces). Passing problem_details= stores ready-made
+    text as such a template.
+    """
 
     category: IssueCategory
     severity: IssueSeverity
     description: str
     scenes_affected: List[str]
-    problem_details: str
+    problem_details_fmt: str
     canonical_reference: Optional[str] = None  # From NotebookLM
     recommendation: str = ""
     file_paths: List[str] = field(default_factory=list)
     line_numbers: List[int] = field(default_factory=list)
+    problem_details_args: tuple = ()
+
+    def __init__(self,
+                 category: IssueCategory,
+                 severity: IssueSeverity,
+                 description: str,
+                 scenes_affected: List[str],
+                 problem_details_fmt: Optional[str] = None,
+                 canonical_reference: Optional[str] = None,
+                 recommendation: str = "",
+                 file_paths: Optional[List[str]] = None,
+                 line_numbers: Optional[List[int]] = None,
+                 problem_details_args: tuple = (),
+                 *,
+                 problem_details: Optional[str] = None):
+        if problem_details is not None:
+            if problem_details_fmt is not None:
+                raise TypeError("pass problem_details or problem_details_fmt, not both")
+            problem_details_fmt, problem_details_args = problem_details, ()
+        elif problem_details_fmt is None:
+            raise TypeError("ConsistencyIssue needs problem_details or problem_details_fmt")
+        self.category = category
+        self.severity = severity
+        self.description = description
+        self.scenes_affected = [_intern(scene) for scene in scenes_affected]
+        self.problem_details_fmt = problem_details_fmt
+        self.canonical_reference = canonical_reference
+        self.recommendation = recommendation
+        self.file_paths = [_intern(path) for path in file_paths or ()]
+        self.line_numbers = line_numbers if line_numbers is not None else []
+        self.problem_details_args = problem_details_args
+
+    def __reduce__(self):
+        # Pickle as a flat tuple (enums by value) for check_all workers
+        return (_restore_issue, (
+            self.category.value, self.severity.value, self.description,
+            self.scenes_affected, self.problem_details_fmt,
+            self.canonical_reference, self.recommendation, self.file_paths,
+            self.line_numbers, self.problem_details_args,
+        ))
+
+    @property
+    def problem_details(self) -> str:
+        """Detailed problem description."""
+        if not self.problem_details_args:
+            return self.problem_details_fmt
+        return self.problem_details_fmt.format(*self.problem_details_args)
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization."""
@@ -56,31 +210,105 @@ class ConsistencyIssue:
             'line_numbers': self.line_numbers
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ConsistencyIssue':
+        """Rebuild an issue from its to_dict() form (details kept as rendered)."""
+        return cls(
+            category=IssueCategory(data['category']),
+            severity=IssueSeverity(data['severity']),
+            description=data['description'],
+            scenes_affected=data['scenes_affected'],
+            problem_details=data['problem_details'],
+            canonical_reference=data.get('canonical_reference'),
+            recommendation=data.get('recommendation', ""),
+            file_paths=data.get('file_paths', []),
+            line_numbers=data.get('line_numbers', [])
+        )
+
     def to_markdown(self) -> str:
         """Convert to markdown report section."""
-        lines = [
-            f"### {self.description}",
-            f"**Scenes affected:** {', '.join(self.scenes_affected)}",
-            f"**Category:** {self.category.value.replace('_', ' ').title()}",
-            f"**Severity:** {self.severity.value.upper()}",
-            f"**Problem:** {self.problem_details}",
-        ]
+        out: List[str] = []
+        self.render_markdown(out)
+        return '\n'.join(out)
+
+    def render_markdown(self, out: List[str]) -> None:
+        """Append this issue's markdown lines to a shared output buffer."""
+        out.append(f"### {self.description}")
+        out.append(f"**Scenes affected:** {', '.join(self.scenes_affected)}")
+        out.append(f"**Category:** {self.category.display}")
+        out.append(f"**Severity:** {self.severity.label}")
+        out.append(f"**Problem:** {self.problem_details}")
 
         if self.canonical_reference:
-            lines.append(f"**Canonical Reference:** {self.canonical_reference}")
+            out.append(f"**Canonical Reference:** {self.canonical_reference}")
 
         if self.recommendation:
-            lines.append(f"**Recommendation:** {self.recommendation}")
+            out.append(f"**Recommendation:** {self.recommendation}")
 
         if self.file_paths:
-            lines.append("**Files:**")
-            for path in self.file_paths:
-                lines.append(f"  - `{path}`")
+            out.append("**Files:**")
+            out.extend([f"  - `{path}`" for path in self.file_paths])
 
-        return '\n'.join(lines)
 
+def _restore_issue(category: str, severity: str, *fields) -> ConsistencyIssue:
+    """Rebuild a ConsistencyIssue from its pickled tuple."""
+    return ConsistencyIssue(IssueCategory(category), IssueSeverity(severity), *fields)
+
+
+class IssueStore:
+    """
+    Append-only issue list that also files each issue by severity.
+
+    Severity is fixed once an issue is created, so the per-severity lists
+    are maintained at append time and read back without rescanning.
+    """
+
+    __slots__ = ('all', 'critical', 'moderate', 'minor')
+
+    def __init__(self, issues: Iterable[ConsistencyIssue] = ()):
+        self.all: List[ConsistencyIssue] = []
+        self.critical: List[ConsistencyIssue] = []
+        self.moderate: List[ConsistencyIssue] = []
+        self.minor: List[ConsistencyIssue] = []
+        self.extend(issues)
+
+    def append(self, issue: ConsistencyIssue):
+        """Add an issue to the store and its severity bucket."""
+        self.all.append(issue)
+        severity = issue.severity
+        if severity is IssueSeverity.CRITICAL:
+            self.critical.append(issue)
+        elif severity is IssueSeverity.MODERATE:
+            self.moderate.append(issue)
+        else:
+            self.minor.append(issue)
+
+    def extend(self, issues: Iterable[ConsistencyIssue]):
+        """Add several issues in order."""
+        for issue in issues:
+            self.append(issue)
 
-@dataclass
+    def __iter__(self) -> Iterator[ConsistencyIssue]:
+        return iter(self.all)
+
+    def __len__(self) -> int:
+        return len(self.all)
+
+    def __getitem__(self, index):
+        return self.all[index]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, IssueStore):
+            return self.all == other.all
+        if isinstance(other, list):
+            return self.all == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"IssueStore({self.all!r})"
+
+
+@dataclass(slots=True)
 class ConsistencyReport:
     """Consistency report for a single scene."""
 
@@ -89,69 +317,124 @@ class ConsistencyReport:
     story_phase: int
     checked_at: datetime = field(default_factory=datetime.now)
 
-    issues: List[ConsistencyIssue] = field(default_factory=list)
+    issues: IssueStore = field(default_factory=IssueStore)
 
     character_states: Dict[str, 'CharacterState'] = field(default_factory=dict)
     relationship_states: Dict[str, 'RelationshipState'] = field(default_factory=dict)
 
+    # (checked_at, ISO string) formatted on first serialization
+    _checked_at_text: tuple = field(default=(), init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if not isinstance(self.issues, IssueStore):
+            self.issues = IssueStore(self.issues)
+
+    def _checked_at_iso(self) -> str:
+        """ISO form of checked_at, cached until it changes."""
+        text = self._checked_at_text
+        if not text or text[0] is not self.checked_at:
+            text = self._checked_at_text = (self.checked_at, self.checked_at.isoformat())
+        return text[1]
+
     @property
     def critical_issues(self) -> List[ConsistencyIssue]:
         """Get critical issues only."""
-        return [i for i in self.issues if i.severity == IssueSeverity.CRITICAL]
+        return self.issues.critical
 
     @property
     def moderate_issues(self) -> List[ConsistencyIssue]:
         """Get moderate issues only."""
-        return [i for i in self.issues if i.severity == IssueSeverity.MODERATE]
+        return self.issues.moderate
 
     @property
     def minor_issues(self) -> List[ConsistencyIssue]:
         """Get minor issues only."""
-        return [i for i in self.issues if i.severity == IssueSeverity.MINOR]
+        return self.issues.minor
 
     @property
     def has_issues(self) -> bool:
         """Check if scene has any issues."""
         return len(self.issues) > 0
 
+    def _severity_counts(self) -> Dict[IssueSeverity, int]:
+        """Issue counts per severity."""
+        issues = self.issues
+        return {
+            IssueSeverity.CRITICAL: len(issues.critical),
+            IssueSeverity.MODERATE: len(issues.moderate),
+            IssueSeverity.MINOR: len(issues.minor),
+        }
+
+    def _severity_counts_and_lists(self) -> Dict[IssueSeverity, List[ConsistencyIssue]]:
+        """Issues bucketed by severity."""
+        issues = self.issues
+        return {
+            IssueSeverity.CRITICAL: issues.critical,
+            IssueSeverity.MODERATE: issues.moderate,
+            IssueSeverity.MINOR: issues.minor,
+        }
+
+    @staticmethod
+    def _score_from_counts(counts: Dict[IssueSeverity, int]) -> int:
+        """Deduct points based on severity counts."""
+        deductions = (counts[IssueSeverity.CRITICAL] * 15
+                      + counts[IssueSeverity.MODERATE] * 5
+                      + counts[IssueSeverity.MINOR] * 2)
+        return max(0, 100 - deductions)
+
     @property
     def consistency_score(self) -> int:
         """Calculate consistency score (0-100)."""
         if not self.issues:
             return 100
-
-        # Deduct points based on severity
-        deductions = 0
-        deductions += len(self.critical_issues) * 15
-        deductions += len(self.moderate_issues) * 5
-        deductions += len(self.minor_issues) * 2
-
-        return max(0, 100 - deductions)
+        return self._score_from_counts(self._severity_counts())
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization."""
+        counts = self._severity_counts()
         return {
             'scene_id': self.scene_id,
             'scene_path': self.scene_path,
             'story_phase': self.story_phase,
-            'checked_at': self.checked_at.isoformat(),
-            'consistency_score': self.consistency_score,
+            'checked_at': self._checked_at_iso(),
+            'consistency_score': self._score_from_counts(counts) if self.issues else 100,
             'issue_counts': {
-                'critical': len(self.critical_issues),
-                'moderate': len(self.moderate_issues),
-                'minor': len(self.minor_issues),
+                'critical': counts[IssueSeverity.CRITICAL],
+                'moderate': counts[IssueSeverity.MODERATE],
+                'minor': counts[IssueSeverity.MINOR],
                 'total': len(self.issues)
             },
-            'issues': [issue.to_dict() for issue in self.issues],
+            'issues': _to_dicts(self.issues.all),
             'character_states': {k: v.to_dict() for k, v in self.character_states.items()},
             'relationship_states': {k: v.to_dict() for k, v in self.relationship_states.items()}
         }
 
-
-@dataclass
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ConsistencyReport':
+        """Rebuild a scene report from its to_dict() form."""
+        return cls(
+            scene_id=data['scene_id'],
+            scene_path=data['scene_path'],
+            story_phase=data['story_phase'],
+            checked_at=datetime.fromisoformat(data['checked_at']),
+            issues=[ConsistencyIssue.from_dict(issue) for issue in data['issues']],
+            character_states={k: CharacterState.from_dict(v)
+                              for k, v in data.get('character_states', {}).items()},
+            relationship_states={k: RelationshipState.from_dict(v)
+                                 for k, v in data.get('relationship_states', {}).items()}
+        )
+
+
+@dataclass(slots=True)
 class VolumeConsistencyReport:
     """Consistency report for an entire volume."""
 
+    # Minor issues shown in markdown and in to_dict(full=False)
+    MINOR_PREVIEW_LIMIT: ClassVar[int] = 10
+
+    # to_dict() keys whose values are lists of models (converted lazily by write_json)
+    _NESTED_KEYS: ClassVar[tuple] = ('scene_reports', 'critical_issues', 'moderate_issues', 'minor_issues')
+
     volume_name: str
     volume_path: str
     checked_at: datetime = field(default_factory=datetime.now)
@@ -166,6 +449,67 @@ class VolumeConsistencyReport:
     character_timelines: Dict[str, List['CharacterState']] = field(default_factory=dict)
     relationship_timelines: Dict[str, List['RelationshipState']] = field(default_factory=dict)
 
+    # Running sum of scene scores; folded in by add_scene_report and
+    # rebuilt if scene_reports was resized directly or invalidate() was called
+    _score_sum: int = field(default=0, init=False, repr=False, compare=False)
+    _score_count: int = field(default=0, init=False, repr=False, compare=False)
+
+    # (checked_at, ISO string, display string) formatted on first use
+    _checked_at_text: tuple = field(default=(), init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_scene_reports(cls, volume_name: str, volume_path: str,
+                           scene_reports: List[ConsistencyReport]) -> 'VolumeConsistencyReport':
+        """Build a volume report from already-checked scene reports."""
+        volume_report = cls(volume_name=volume_name, volume_path=volume_path)
+        for report in scene_reports:
+            volume_report.add_scene_report(report)
+        return volume_report
+
+    def add_scene_report(self, report: ConsistencyReport):
+        """
+        Add a finished scene report and file its issues by severity.
+
+        Args:
+            report: Scene report; treated as final once added
+        """
+        buckets = report._severity_counts_and_lists()
+        critical = buckets[IssueSeverity.CRITICAL]
+        moderate = buckets[IssueSeverity.MODERATE]
+        minor = buckets[IssueSeverity.MINOR]
+
+        if self._score_count == len(self.scene_reports):
+            self._score_sum += report.consistency_score
+            self._score_count += 1
+
+        self.scene_reports.append(report)
+        self.scenes_checked += 1
+        self.critical_issues.extend(critical)
+        self.moderate_issues.extend(moderate)
+        self.minor_issues.extend(minor)
+
+    def invalidate(self):
+        """
+        Drop the cached consistency score.
+
+        Call after editing issues of a scene report that was already added,
+        since those edits don't change len(scene_reports).
+        """
+        self._score_sum = 0
+        self._score_count = -1
+
+    def _checked_at_strings(self) -> tuple:
+        """ISO and display forms of checked_at, cached until it changes."""
+        text = self._checked_at_text
+        if not text or text[0] is not self.checked_at:
+            checked_at = self.checked_at
+            text = self._checked_at_text = (
+                checked_at,
+                checked_at.isoformat(),
+                checked_at.strftime('%Y-%m-%d %H:%M:%S'),
+            )
+        return text
+
     @property
     def total_issues(self) -> int:
         """Total number of issues found."""
@@ -178,181 +522,182 @@ class VolumeConsistencyReport:
             return 0
 
         # Average of all scene scores
-        total = sum(report.consistency_score for report in self.scene_reports)
-        return int(total / len(self.scene_reports))
+        if self._score_count != len(self.scene_reports):
+            self._score_sum = self._rescore_scenes()
+            self._score_count = len(self.scene_reports)
+        return int(self._score_sum / self._score_count)
+
+    def _rescore_scenes(self) -> int:
+        """Recompute the sum of all scene scores from their severity counts."""
+        critical, moderate, minor = [], [], []
+        for report in self.scene_reports:
+            counts = report._severity_counts()
+            critical.append(counts[IssueSeverity.CRITICAL])
+            moderate.append(counts[IssueSeverity.MODERATE])
+            minor.append(counts[IssueSeverity.MINOR])
+        if NUMBA_AVAILABLE:
+            critical = np.asarray(critical, dtype=np.int32)
+            moderate = np.asarray(moderate, dtype=np.int32)
+            minor = np.asarray(minor, dtype=np.int32)
+        return int(_score_total(critical, moderate, minor))
 
     @property
     def grade(self) -> str:
         """Letter grade for consistency."""
+        return self._grade_for(self.consistency_score)
+
+    @staticmethod
+    def _grade_for(score: int) -> str:
+        """Map a 0-100 score to a letter grade."""
+        return _GRADES[bisect_right(_GRADE_CUTOFFS, score)]
+
+    def to_dict(self, full: bool = True) -> Dict:
+        """
+        Convert to dictionary for JSON serialization.
+
+        Args:
+            full: Include every minor issue. When False only the first
+                MINOR_PREVIEW_LIMIT are serialized and the remainder is
+                reported as 'minor_issues_omitted'.
+        """
+        data = self._json_fields(full)
+        for key in self._NESTED_KEYS:
+            data[key] = _to_dicts(data[key])
+        return data
+
+    def _json_fields(self, full: bool = True) -> Dict:
+        """
+        Top-level to_dict() fields with scene reports and issues left as objects.
+
+        write_json() streams this so each nested object is converted only
+        when the encoder reaches it.
+        """
+        n_critical = len(self.critical_issues)
+        n_moderate = len(self.moderate_issues)
+        n_minor = len(self.minor_issues)
         score = self.consistency_score
-        if score >= 95:
-            return "A+"
-        elif score >= 90:
-            return "A"
-        elif score >= 87:
-            return "A-"
-        elif score >= 83:
-            return "B+"
-        elif score >= 80:
-            return "B"
-        elif score >= 77:
-            return "B-"
-        elif score >= 73:
-            return "C+"
-        elif score >= 70:
-            return "C"
-        else:
-            return "F"
-
-    def to_dict(self) -> Dict:
-        """Convert to dictionary for JSON serialization."""
-        return {
+        data = {
             'volume_name': self.volume_name,
             'volume_path': self.volume_path,
-            'checked_at': self.checked_at.isoformat(),
+            'checked_at': self._checked_at_strings()[1],
             'scenes_checked': self.scenes_checked,
-            'consistency_score': self.consistency_score,
-            'grade': self.grade,
+            'consistency_score': score,
+            'grade': self._grade_for(score),
             'issue_counts': {
-                'critical': len(self.critical_issues),
-                'moderate': len(self.moderate_issues),
-                'minor': len(self.minor_issues),
-                'total': self.total_issues
+                'critical': n_critical,
+                'moderate': n_moderate,
+                'minor': n_minor,
+                'total': n_critical + n_moderate + n_minor
             },
-            'scene_reports': [report.to_dict() for report in self.scene_reports],
-            'critical_issues': [issue.to_dict() for issue in self.critical_issues],
-            'moderate_issues': [issue.to_dict() for issue in self.moderate_issues],
-            'minor_issues': [issue.to_dict() for issue in self.minor_issues]
+            'scene_reports': self.scene_reports,
+            'critical_issues': self.critical_issues,
+            'moderate_issues': self.moderate_issues
         }
+        if full:
+            data['minor_issues'] = self.minor_issues
+        else:
+            limit = self.MINOR_PREVIEW_LIMIT
+            data['minor_issues'] = self.minor_issues[:limit]
+            data['minor_issues_omitted'] = max(0, n_minor - limit)
+        return data
 
     def to_markdown(self) -> str:
         """Generate comprehensive markdown report."""
+        n_minor = len(self.minor_issues)
+        score = self.consistency_score
         lines = [
             f"# {self.volume_name} Consistency Report",
-            f"Generated: {self.checked_at.strftime('%Y-%m-%d %H:%M:%S')}",
+            f"Generated: {self._checked_at_strings()[2]}",
             "",
             "## Executive Summary",
             "",
             f"- **Scenes checked:** {self.scenes_checked}",
             f"- **Critical issues:** {len(self.critical_issues)}",
             f"- **Moderate issues:** {len(self.moderate_issues)}",
-            f"- **Minor issues:** {len(self.minor_issues)}",
-            f"- **Overall consistency:** {self.grade} ({self.consistency_score}/100)",
+            f"- **Minor issues:** {n_minor}",
+            f"- **Overall consistency:** {self._grade_for(score)} ({score}/100)",
             ""
         ]
 
-        # Critical issues section
+        # Issue sections
         if self.critical_issues:
-            lines.extend([
-                "## Critical Issues (Must Fix)",
-                "",
-                "*These issues must be resolved before publication.*",
-                ""
-            ])
-
+            lines.append(_CRITICAL_SECTION)
             for i, issue in enumerate(self.critical_issues, 1):
                 lines.append(f"### Issue {i}: {issue.description}")
-                lines.append(issue.to_markdown())
+                issue.render_markdown(lines)
                 lines.append("")
 
-        # Moderate issues section
         if self.moderate_issues:
-            lines.extend([
-                "## Moderate Issues (Should Fix)",
-                "",
-                "*These issues impact quality and should be addressed.*",
-                ""
-            ])
-
+            lines.append(_MODERATE_SECTION)
             for i, issue in enumerate(self.moderate_issues, 1):
                 lines.append(f"### Issue {i}: {issue.description}")
-                lines.append(issue.to_markdown())
+                issue.render_markdown(lines)
                 lines.append("")
 
-        # Minor issues section
         if self.minor_issues:
-            lines.extend([
-                "## Minor Issues (Nice to Fix)",
-                "",
-                "*These are polish items that can be addressed as time permits.*",
-                ""
-            ])
-
-            # Only show first 10 minor issues to avoid overwhelming report
-            for i, issue in enumerate(self.minor_issues[:10], 1):
+            lines.append(_MINOR_SECTION)
+            # Only show the first few minor issues to avoid overwhelming report
+            limit = self.MINOR_PREVIEW_LIMIT
+            for i, issue in enumerate(self.minor_issues[:limit], 1):
                 lines.append(f"### Issue {i}: {issue.description}")
-                lines.append(issue.to_markdown())
+                issue.render_markdown(lines)
                 lines.append("")
 
-            if len(self.minor_issues) > 10:
-                lines.append(f"*... and {len(self.minor_issues) - 10} more minor issues*")
+            if n_minor > limit:
+                lines.append(f"*... and {n_minor - limit} more minor issues*")
                 lines.append("")
 
-        # Recommendations section
-        lines.extend([
-            "## Recommendations by Priority",
-            "",
-            "### Immediate (Critical):",
-        ])
-
-        if self.critical_issues:
-            for i, issue in enumerate(self.critical_issues, 1):
-                lines.append(f"{i}. {issue.recommendation}")
-        else:
-            lines.append("✅ No critical issues found!")
-
-        lines.extend([
-            "",
-            "### Short-term (Moderate):"
-        ])
-
-        if self.moderate_issues[:5]:  # Top 5
-            for i, issue in enumerate(self.moderate_issues[:5], 1):
-                lines.append(f"{i}. {issue.recommendation}")
-        else:
-            lines.append("✅ No moderate issues found!")
-
-        lines.extend([
-            "",
-            "### Long-term (Minor):"
-        ])
-
-        if self.minor_issues[:5]:  # Top 5
-            for i, issue in enumerate(self.minor_issues[:5], 1):
-                lines.append(f"{i}. {issue.recommendation}")
-        else:
-            lines.append("✅ No minor issues found!")
+        # Recommendations section (clean volumes get the whole block as one constant)
+        if not (self.critical_issues or self.moderate_issues or self.minor_issues):
+            lines.append(_CLEAN_RECOMMENDATIONS)
+            lines.append(_FILES_SECTION)
+            return '\n'.join(lines)
+
+        lines.append(_RECOMMENDATIONS_HEADER)
+        for heading, issues, empty in (
+            (_IMMEDIATE_HEADING, self.critical_issues, _EMPTY_CRITICAL),
+            (_SHORT_TERM_HEADING, self.moderate_issues[:5], _EMPTY_MODERATE),  # Top 5
+            (_LONG_TERM_HEADING, self.minor_issues[:5], _EMPTY_MINOR),  # Top 5
+        ):
+            lines.append(heading)
+            if issues:
+                for i, issue in enumerate(issues, 1):
+                    lines.append(f"{i}. {issue.recommendation}")
+            else:
+                lines.append(empty)
 
         # Files to review section
-        lines.extend([
-            "",
-            "## Files to Review",
-            "",
-            "Priority order for manual review:",
-            ""
-        ])
-
-        # Collect all files with critical/moderate issues
-        priority_files = []
-        for issue in self.critical_issues + self.moderate_issues:
+        lines.append(_FILES_SECTION)
+
+        # Collect files with critical/moderate issues, critical first. Only
+        # the first 20 of each group can be listed, so longer tails are
+        # just counted through `seen`.
+        critical_files = []
+        other_files = []
+        seen = set()
+        for issue in chain(self.critical_issues, self.moderate_issues):
+            if issue.severity is IssueSeverity.CRITICAL:
+                bucket, severity_label = critical_files, "CRITICAL"
+            else:
+                bucket, severity_label = other_files, "MODERATE"
             for file_path in issue.file_paths:
-                if file_path not in [f[1] for f in priority_files]:
-                    severity_label = "CRITICAL" if issue.severity == IssueSeverity.CRITICAL else "MODERATE"
-                    priority_files.append((issue.severity, file_path, issue.description, severity_label))
-
-        # Sort by severity
-        priority_files.sort(key=lambda x: 0 if x[0] == IssueSeverity.CRITICAL else 1)
-
-        for i, (_, file_path, desc, label) in enumerate(priority_files[:20], 1):  # Top 20
+                if file_path in seen:
+                    continue
+                seen.add(file_path)
+                if len(bucket) < 20:
+                    bucket.append((file_path, issue.description, severity_label))
+
+        top_files = islice(chain(critical_files, other_files), 20)
+        for i, (file_path, desc, label) in enumerate(top_files, 1):  # Top 20
             lines.append(f"{i}. `{file_path}` - {label}: {desc}")
 
-        if len(priority_files) > 20:
-            lines.append(f"... and {len(priority_files) - 20} more files")
+        if len(seen) > 20:
+            lines.append(f"... and {len(seen) - 20} more files")
 
         return '\n'.join(lines)
 
 
-@dataclass
+@dataclass(slots=True)
 class CharacterState:
     """Character state at a specific point in the story."""
 
@@ -369,7 +714,19 @@ class CharacterState:
     limitations: List[str] = field(default_factory=list)
 
     # Specific attributes (vary by character)
-    attributes: Dict[str, any] = field(default_factory=dict)
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self):
+        self.character_name = _intern(self.character_name)
+        self.scene_id = _intern(self.scene_id)
+
+    def __reduce__(self):
+        # Pickle as positional constructor args for check_all workers
+        return (CharacterState, (
+            self.character_name, self.scene_id, self.story_phase,
+            self.psychological_notes, self.emotional_state,
+            self.abilities, self.limitations, self.attributes,
+        ))
 
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
@@ -384,8 +741,13 @@ class CharacterState:
             'attributes': self.attributes
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'CharacterState':
+        """Rebuild a character state from its to_dict() form."""
+        return cls(**data)
 
-@dataclass
+
+@dataclass(slots=True)
 class RelationshipState:
     """Relationship state between two characters at a specific point."""
 
@@ -400,6 +762,18 @@ class RelationshipState:
 
     notes: str = ""
 
+    def __post_init__(self):
+        self.character_a = _intern(self.character_a)
+        self.character_b = _intern(self.character_b)
+        self.scene_id = _intern(self.scene_id)
+
+    def __reduce__(self):
+        # Pickle as positional constructor args for check_all workers
+        return (RelationshipState, (
+            self.character_a, self.character_b, self.scene_id, self.story_phase,
+            self.relationship_type, self.dynamic, self.trust_level, self.notes,
+        ))
+
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
         return {
@@ -413,8 +787,99 @@ class RelationshipState:
             'notes': self.notes
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'RelationshipState':
+        """Rebuild a relationship state from its to_dict() form."""
+        return cls(**data)
+
     @property
     def relationship_key(self) -> str:
         """Get canonical key for this relationship (alphabetical order)."""
-        chars = sorted([self.character_a, self.character_b])
-        return f"{chars[0]} ↔ {chars[1]}"
+        return _relationship_key(self.character_a, self.character_b)
+
+
+def _default(obj: Any) -> Any:
+    """
+    Fallback hook for JSON encoders.
+
+    Report dataclasses are routed through their to_dict() (which carries
+    derived fields such as scores and issue counts), enums become their
+    values and datetimes their ISO form.
+    """
+    to_dict = getattr(obj, 'to_dict', None)
+    if to_dict is not None:
+        return to_dict()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json(obj: Any, indent: bool = False, full: bool = True) -> bytes:
+    """
+    Serialize a report (or any to_dict-able model) to UTF-8 JSON.
+
+    Uses orjson when installed so encoding runs in C; falls back to the
+    stdlib encoder otherwise.
+
+    Args:
+        obj: Report, issue, state, or plain JSON-compatible value
+        indent: Pretty-print with two-space indentation
+        full: For volume reports, False serializes only the minor-issue
+            preview (see VolumeConsistencyReport.to_dict)
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if not full and isinstance(obj, VolumeConsistencyReport):
+        obj = obj.to_dict(full=False)
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_PASSTHROUGH_DATACLASS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_default, option=option)
+    return json.dumps(obj, default=_default, indent=2 if indent else None,
+                      ensure_ascii=False).encode('utf-8')
+
+
+def loads_json(data) -> Any:
+    """
+    Parse JSON produced by dumps_json() (bytes or str).
+
+    Uses orjson when installed; falls back to the stdlib decoder otherwise.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_json(obj: Any, fp: BinaryIO, indent: bool = False, full: bool = True):
+    """
+    Write a report as UTF-8 JSON to a binary file object.
+
+    Produces the same document as dumps_json(). Volume reports are not
+    converted to one big dict first: each scene report and issue is turned
+    into a dict only when the encoder reaches it. Without orjson the output
+    is streamed to fp chunk by chunk.
+
+    Args:
+        obj: Report, issue, state, or plain JSON-compatible value
+        fp: File opened in binary write mode
+        indent: Pretty-print with two-space indentation
+        full: For volume reports, False serializes only the minor-issue
+            preview (see VolumeConsistencyReport.to_dict)
+    """
+    if isinstance(obj, VolumeConsistencyReport):
+        obj = obj._json_fields(full)
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_PASSTHROUGH_DATACLASS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        fp.write(orjson.dumps(obj, default=_default, option=option))
+        return
+    encoder = json.JSONEncoder(default=_default, indent=2 if indent else None,
+                               ensure_ascii=False)
+    writer = codecs.getwriter('utf-8')(fp)
+    for chunk in encoder.iterencode(obj):
+        writer.write(chunk)
@@ -15,12 +15,22 @@ Integrates with NotebookLM for canonical reference verification.
 """
 
 import argparse
-import json
+import copy
+import functools
+import hashlib
+import os
+import select
+import sqlite3
 import subprocess
 import sys
 import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
 from datetime import datetime
 
 # Add parent directory to path
@@ -34,21 +44,189 @@ from consistency.models import (
     CharacterState,
     RelationshipState,
     IssueSeverity,
-    IssueCategory
+    IssueCategory,
+    dumps_json,
+    loads_json,
+    write_json
 )
 from consistency.character_tracker import CharacterStateTracker
 from utils.validation import BiLocationValidator, VoiceValidator
 
+# Aho-Corasick keyword scanning (optional, pip install pyahocorasick)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+# Patterns used on every scene / every Claude response
+_SCENE_ID_RE = re.compile(r'(\d+\.\d+\.\d+)')
+_SOBER_DAYS_RE = re.compile(r'(\d+)\s+days?\s+sober', re.IGNORECASE)
+_ISSUES_RE = re.compile(r'ISSUES:\s*\n(.+)', re.DOTALL)
+_DETAILS_RE = re.compile(r'DETAILS:\s*(.+)', re.DOTALL)
+
+# Characters whose canonical backstory is looked up, in lookup order
+_BACKSTORY_CHARACTERS = ("Sadie", "Mickey", "Noni", "Dr. Webb")
+
+# Established bi-location terminology (case-sensitive)
+_CORRECT_BILOCATION_TERMS = ("The Line", "The Tether", "The Shared Vein")
+
+# Scene file suffixes picked up by check_volume
+_SCENE_EXTENSIONS = ('.md', '.markdown')
+
+# Character names and state values stamped on every extracted state
+# (interned so the tracker's dict lookups compare by identity)
+_MICKEY = sys.intern("Mickey Bardot")
+_NONI = sys.intern("Noni")
+_SADIE = sys.intern("Sadie")
+_WEBB = sys.intern("Dr. Webb")
+_MICKEY_NONI = sys.intern(f"{_MICKEY} ↔ {_NONI}")
+_TRUST_MEDIUM = sys.intern("medium")
+_TRUST_HIGH = sys.intern("high")
+_TRUST_LOW = sys.intern("low")
+_MICKEY_NONI_TYPE = sys.intern("professional/romantic")
+_MICKEY_NONI_DYNAMIC = sys.intern("Complex, evolving")
+
+# Bump when check logic changes so cached scene reports are recomputed
+CHECKER_VERSION = "1"
+
+# Most scene text read per file (well beyond any prompt window)
+_MAX_SCAN_CHARS = 200_000
+
+# Claude responses kept in memory for reuse within a run (least recently used dropped)
+RESPONSE_CACHE_SIZE = 512
+
+# Lowercase substrings tested by the keyword-driven checks and extractors
+_BACKSTORY_KEYWORDS = ("history", "past", "before", "used to", "remember when", "years ago")
+_SCENE_KEYWORDS = (
+    "bi-location", "bilocation",
+    "sadie", "mickey", "noni", "dr. webb",
+    "sober", "sobriety", "quantum hindsight", "implant",
+    "morphic resonance", "touch", "resonance", "far", "distance",
+    "trust", "high", "complete", "distrust", "don't trust",
+) + _BACKSTORY_KEYWORDS
+
+if AHOCORASICK_AVAILABLE:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in _SCENE_KEYWORDS:
+        _KEYWORD_AUTOMATON.add_word(_keyword, _keyword)
+    _KEYWORD_AUTOMATON.make_automaton()
+    del _keyword
+
+
+def _scan_keywords(content_lower: str) -> FrozenSet[str]:
+    """
+    Find which _SCENE_KEYWORDS occur in lowercased scene text.
+
+    One Aho-Corasick pass when pyahocorasick is installed, otherwise one
+    substring test per keyword.
+    """
+    if AHOCORASICK_AVAILABLE:
+        return frozenset(keyword for _, keyword in _KEYWORD_AUTOMATON.iter(content_lower))
+    return frozenset(keyword for keyword in _SCENE_KEYWORDS if keyword in content_lower)
+
+
+@dataclass(slots=True, frozen=True)
+class _SceneSignals:
+    """Everything the local checks read from a scene's text, gathered once."""
+    keywords: FrozenSet[str]
+    mentioned_characters: FrozenSet[str]
+    missing_bilocation_terms: bool
+    sobriety_days: Optional[int]
+
+
+def _scan_scene(content: str) -> _SceneSignals:
+    """
+    Scan scene text once for the local checks and extractors.
+
+    The keyword pass drives everything; the case-sensitive term search and
+    the sobriety regex only run when the keywords say they can matter.
+    """
+    keywords = _scan_keywords(content.lower())
+    mentioned_characters = frozenset(
+        name for name in _BACKSTORY_CHARACTERS if name.lower() in keywords
+    )
+
+    missing_bilocation_terms = (
+        ("bi-location" in keywords or "bilocation" in keywords)
+        and not any(term in content for term in _CORRECT_BILOCATION_TERMS)
+    )
+
+    sobriety_days = None
+    if "mickey" in keywords and ("sober" in keywords or "sobriety" in keywords):
+        sober_match = _SOBER_DAYS_RE.search(content)
+        if sober_match:
+            sobriety_days = int(sober_match.group(1))
+
+    return _SceneSignals(keywords, mentioned_characters, missing_bilocation_terms, sobriety_days)
+
+
+def _canon_question(question: str) -> str:
+    """
+    Normalize a canonical-reference question for use as a cache key.
+
+    Lowercases, collapses whitespace and drops trailing punctuation, so
+    questions that differ just in case, spacing or a final "?" share one
+    NotebookLM lookup. Word order is kept: "Does Mickey trust Noni?" and
+    "Does Noni trust Mickey?" are different questions.
+    """
+    return ' '.join(question.lower().split()).rstrip('?!.;: ')
+
+
+def _read_scene_file(scene_path: Path) -> str:
+    """
+    Read a scene's text, stopping after _MAX_SCAN_CHARS characters.
+
+    Claude prompts only use the first few thousand characters, so very
+    large files are not read in full.
+    """
+    with open(scene_path, 'r', encoding='utf-8') as f:
+        return f.read(_MAX_SCAN_CHARS)
+
+
+def _is_archive(name: str) -> bool:
+    """Whether a path or path component belongs to an Archive folder."""
+    return "Archive" in name or "archive" in name
+
+
+def _iter_scene_files(root: Path) -> Iterator[Path]:
+    """
+    Yield Markdown scene files under root in a single directory walk.
+
+    Directories and files with "Archive"/"archive" in their name are
+    skipped, so archived subtrees are never descended into.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if _is_archive(entry.name):
+                continue
+            if entry.is_dir():
+                yield from _iter_scene_files(Path(entry.path))
+            elif entry.name.endswith(_SCENE_EXTENSIONS):
+                yield Path(entry.path)
+
 
 class NotebookLMInterface:
     """Interface to NotebookLM for canonical reference queries."""
 
-    def __init__(self, query_script_path: str = "utilities/explants_nlm_query.sh"):
+    DEFAULT_CACHE_PATH = "~/.cache/explants/nlm_cache.sqlite"
+
+    def __init__(self, query_script_path: str = "utilities/explants_nlm_query.sh",
+                 cache_path: Optional[str] = DEFAULT_CACHE_PATH,
+                 cache_ttl: Optional[int] = None,
+                 server_mode: bool = False):
         """
         Initialize NotebookLM interface.
 
         Args:
             query_script_path: Path to NotebookLM query script
+            cache_path: SQLite file for answers persisted across runs (None disables)
+            cache_ttl: Seconds before a cached answer is re-queried (None = never)
+            server_mode: Keep one `script --server` process for all queries
+                (one question per stdin line, one JSON-encoded answer per
+                stdout line); falls back to a process per query if the
+                script doesn't support it
         """
         self.query_script = Path(query_script_path)
 
@@ -58,16 +236,91 @@ class NotebookLMInterface:
                 "Please ensure utilities/explants_nlm_query.sh exists."
             )
 
+        self.cache_ttl = cache_ttl
+        self._cache: Optional[sqlite3.Connection] = None
+        if cache_path is not None:
+            try:
+                path = Path(cache_path).expanduser()
+                path.parent.mkdir(parents=True, exist_ok=True)
+                self._cache = sqlite3.connect(str(path), check_same_thread=False)
+                self._cache.execute(
+                    "CREATE TABLE IF NOT EXISTS answers("
+                    "q_hash TEXT PRIMARY KEY, question TEXT, answer TEXT, ts INTEGER)"
+                )
+                self._cache.commit()
+            except (OSError, sqlite3.Error):
+                # Cache is an optimization; run uncached if it can't be opened
+                self._cache = None
+
+        # Long-lived query process (started on first uncached query)
+        self.server_mode = server_mode
+        self._server: Optional[subprocess.Popen] = None
+        self._server_buffer = b""
+        self._server_lock = threading.Lock()
+
+    @staticmethod
+    def _question_hash(question: str) -> str:
+        """Stable cache key for a question."""
+        return hashlib.blake2b(question.encode('utf-8'), digest_size=16).hexdigest()
+
+    def _cached_answer(self, q_hash: str) -> Optional[str]:
+        """Look up a persisted answer, honoring cache_ttl."""
+        if self._cache is None:
+            return None
+        try:
+            row = self._cache.execute(
+                "SELECT answer, ts FROM answers WHERE q_hash = ?", (q_hash,)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        answer, ts = row
+        if self.cache_ttl is not None and time.time() - ts > self.cache_ttl:
+            return None
+        return answer
+
+    def _store_answer(self, q_hash: str, question: str, answer: str):
+        """Persist an answer for later runs."""
+        if self._cache is None:
+            return
+        try:
+            self._cache.execute(
+                "INSERT OR REPLACE INTO answers (q_hash, question, answer, ts) VALUES (?, ?, ?, ?)",
+                (q_hash, question, answer, int(time.time()))
+            )
+            self._cache.commit()
+        except sqlite3.Error:
+            pass
+
     def query(self, question: str) -> str:
         """
         Query NotebookLM for canonical information.
 
+        Answers are served from the on-disk cache when available; otherwise
+        the query script is run and its answer persisted.
+
         Args:
             question: Natural language question
 
         Returns:
             Answer from NotebookLM
         """
+        q_hash = self._question_hash(question)
+        cached = self._cached_answer(q_hash)
+        if cached is not None:
+            return cached
+
+        if self.server_mode:
+            try:
+                answer = self._server_query(question)
+                self._store_answer(q_hash, question, answer)
+                return answer
+            except Exception:
+                # No (working) server mode; use one process per query from now on
+                self.server_mode = False
+                self.close(wait=0)
+
         try:
             result = subprocess.run(
                 [str(self.query_script), question],
@@ -79,13 +332,129 @@ class NotebookLMInterface:
             if result.returncode != 0:
                 raise RuntimeError(f"NotebookLM query failed: {result.stderr}")
 
-            return result.stdout.strip()
+            answer = result.stdout.strip()
 
         except subprocess.TimeoutExpired:
             raise RuntimeError("NotebookLM query timed out after 60 seconds")
         except Exception as e:
             raise RuntimeError(f"NotebookLM query error: {e}")
 
+        self._store_answer(q_hash, question, answer)
+        return answer
+
+    def _server_query(self, question: str, timeout: float = 60) -> str:
+        """Ask the long-lived query process one question."""
+        with self._server_lock:
+            if self._server is None:
+                self._server = subprocess.Popen(
+                    [str(self.query_script), "--server"],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL
+                )
+                self._server_buffer = b""
+
+            line = " ".join(question.splitlines()) + "\n"
+            self._server.stdin.write(line.encode('utf-8'))
+            self._server.stdin.flush()
+
+            # Read one answer line, without blocking past the timeout
+            stdout = self._server.stdout.fileno()
+            deadline = time.monotonic() + timeout
+            while b"\n" not in self._server_buffer:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not select.select([stdout], [], [], remaining)[0]:
+                    raise RuntimeError(f"NotebookLM server timed out after {timeout:.0f} seconds")
+                chunk = os.read(stdout, 65536)
+                if not chunk:
+                    raise RuntimeError("NotebookLM server exited")
+                self._server_buffer += chunk
+
+            answer, _, self._server_buffer = self._server_buffer.partition(b"\n")
+
+        answer = loads_json(answer)
+        if not isinstance(answer, str):
+            raise RuntimeError("NotebookLM server returned a non-string answer")
+        return answer.strip()
+
+    def close(self, wait: float = 5):
+        """
+        Stop the long-lived query process, if one is running.
+
+        Args:
+            wait: Seconds to let it exit after closing stdin before killing it
+        """
+        with self._server_lock:
+            if self._server is None:
+                return
+            server, self._server = self._server, None
+            try:
+                server.stdin.close()
+                server.wait(timeout=wait)
+            except Exception:
+                server.kill()
+
+
+class SceneReportCache:
+    """
+    On-disk cache of scene reports keyed by scene path and content hash.
+
+    Lets repeated volume runs skip scenes that haven't changed. Entries are
+    also keyed by a checker version string, so changing the check logic
+    (or the options that affect results) never serves stale reports.
+    """
+
+    DEFAULT_CACHE_PATH = "reports/.cache/scene_reports.sqlite"
+
+    def __init__(self, cache_path: str = DEFAULT_CACHE_PATH):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            cache_path: SQLite file holding cached reports
+        """
+        path = Path(cache_path).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS scene_reports("
+            "scene_path TEXT, content_sha256 TEXT, checker_version TEXT, report_json TEXT, "
+            "PRIMARY KEY(scene_path, content_sha256, checker_version))"
+        )
+        self._db.commit()
+
+    @staticmethod
+    def content_hash(content: str) -> str:
+        """SHA-256 of the scene text."""
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    def get(self, scene_path: str, content_hash: str, checker_version: str) -> Optional[ConsistencyReport]:
+        """Return the cached report for this scene content, or None."""
+        try:
+            row = self._db.execute(
+                "SELECT report_json FROM scene_reports "
+                "WHERE scene_path = ? AND content_sha256 = ? AND checker_version = ?",
+                (scene_path, content_hash, checker_version)
+            ).fetchone()
+            if row is None:
+                return None
+            return ConsistencyReport.from_dict(loads_json(row[0]))
+        except (sqlite3.Error, ValueError, KeyError, TypeError):
+            return None
+
+    def put(self, report: ConsistencyReport, content_hash: str, checker_version: str):
+        """Store a finished scene report."""
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO scene_reports "
+                "(scene_path, content_sha256, checker_version, report_json) VALUES (?, ?, ?, ?)",
+                (report.scene_path, content_hash, checker_version,
+                 dumps_json(report).decode('utf-8'))
+            )
+            self._db.commit()
+        except sqlite3.Error:
+            pass
+
 
 class Volume1ConsistencyChecker:
     """
@@ -114,23 +483,31 @@ class Volume1ConsistencyChecker:
     def __init__(self,
                  nlm_interface: Optional[NotebookLMInterface] = None,
                  agent: Optional[ClaudeAgent] = None,
-                 verbose: bool = False):
+                 verbose: bool = False,
+                 llm_workers: int = 8,
+                 check_only: Optional[str] = None,
+                 report_cache: Optional[SceneReportCache] = None):
         """
         Initialize consistency checker.
 
         Args:
             nlm_interface: NotebookLM query interface (optional)
-            agent: Claude Sonnet 4.5 for analysis (optional, will create if None)
+            agent: Claude Sonnet 4.5 for analysis (optional, created on first use if None)
             verbose: Enable verbose logging
+            llm_workers: Concurrent Claude calls during check_volume (1 = serial)
+            check_only: Restrict to one category; Claude checks only run for "characters"
+            report_cache: Reuse reports for scenes whose content hasn't changed (optional)
         """
         self.nlm = nlm_interface
         self.verbose = verbose
+        self.llm_workers = llm_workers
+        self.check_only = check_only
 
-        # Initialize agent for analysis
-        if agent is None:
-            self.agent = ClaudeAgent(model="claude-sonnet-4-5-20250929")
-        else:
-            self.agent = agent
+        # Per-thread agent clones used by the check_volume LLM pool
+        self._thread_agents = threading.local()
+
+        # Agent for analysis, created on first use (local-only runs never need it)
+        self._agent = agent
 
         # Initialize validators
         self.bilocation_validator = BiLocationValidator()
@@ -142,6 +519,28 @@ class Volume1ConsistencyChecker:
         # Cache canonical references from NotebookLM
         self.canonical_cache: Dict[str, str] = {}
 
+        # Claude responses by prompt digest, so identical prompts are sent once
+        # per run (LRU of RESPONSE_CACHE_SIZE; unchanged scenes across runs are
+        # served whole by report_cache instead)
+        self._response_cache: OrderedDict = OrderedDict()
+        self._response_lock = threading.Lock()
+
+        # Cached scene reports; scenes whose Claude checks errored are never cached
+        self.report_cache = report_cache
+        self._failed_scenes = set()
+
+    @property
+    def agent(self) -> ClaudeAgent:
+        """Claude agent for analysis, created the first time a check needs it."""
+        if self._agent is None:
+            self._agent = ClaudeAgent(model="claude-sonnet-4-5-20250929")
+        return self._agent
+
+    @property
+    def runs_llm_checks(self) -> bool:
+        """Whether the Claude character/backstory checks are enabled."""
+        return self.check_only is None or self.check_only == "characters"
+
     def log(self, message: str, level: str = "INFO"):
         """Log message if verbose enabled."""
         if self.verbose:
@@ -162,16 +561,17 @@ class Volume1ConsistencyChecker:
             self.log("NotebookLM not available, skipping canonical query", "WARNING")
             return None
 
-        # Check cache first
-        if question in self.canonical_cache:
+        # Check cache first (keyed on the canonical form of the question)
+        key = _canon_question(question)
+        if key in self.canonical_cache:
             self.log(f"Using cached canonical reference for: {question[:50]}...")
-            return self.canonical_cache[question]
+            return self.canonical_cache[key]
 
-        # Query NotebookLM
+        # Query NotebookLM with the original wording
         try:
             self.log(f"Querying NotebookLM: {question[:50]}...")
             answer = self.nlm.query(question)
-            self.canonical_cache[question] = answer
+            self.canonical_cache[key] = answer
             return answer
 
         except Exception as e:
@@ -187,7 +587,7 @@ class Volume1ConsistencyChecker:
             "Chapter_3/1.3.5 confrontation.md" → "1.3.5"
         """
         # Match pattern: X.Y.Z at start of filename
-        match = re.search(r'(\d+\.\d+\.\d+)', filename)
+        match = _SCENE_ID_RE.search(filename)
         if match:
             return match.group(1)
 
@@ -226,6 +626,91 @@ class Volume1ConsistencyChecker:
         Returns:
             ConsistencyReport with all issues found
         """
+        return self._run_scene_checks(*self._prepare_scene(scene_path, scene_number, story_phase))
+
+    def check_scene_content(self, scene_path: Path, content: str,
+                            scene_number: Optional[str] = None,
+                            story_phase: Optional[int] = None) -> ConsistencyReport:
+        """
+        Check a scene whose text has already been read.
+
+        Args:
+            scene_path: Path to scene file (used for IDs, phase and reporting)
+            content: Scene text
+            scene_number: Scene ID (e.g., "1.3.2"), will parse from filename if None
+            story_phase: Story phase (1-2), will extract from path if None
+
+        Returns:
+            ConsistencyReport with all issues found
+        """
+        return self._run_scene_checks(*self._prepare_scene(scene_path, scene_number, story_phase, content))
+
+    def _run_scene_checks(self, report: ConsistencyReport,
+                          llm_tasks: List[Callable[[], List[ConsistencyIssue]]],
+                          content_hash: Optional[str] = None) -> ConsistencyReport:
+        """Run a prepared scene's Claude checks in order (check_volume runs these concurrently instead)."""
+        for task in llm_tasks:
+            report.issues.extend(task())
+
+        self.log(f"Found {len(report.issues)} issues in {report.scene_id}")
+        self._cache_report(report, content_hash)
+
+        return report
+
+    @property
+    def _cache_version(self) -> str:
+        """Checker version plus the options that change scene results."""
+        return f"{CHECKER_VERSION}|nlm={self.nlm is not None}|only={self.check_only}"
+
+    def _cached_report(self, content: str, scene_number: str, story_phase: int,
+                       scene_path: Path) -> Tuple[Optional[ConsistencyReport], Optional[str]]:
+        """
+        Look up a cached report for this scene content.
+
+        Returns:
+            Tuple of (cached report or None, content hash to store under on a miss)
+        """
+        if self.report_cache is None:
+            return None, None
+        content_hash = self.report_cache.content_hash(content)
+        report = self.report_cache.get(str(scene_path), content_hash, self._cache_version)
+        if report is None or report.scene_id != scene_number or report.story_phase != story_phase:
+            return None, content_hash
+
+        self.log(f"Using cached report for {scene_number}")
+        for state in report.character_states.values():
+            self.tracker.add_character_state(state)
+        for state in report.relationship_states.values():
+            self.tracker.add_relationship_state(state)
+        return report, None
+
+    def _cache_report(self, report: ConsistencyReport, content_hash: Optional[str]):
+        """Store a finished report unless it came from the cache or a Claude check failed."""
+        if self.report_cache is None or content_hash is None:
+            return
+        if report.scene_id in self._failed_scenes:
+            return
+        self.report_cache.put(report, content_hash, self._cache_version)
+
+    def _prepare_scene(self, scene_path: Path,
+                       scene_number: Optional[str] = None,
+                       story_phase: Optional[int] = None,
+                       content: Optional[str] = None
+                       ) -> Tuple[ConsistencyReport, List[Callable[[], List[ConsistencyIssue]]], Optional[str]]:
+        """
+        Run the local checks for a scene and collect its Claude checks.
+
+        Worldbuilding, voice, NotebookLM lookups and state extraction happen
+        here. The Claude calls are returned as tasks so callers can decide
+        whether to run them serially or concurrently.
+
+        Args:
+            content: Pre-read scene text; the file is read if None
+
+        Returns:
+            Tuple of (report with local issues, Claude tasks in report order,
+            content hash to cache the finished report under, if any)
+        """
         self.log(f"Checking scene: {scene_path.name}")
 
         # Parse scene ID if not provided
@@ -240,8 +725,8 @@ class Volume1ConsistencyChecker:
 
         # Read scene content
         try:
-            with open(scene_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            if content is None:
+                content = _read_scene_file(scene_path)
         except Exception as e:
             self.log(f"Error reading scene: {e}", "ERROR")
             return ConsistencyReport(
@@ -254,11 +739,16 @@ class Volume1ConsistencyChecker:
                         severity=IssueSeverity.CRITICAL,
                         description=f"Unable to read scene file",
                         scenes_affected=[scene_number],
-                        problem_details=str(e),
+                        problem_details_fmt=str(e),
                         recommendation="Check file permissions and encoding"
                     )
                 ]
-            )
+            ), [], None
+
+        # Unchanged scenes are served from the report cache
+        cached, content_hash = self._cached_report(content, scene_number, story_phase, scene_path)
+        if cached is not None:
+            return cached, [], None
 
         # Initialize report
         report = ConsistencyReport(
@@ -267,22 +757,67 @@ class Volume1ConsistencyChecker:
             story_phase=story_phase
         )
 
-        # Run all consistency checks
-        report.issues.extend(self._check_worldbuilding_mechanics(content, scene_number))
+        # Scan the text once; every check below works from these signals
+        signals = _scan_scene(content)
+
+        # Run local consistency checks
+        report.issues.extend(self._check_worldbuilding_mechanics(content, scene_number, signals))
         report.issues.extend(self._check_voice_violations(content, scene_number))
-        report.issues.extend(self._check_character_consistency(content, scene_number, story_phase))
-        report.issues.extend(self._check_backstory_consistency(content, scene_number))
+
+        llm_tasks = []
+        if self.runs_llm_checks:
+            llm_tasks.append(functools.partial(self._check_character_consistency, content, scene_number, story_phase))
+            llm_tasks.extend(self._backstory_tasks(content, scene_number, signals))
 
         # Extract character and relationship states for timeline tracking
-        self._extract_character_states(content, scene_number, story_phase, report)
-        self._extract_relationship_states(content, scene_number, story_phase, report)
+        self._extract_character_states(content, scene_number, story_phase, report, signals)
+        self._extract_relationship_states(content, scene_number, story_phase, report, signals)
 
-        self.log(f"Found {len(report.issues)} issues in {scene_number}")
+        return report, llm_tasks, content_hash
 
-        return report
+    def _llm_agent(self):
+        """Agent for the current thread (LLM pool workers use their own clone)."""
+        agent = getattr(self._thread_agents, 'agent', None)
+        return agent if agent is not None else self.agent
+
+    def _generate(self, prompt: str, max_tokens: int):
+        """
+        Send a prompt to Claude, reusing the response for a prompt already sent.
+
+        Args:
+            prompt: Full prompt text
+            max_tokens: Response token limit
 
-    def _check_worldbuilding_mechanics(self, content: str, scene_id: str) -> List[ConsistencyIssue]:
+        Returns:
+            The agent's response
+        """
+        key = (hashlib.blake2b(prompt.encode('utf-8'), digest_size=16).digest(), max_tokens)
+        with self._response_lock:
+            if key in self._response_cache:
+                self._response_cache.move_to_end(key)
+                return self._response_cache[key]
+
+        response = self._llm_agent().generate(prompt, max_tokens=max_tokens)
+
+        with self._response_lock:
+            self._response_cache[key] = response
+            self._response_cache.move_to_end(key)
+            if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+        return response
+
+    def _init_llm_worker(self, base_agent: ClaudeAgent):
+        """Give an LLM pool thread its own agent with a private conversation history."""
+        agent = copy.copy(base_agent)
+        if isinstance(getattr(agent, 'conversation_history', None), list):
+            agent.conversation_history = []
+        self._thread_agents.agent = agent
+
+    def _check_worldbuilding_mechanics(self, content: str, scene_id: str,
+                                       signals: Optional[_SceneSignals] = None) -> List[ConsistencyIssue]:
         """Check worldbuilding mechanics consistency (bi-location, implants, etc.)."""
+        if signals is None:
+            signals = _scan_scene(content)
         issues = []
 
         # Check bi-location mechanics
@@ -296,26 +831,20 @@ class Volume1ConsistencyChecker:
                     severity=IssueSeverity.CRITICAL,
                     description="Forbidden Bi-location Jargon",
                     scenes_affected=[scene_id],
-                    problem_details=f"Forbidden term found: {violation.get('term', 'unknown')}",
+                    problem_details_fmt=f"Forbidden term found: {violation.get('term', 'unknown')}",
                     recommendation=f"Replace with correct terminology: {violation.get('correct_term', 'The Line, The Tether, The Shared Vein')}"
                 ))
 
         # Check for correct bi-location terms being used
-        correct_terms = ["The Line", "The Tether", "The Shared Vein"]
-        has_bilocation_content = any(term.lower() in content.lower() for term in ["bi-location", "bilocation"])
-
-        if has_bilocation_content:
-            uses_correct_terms = any(term in content for term in correct_terms)
-
-            if not uses_correct_terms:
-                issues.append(ConsistencyIssue(
-                    category=IssueCategory.WORLDBUILDING,
-                    severity=IssueSeverity.MODERATE,
-                    description="Missing Correct Bi-location Terminology",
-                    scenes_affected=[scene_id],
-                    problem_details="Scene discusses bi-location but doesn't use correct terms",
-                    recommendation=f"Use established terms: {', '.join(correct_terms)}"
-                ))
+        if signals.missing_bilocation_terms:
+            issues.append(ConsistencyIssue(
+                category=IssueCategory.WORLDBUILDING,
+                severity=IssueSeverity.MODERATE,
+                description="Missing Correct Bi-location Terminology",
+                scenes_affected=[scene_id],
+                problem_details_fmt="Scene discusses bi-location but doesn't use correct terms",
+                recommendation=f"Use established terms: {', '.join(_CORRECT_BILOCATION_TERMS)}"
+            ))
 
         return issues
 
@@ -333,7 +862,7 @@ class Volume1ConsistencyChecker:
                     severity=IssueSeverity.MODERATE,
                     description="Voice Violation",
                     scenes_affected=[scene_id],
-                    problem_details=violation.get('message', 'Voice violation detected'),
+                    problem_details_fmt=violation.get('message', 'Voice violation detected'),
                     recommendation="Rewrite using Enhanced Mickey voice: compressed phrasing, direct metaphors, present-tense urgency"
                 ))
 
@@ -368,12 +897,12 @@ ISSUES:
 Be strict but reasonable. Only flag clear inconsistencies."""
 
         try:
-            response = self.agent.generate(analysis_prompt, max_tokens=500)
+            response = self._generate(analysis_prompt, max_tokens=500)
 
             # Parse response
             if "CONSISTENT: No" in response or "ISSUES:" in response:
                 # Extract issues
-                issue_match = re.search(r'ISSUES:\s*\n(.+)', response, re.DOTALL)
+                issue_match = _ISSUES_RE.search(response)
                 if issue_match:
                     issue_text = issue_match.group(1).strip()
 
@@ -383,36 +912,63 @@ Be strict but reasonable. Only flag clear inconsistencies."""
                             severity=IssueSeverity.MODERATE,
                             description="Character Behavior Inconsistency",
                             scenes_affected=[scene_id],
-                            problem_details=issue_text,
+                            problem_details_fmt=issue_text,
                             recommendation="Review character state and capabilities for this scene"
                         ))
 
         except Exception as e:
             self.log(f"Error in character consistency check: {e}", "ERROR")
+            self._failed_scenes.add(scene_id)
 
         return issues
 
-    def _check_backstory_consistency(self, content: str, scene_id: str) -> List[ConsistencyIssue]:
+    def _check_backstory_consistency(self, content: str, scene_id: str,
+                                     signals: Optional[_SceneSignals] = None) -> List[ConsistencyIssue]:
         """Check backstory consistency against NotebookLM canonical references."""
         issues = []
+        for task in self._backstory_tasks(content, scene_id, signals):
+            issues.extend(task())
+        return issues
 
-        # Check for character backstory mentions
-        characters = ["Sadie", "Mickey", "Noni", "Dr. Webb"]
+    def _backstory_tasks(self, content: str, scene_id: str,
+                         signals: Optional[_SceneSignals] = None) -> List[Callable[[], List[ConsistencyIssue]]]:
+        """
+        Look up canonical backstories for characters the scene touches on.
 
-        for character in characters:
-            if character.lower() in content.lower():
-                # Check for backstory keywords
-                backstory_keywords = ["history", "past", "before", "used to", "remember when", "years ago"]
+        NotebookLM queries run here (serially, so the canonical cache is
+        shared); the Claude comparisons are returned as tasks.
+        """
+        # Nothing to compare without NotebookLM or any backstory content
+        if not self.nlm:
+            return []
+        if signals is None:
+            signals = _scan_scene(content)
+        mentioned = signals.mentioned_characters
+        if not mentioned or signals.keywords.isdisjoint(_BACKSTORY_KEYWORDS):
+            return []
 
-                has_backstory = any(keyword in content.lower() for keyword in backstory_keywords)
+        tasks = []
 
-                if has_backstory and self.nlm:
-                    # Query NotebookLM for canonical backstory
-                    canonical = self.query_canonical(f"What is {character}'s canonical backstory in Volume 1?")
+        # Check for character backstory mentions
+        for character in _BACKSTORY_CHARACTERS:
+            if character in mentioned:
+                # Query NotebookLM for canonical backstory
+                canonical = self.query_canonical(f"What is {character}'s canonical backstory in Volume 1?")
+
+                if canonical:
+                    tasks.append(functools.partial(
+                        self._compare_backstory, content, scene_id, character, canonical))
+                elif canonical is None:
+                    self._failed_scenes.add(scene_id)
+
+        return tasks
+
+    def _compare_backstory(self, content: str, scene_id: str, character: str,
+                           canonical: str) -> List[ConsistencyIssue]:
+        """Use Claude to compare a scene against a character's canonical backstory."""
+        issues = []
 
-                    if canonical:
-                        # Use Claude to compare
-                        comparison_prompt = f"""Compare this scene's portrayal of {character} against the canonical backstory.
+        comparison_prompt = f"""Compare this scene's portrayal of {character} against the canonical backstory.
 
 Canonical backstory:
 {canonical[:1000]}
@@ -427,110 +983,116 @@ CONTRADICTS: [Yes/No]
 DETAILS: [Specific contradiction if Yes]
 """
 
-                        try:
-                            response = self.agent.generate(comparison_prompt, max_tokens=300)
+        try:
+            response = self._generate(comparison_prompt, max_tokens=300)
 
-                            if "CONTRADICTS: Yes" in response:
-                                details_match = re.search(r'DETAILS:\s*(.+)', response, re.DOTALL)
-                                details = details_match.group(1).strip() if details_match else "Backstory contradiction detected"
+            if "CONTRADICTS: Yes" in response:
+                details_match = _DETAILS_RE.search(response)
+                details = details_match.group(1).strip() if details_match else "Backstory contradiction detected"
 
-                                issues.append(ConsistencyIssue(
-                                    category=IssueCategory.BACKSTORY,
-                                    severity=IssueSeverity.CRITICAL,
-                                    description=f"{character} Backstory Contradiction",
-                                    scenes_affected=[scene_id],
-                                    problem_details=details,
-                                    canonical_reference=canonical[:200] + "...",
-                                    recommendation=f"Update scene to match canonical backstory from NotebookLM"
-                                ))
+                issues.append(ConsistencyIssue(
+                    category=IssueCategory.BACKSTORY,
+                    severity=IssueSeverity.CRITICAL,
+                    description=f"{character} Backstory Contradiction",
+                    scenes_affected=[scene_id],
+                    problem_details_fmt=details,
+                    canonical_reference=canonical[:200] + "...",
+                    recommendation=f"Update scene to match canonical backstory from NotebookLM"
+                ))
 
-                        except Exception as e:
-                            self.log(f"Error checking backstory: {e}", "ERROR")
+        except Exception as e:
+            self.log(f"Error checking backstory: {e}", "ERROR")
+            self._failed_scenes.add(scene_id)
 
         return issues
 
     def _extract_character_states(self, content: str, scene_id: str, story_phase: int,
-                                  report: ConsistencyReport):
+                                  report: ConsistencyReport, signals: Optional[_SceneSignals] = None):
         """Extract character states from scene for timeline tracking."""
+        if signals is None:
+            signals = _scan_scene(content)
+        keywords = signals.keywords
         # This is simplified - in production, would use more sophisticated NLP/Claude analysis
 
         # Mickey Bardot state extraction
-        if "mickey" in content.lower():
+        if "mickey" in keywords:
             state = CharacterState(
-                character_name="Mickey Bardot",
+                character_name=_MICKEY,
                 scene_id=scene_id,
                 story_phase=story_phase
             )
 
-            # Look for addiction markers
-            if "sober" in content.lower() or "sobriety" in content.lower():
-                # Try to extract sobriety count
-                sober_match = re.search(r'(\d+)\s+days?\s+sober', content.lower())
-                if sober_match:
-                    state.attributes['sobriety_days'] = int(sober_match.group(1))
+            # Look for addiction markers (sobriety count found by _scan_scene)
+            if signals.sobriety_days is not None:
+                state.attributes['sobriety_days'] = signals.sobriety_days
 
             # Look for quantum hindsight usage
-            if "quantum hindsight" in content.lower() or "implant" in content.lower():
+            if "quantum hindsight" in keywords or "implant" in keywords:
                 state.abilities.append("quantum_hindsight")
 
-            report.character_states["Mickey Bardot"] = state
+            report.character_states[_MICKEY] = state
             self.tracker.add_character_state(state)
 
         # Noni state extraction
-        if "noni" in content.lower():
+        if "noni" in keywords:
             state = CharacterState(
-                character_name="Noni",
+                character_name=_NONI,
                 scene_id=scene_id,
                 story_phase=story_phase
             )
 
             # Look for morphic resonance
-            if "morphic resonance" in content.lower():
+            if "morphic resonance" in keywords:
                 state.abilities.append("morphic_resonance")
 
                 # Try to determine range
-                if "touch" in content.lower() and "resonance" in content.lower():
+                if "touch" in keywords and "resonance" in keywords:
                     state.attributes['morphic_resonance_range'] = "touch"
-                elif "far" in content.lower() or "distance" in content.lower():
+                elif "far" in keywords or "distance" in keywords:
                     state.attributes['morphic_resonance_range'] = "far"
 
-            report.character_states["Noni"] = state
+            report.character_states[_NONI] = state
             self.tracker.add_character_state(state)
 
     def _extract_relationship_states(self, content: str, scene_id: str, story_phase: int,
-                                    report: ConsistencyReport):
+                                    report: ConsistencyReport, signals: Optional[_SceneSignals] = None):
         """Extract relationship states from scene for timeline tracking."""
+        if signals is None:
+            signals = _scan_scene(content)
+        keywords = signals.keywords
         # This is simplified - would use more sophisticated analysis in production
 
         # Mickey/Noni relationship
-        if "mickey" in content.lower() and "noni" in content.lower():
+        if "mickey" in keywords and "noni" in keywords:
             state = RelationshipState(
-                character_a="Mickey Bardot",
-                character_b="Noni",
+                character_a=_MICKEY,
+                character_b=_NONI,
                 scene_id=scene_id,
                 story_phase=story_phase,
-                relationship_type="professional/romantic",
-                dynamic="Complex, evolving",
-                trust_level="medium"  # Default, would extract from content
+                relationship_type=_MICKEY_NONI_TYPE,
+                dynamic=_MICKEY_NONI_DYNAMIC,
+                trust_level=_TRUST_MEDIUM  # Default, would extract from content
             )
 
             # Look for trust indicators
-            if "trust" in content.lower():
-                if "trust" in content.lower() and ("high" in content.lower() or "complete" in content.lower()):
-                    state.trust_level = "high"
-                elif "distrust" in content.lower() or "don't trust" in content.lower():
-                    state.trust_level = "low"
+            if "trust" in keywords:
+                if "trust" in keywords and ("high" in keywords or "complete" in keywords):
+                    state.trust_level = _TRUST_HIGH
+                elif "distrust" in keywords or "don't trust" in keywords:
+                    state.trust_level = _TRUST_LOW
 
-            report.relationship_states["Mickey Bardot ↔ Noni"] = state
+            report.relationship_states[_MICKEY_NONI] = state
             self.tracker.add_relationship_state(state)
 
-    def check_volume(self, volume_path: Path, output_path: Optional[Path] = None) -> VolumeConsistencyReport:
+    def check_volume(self, volume_path: Path, output_path: Optional[Path] = None,
+                     also_json: bool = False) -> VolumeConsistencyReport:
         """
         Check entire Volume 1 for consistency.
 
         Args:
             volume_path: Path to Volume 1 directory
             output_path: Optional path to save report
+            also_json: With a .md output_path, also write a .json report beside it
 
         Returns:
             VolumeConsistencyReport with all issues found
@@ -542,6 +1104,8 @@ DETAILS: [Specific contradiction if Yes]
             volume_path=str(volume_path)
         )
 
+        volume_scene_files = []
+
         # Scan all acts
         for act in self.VOLUME_1_ACTS:
             if act in ["A FRONT_MATTER", "BACK_MATTER"]:
@@ -554,30 +1118,30 @@ DETAILS: [Specific contradiction if Yes]
 
             self.log(f"Scanning {act}...")
 
-            # Find all scene files
-            scene_files = []
-            for pattern in ["**/*.md", "**/*.markdown"]:
-                scene_files.extend(act_path.glob(pattern))
-
-            # Filter out Archive directories
-            scene_files = [f for f in scene_files if "Archive" not in str(f) and "archive" not in str(f)]
+            # Find all scene files (Archive directories are pruned during the walk)
+            scene_files = [] if _is_archive(str(act_path)) else list(_iter_scene_files(act_path))
 
             self.log(f"Found {len(scene_files)} scenes in {act}")
+            volume_scene_files.extend(sorted(scene_files))
+
+        # Read every scene up front; the reads overlap instead of running one by one
+        scene_texts = self._read_scenes(volume_scene_files)
 
-            # Check each scene
-            for scene_file in sorted(scene_files):
-                try:
-                    report = self.check_scene(scene_file)
-                    volume_report.scene_reports.append(report)
-                    volume_report.scenes_checked += 1
+        # Check each scene locally; Claude checks are queued for later
+        scene_checks = []
+        for scene_file, content in zip(volume_scene_files, scene_texts):
+            try:
+                scene_checks.append(self._prepare_scene(scene_file, content=content))
 
-                    # Collect issues by severity
-                    volume_report.critical_issues.extend(report.critical_issues)
-                    volume_report.moderate_issues.extend(report.moderate_issues)
-                    volume_report.minor_issues.extend(report.minor_issues)
+            except Exception as e:
+                self.log(f"Error checking scene {scene_file}: {e}", "ERROR")
 
-                except Exception as e:
-                    self.log(f"Error checking scene {scene_file}: {e}", "ERROR")
+        # Run the queued Claude checks (network-bound, so concurrently)
+        self._run_llm_tasks(scene_checks)
+        for report, _, content_hash in scene_checks:
+            self.log(f"Found {len(report.issues)} issues in {report.scene_id}")
+            self._cache_report(report, content_hash)
+            volume_report.add_scene_report(report)
 
         # Run cross-scene consistency checks using tracker
         self.log("Running cross-scene consistency checks...")
@@ -591,9 +1155,9 @@ DETAILS: [Specific contradiction if Yes]
 
         # Generate relationship timelines
         relationships = [
-            ("Mickey Bardot", "Noni"),
-            ("Mickey Bardot", "Sadie"),
-            ("Mickey Bardot", "Dr. Webb")
+            (_MICKEY, _NONI),
+            (_MICKEY, _SADIE),
+            (_MICKEY, _WEBB)
         ]
 
         for char_a, char_b in relationships:
@@ -604,30 +1168,70 @@ DETAILS: [Specific contradiction if Yes]
 
         # Save report if output path provided
         if output_path:
-            self._save_report(volume_report, output_path)
+            self._save_report(volume_report, output_path, also_json)
 
         self.log(f"Volume check complete: {volume_report.total_issues} issues found")
 
         return volume_report
 
+    @staticmethod
+    def _read_scene_text(scene_path: Path) -> Optional[str]:
+        """Read a scene file, or None if it can't be read (_prepare_scene reports the error)."""
+        try:
+            return _read_scene_file(scene_path)
+        except Exception:
+            return None
+
+    def _read_scenes(self, scene_files: List[Path]) -> List[Optional[str]]:
+        """Read scene files concurrently, returning their text in input order."""
+        if len(scene_files) <= 1:
+            return [self._read_scene_text(path) for path in scene_files]
+
+        with ThreadPoolExecutor(max_workers=min(32, len(scene_files))) as executor:
+            return list(executor.map(self._read_scene_text, scene_files))
+
+    def _run_llm_tasks(self, scene_checks: List[Tuple[ConsistencyReport, List[Callable], Optional[str]]]):
+        """
+        Run every scene's queued Claude checks and attach the issues.
+
+        Issues are appended to each report in task order, so the result is
+        the same as running check_scene scene by scene.
+        """
+        tasks = [(report, task) for report, llm_tasks, _ in scene_checks for task in llm_tasks]
+        if not tasks:
+            return
+
+        if self.llm_workers <= 1 or len(tasks) == 1:
+            results = [task() for _, task in tasks]
+        else:
+            self.log(f"Running {len(tasks)} Claude checks with {self.llm_workers} workers...")
+            # Create the shared agent here, not lazily from racing worker threads
+            base_agent = self.agent
+            with ThreadPoolExecutor(max_workers=self.llm_workers,
+                                    initializer=self._init_llm_worker,
+                                    initargs=(base_agent,)) as executor:
+                results = list(executor.map(lambda item: item[1](), tasks))
+
+        for (report, _), issues in zip(tasks, results):
+            report.issues.extend(issues)
+
     def _check_timeline_consistency(self, volume_report: VolumeConsistencyReport):
         """Run timeline consistency checks across all scenes."""
-        # Check character timelines
-        for character in self.tracker.known_characters:
-            issues = self.tracker.check_character_consistency(character)
-            volume_report.moderate_issues.extend(issues)
-
-        # Check relationship timelines
+        # Check character and relationship timelines. A volume's timelines
+        # are small, and forking this process (LLM threads, sqlite
+        # connections, the NotebookLM subprocess) would cost far more than
+        # the checks themselves, so they run in-process.
         relationships = [
-            ("Mickey Bardot", "Noni"),
-            ("Mickey Bardot", "Sadie")
+            (_MICKEY, _NONI),
+            (_MICKEY, _SADIE)
         ]
 
-        for char_a, char_b in relationships:
-            issues = self.tracker.check_relationship_consistency(char_a, char_b)
-            volume_report.moderate_issues.extend(issues)
+        issues = self.tracker.check_all(self.tracker.known_characters, relationships,
+                                        max_workers=1)
+        volume_report.moderate_issues.extend(issues)
 
-    def _save_report(self, report: VolumeConsistencyReport, output_path: Path):
+    def _save_report(self, report: VolumeConsistencyReport, output_path: Path,
+                     also_json: bool = False):
         """Save consistency report to file."""
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -639,17 +1243,18 @@ DETAILS: [Specific contradiction if Yes]
 
             self.log(f"Saved markdown report: {output_path}")
 
-            # Also save JSON version
-            json_path = output_path.with_suffix('.json')
-            with open(json_path, 'w') as f:
-                json.dump(report.to_dict(), f, indent=2)
+            # Also save JSON version if requested
+            if also_json:
+                json_path = output_path.with_suffix('.json')
+                with open(json_path, 'wb') as f:
+                    write_json(report, f, indent=True)
 
-            self.log(f"Saved JSON report: {json_path}")
+                self.log(f"Saved JSON report: {json_path}")
 
         # Save JSON report
         elif output_path.suffix == '.json':
-            with open(output_path, 'w') as f:
-                json.dump(report.to_dict(), f, indent=2)
+            with open(output_path, 'wb') as f:
+                write_json(report, f, indent=True)
 
             self.log(f"Saved JSON report: {output_path}")
 
@@ -697,6 +1302,8 @@ Examples:
 
     parser.add_argument('--volume', help="Check entire volume directory")
     parser.add_argument('--output', help="Output report path (.md or .json)")
+    parser.add_argument('--also-json', action='store_true',
+                       help="With a .md --output, also write the JSON report beside it")
 
     parser.add_argument('--check-only', choices=['characters', 'relationships', 'worldbuilding', 'timeline'],
                        help="Check only specific category")
@@ -704,6 +1311,15 @@ Examples:
     parser.add_argument('--no-nlm', action='store_true',
                        help="Skip NotebookLM queries (faster, but less thorough)")
 
+    parser.add_argument('--nlm-server', action='store_true',
+                       help="Run one NotebookLM query process for all questions (script must support --server)")
+
+    parser.add_argument('--llm-workers', type=int, default=8,
+                       help="Concurrent Claude calls when checking a volume (default: 8, 1 = serial)")
+
+    parser.add_argument('--no-cache', action='store_true',
+                       help="Re-check every scene instead of reusing reports for unchanged scenes")
+
     parser.add_argument('--verbose', action='store_true',
                        help="Enable verbose logging")
 
@@ -717,14 +1333,25 @@ Examples:
     nlm = None
     if not args.no_nlm:
         try:
-            nlm = NotebookLMInterface()
+            nlm = NotebookLMInterface(server_mode=args.nlm_server)
             print("✓ NotebookLM interface initialized")
         except Exception as e:
             print(f"⚠️  NotebookLM not available: {e}")
             print("Continuing without canonical reference checks...")
 
+    # Open the scene report cache
+    report_cache = None
+    if not args.no_cache:
+        try:
+            report_cache = SceneReportCache()
+        except Exception as e:
+            print(f"⚠️  Scene report cache not available: {e}")
+
     # Initialize checker
-    checker = Volume1ConsistencyChecker(nlm_interface=nlm, verbose=args.verbose)
+    checker = Volume1ConsistencyChecker(nlm_interface=nlm, verbose=args.verbose,
+                                        llm_workers=args.llm_workers,
+                                        check_only=args.check_only,
+                                        report_cache=report_cache)
 
     # Check single scene
     if args.scene:
@@ -769,7 +1396,7 @@ Examples:
 
         output_path = Path(args.output) if args.output else None
 
-        report = checker.check_volume(volume_path, output_path)
+        report = checker.check_volume(volume_path, output_path, also_json=args.also_json)
 
         print("\n" + "=" * 80)
         print(f"VOLUME 1 CONSISTENCY REPORT")
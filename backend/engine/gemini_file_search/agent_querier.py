@@ -5,13 +5,277 @@ Natural language semantic search across all story documents.
 Enables agents to query by meaning, not file paths.
 """
 
+import functools
+import hashlib
+import heapq
+import json
+import logging
+import math
 import os
-from typing import List, Optional, Dict, Any
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Tuple
 from google import genai
 from google.genai import types
 
 from .config import GeminiFileSearchConfig
 
+logger = logging.getLogger(__name__)
+
+# Faster cache-key and citation serialization (optional, pip install orjson)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Vectorized similarity scan for the semantic cache (optional, pip install numpy)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Approximate nearest-neighbour search for large semantic caches (optional,
+# pip install hnswlib; requires numpy)
+try:
+    import hnswlib
+    HNSWLIB_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    HNSWLIB_AVAILABLE = False
+
+QUERY_CACHE_SIZE = 512
+CONTEXT_CACHE_SIZE = 256
+EMBEDDING_MODEL = "text-embedding-004"
+SEMANTIC_CACHE_THRESHOLD = 0.95
+# Entries per semantic-cache partition; a numpy scan stays cheap far longer,
+# and an HNSW index takes over from the scan past ANN_THRESHOLD entries
+ANN_THRESHOLD = 4096
+if HNSWLIB_AVAILABLE:
+    SEMANTIC_CACHE_SIZE = 100_000
+elif NUMPY_AVAILABLE:
+    SEMANTIC_CACHE_SIZE = ANN_THRESHOLD
+else:
+    SEMANTIC_CACHE_SIZE = QUERY_CACHE_SIZE
+SCENE_PREFETCH_NEIGHBORS = 3
+
+# JSON fields requested by get_characters_context(), with display labels
+CHARACTER_FIELDS = (
+    ('psychological_state', 'Psychological state'),
+    ('capabilities', 'Capabilities and limitations'),
+    ('relationships', 'Key relationships'),
+    ('recent_arc', 'Recent developments'),
+    ('voice', 'Voice and personality'),
+)
+
+
+# Section divider and headings used by format_context_for_agent()
+_DIV = "=" * 80
+_CONTEXT_SECTIONS = (
+    ('worldbuilding', "WORLDBUILDING & MECHANICS:"),
+    ('recent_chapters', "RECENT CHAPTERS (For Continuity):"),
+    ('related_scenes', "RELATED SCENES (For Reference):"),
+)
+
+
+def _dumps(obj: Any) -> bytes:
+    """
+    Serialize to compact, key-sorted JSON bytes (same output either way).
+
+    Values JSON can't represent (such as SDK citation source objects) are
+    written as their str().
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(
+        obj, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str
+    ).encode('utf-8')
+
+
+def _loads(data: Any) -> Any:
+    """Parse JSON from str or bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=64)
+def _build_metadata_filter(volume: Optional[int],
+                           story_phase: Optional[int],
+                           categories: Tuple[str, ...],
+                           canon_only: bool) -> Optional[str]:
+    """
+    Build the metadata filter string for a query.
+
+    Helpers reuse a handful of filter combinations, so the strings are cached.
+
+    Args:
+        volume: Filter by volume
+        story_phase: Filter by story phase
+        categories: Categories to match (any of)
+        canon_only: Only match canon/final versions
+
+    Returns:
+        Filter expression, or None if no filters apply
+    """
+    filters = []
+
+    if volume is not None:
+        filters.append(f'volume={volume}')
+
+    if story_phase is not None:
+        filters.append(f'story_phase={story_phase}')
+
+    if categories:
+        cat_filters = ' OR '.join([f'category="{cat}"' for cat in categories])
+        filters.append(f'({cat_filters})')
+
+    if canon_only:
+        filters.append('(status="canon" OR status="final")')
+
+    return ' AND '.join(filters) if filters else None
+
+
+@functools.lru_cache(maxsize=64)
+def _filter_part(metadata_filter: str) -> types.Part:
+    """Content part carrying a metadata filter, shared across queries."""
+    return types.Part(text=f"Search filters: {metadata_filter}")
+
+
+def _field_text(value: Any) -> str:
+    """Flatten a JSON field value into prompt text."""
+    if isinstance(value, list):
+        return "; ".join(_field_text(v) for v in value)
+    if isinstance(value, dict):
+        return "; ".join(f"{k}: {_field_text(v)}" for k, v in value.items())
+    return str(value)
+
+
+class _EmbeddingIndex:
+    """
+    Unit-normalized embeddings with payloads, searched by cosine similarity.
+
+    Entries sit in a ring of max_size slots: a new entry takes the slot of
+    the oldest one, and a repeated key overwrites its own slot in place.
+    With numpy the vectors live in one float32 matrix (grown by doubling up
+    to max_size), so a search is a single BLAS matrix-vector product;
+    without it, a pure-Python dot-product scan. With hnswlib, an HNSW graph
+    is built once the index passes ANN_THRESHOLD entries; it then holds the
+    vectors in place of the matrix and answers searches in roughly log(N).
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.keys: List[Any] = []
+        self.payloads: List[Any] = []
+        self._vectors: List[List[float]] = []
+        self._matrix = None
+        self._rows: Dict[Any, int] = {}
+        # Slot the next new entry goes to once the ring is full
+        self._next = 0
+        # HNSW labels are the slot numbers
+        self._ann = None
+
+    def _build_ann(self):
+        """Index the current rows in an HNSW graph."""
+        n = len(self.keys)
+        self._ann = hnswlib.Index(space='cosine', dim=self._matrix.shape[1])
+        self._ann.init_index(max_elements=self.max_size, ef_construction=200, M=16)
+        self._ann.set_ef(64)
+        self._ann.add_items(self._matrix[:n], np.arange(n))
+        # The graph holds the vectors from here on
+        self._matrix = None
+
+    def _store(self, i: int, vector: List[float]):
+        """Write a vector into slot i."""
+        if self._ann is not None:
+            self._ann.add_items(np.asarray([vector], dtype=np.float32), [i])
+        elif NUMPY_AVAILABLE:
+            n = len(self.keys)
+            if self._matrix is None or i == len(self._matrix):
+                grown = np.empty(
+                    (min(max(2 * n, 16), self.max_size), len(vector)), dtype=np.float32
+                )
+                if n:
+                    grown[:n] = self._matrix[:n]
+                self._matrix = grown
+            self._matrix[i] = vector
+        elif i == len(self._vectors):
+            self._vectors.append(vector)
+        else:
+            self._vectors[i] = vector
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def add(self, key: Any, vector: List[float], payload: Any):
+        """
+        Insert an entry, replacing any entry with the same (non-None) key.
+
+        Evicts the oldest entry once max_size is exceeded.
+        """
+        i = self._rows.get(key) if key is not None else None
+        if i is not None:
+            self.payloads[i] = payload
+            self._store(i, vector)
+            return
+
+        if len(self.keys) < self.max_size:
+            i = len(self.keys)
+            self._store(i, vector)
+            self.keys.append(key)
+            self.payloads.append(payload)
+        else:
+            i = self._next
+            self._next = (i + 1) % self.max_size
+            evicted = self.keys[i]
+            if evicted is not None:
+                del self._rows[evicted]
+            self._store(i, vector)
+            self.keys[i] = key
+            self.payloads[i] = payload
+        if key is not None:
+            self._rows[key] = i
+
+        if self._ann is None and HNSWLIB_AVAILABLE and len(self.keys) > ANN_THRESHOLD:
+            self._build_ann()
+
+    def search(self, vector: List[float], k: int = 1) -> List[Tuple[float, Any, Any]]:
+        """
+        Find the k most similar entries.
+
+        Returns:
+            (similarity, key, payload) tuples, most similar first
+        """
+        n = len(self.keys)
+        if not n:
+            return []
+
+        if self._ann is not None:
+            labels, distances = self._ann.knn_query(
+                np.asarray([vector], dtype=np.float32), k=min(k, n)
+            )
+            # Cosine space reports distance as 1 - similarity
+            return [(1.0 - float(d), self.keys[i], self.payloads[i])
+                    for i, d in zip(map(int, labels[0]), distances[0])]
+
+        if NUMPY_AVAILABLE:
+            scores = self._matrix[:n] @ np.asarray(vector, dtype=np.float32)
+            if k == 1:
+                best = [int(scores.argmax())]
+            else:
+                best = heapq.nlargest(k, range(n), key=scores.__getitem__)
+            return [(float(scores[i]), self.keys[i], self.payloads[i]) for i in best]
+
+        scores = [sum(a * b for a, b in zip(v, vector)) for v in self._vectors]
+        best = heapq.nlargest(k, range(n), key=scores.__getitem__)
+        return [(scores[i], self.keys[i], self.payloads[i]) for i in best]
+
 
 class ExplantsKnowledgeGraph:
     """
@@ -23,10 +287,63 @@ class ExplantsKnowledgeGraph:
     - "Show Mickey and Noni's relationship evolution"
     """
 
+    DEFAULT_CACHE_PATH = "~/.cache/explants/gemini_kg.sqlite"
+
+    # Static helper instructions, sent as system_instruction so only the
+    # per-call arguments travel in the contents
+    _CHAR_SYS_INSTRUCTION = """Provide a comprehensive summary of the named character's:
+1. Current psychological state and motivations
+2. Capabilities and limitations
+3. Key relationships with other characters
+4. Recent developments and character arc
+5. Voice and personality traits
+
+Focus on their current state in the story."""
+
+    _CHARS_JSON_SYS_INSTRUCTION = (
+        "Provide the following fields as a JSON object keyed by character name:\n"
+        + ", ".join(field for field, _ in CHARACTER_FIELDS)
+        + "\n\nFocus on their current state in the story."
+    )
+
+    _WORLDBUILDING_SYS_INSTRUCTION = """Explain the named worldbuilding concepts.
+
+Include:
+1. Core mechanics and how they work
+2. Rules and limitations
+3. How characters experience them
+4. Current state in the story
+5. Relevant examples from scenes"""
+
+    _RECENT_CHAPTERS_SYS_INSTRUCTION = """Summarize the requested number of most recent chapters.
+
+For each chapter, include:
+1. Major events and plot developments
+2. Character developments and decisions
+3. Themes explored
+4. Key scenes and moments
+5. Plot threads continued or resolved"""
+
+    _RELATED_SCENES_SYS_INSTRUCTION = """Find scenes similar to the given scene outline.
+
+Show scenes that:
+1. Feature the same characters
+2. Explore similar themes or conflicts
+3. Reference related events
+4. Use similar worldbuilding mechanics
+5. Match the emotional tone
+
+For each scene, briefly describe what makes it relevant."""
+
     def __init__(self,
                  store_id: Optional[str] = None,
                  config: Optional[GeminiFileSearchConfig] = None,
-                 model: str = "gemini-2.0-flash-exp"):
+                 model: str = "gemini-2.0-flash-exp",
+                 cache_enabled: bool = True,
+                 cache_path: Optional[str] = DEFAULT_CACHE_PATH,
+                 cache_ttl: Optional[int] = None,
+                 prefetch_recent_chapters: bool = True,
+                 prefetch_similar_scenes: bool = False):
         """
         Initialize knowledge graph querier.
 
@@ -34,6 +351,14 @@ class ExplantsKnowledgeGraph:
             store_id: File Search store ID (from config if None)
             config: Configuration instance
             model: Gemini model to use
+            cache_enabled: Reuse answers for repeated or near-identical questions
+            cache_path: SQLite file for answers persisted across runs (None disables)
+            cache_ttl: Seconds before a persisted answer expires (None = never)
+            prefetch_recent_chapters: Fetch the recent-chapter summary in the
+                background now, since every scene context needs it
+            prefetch_similar_scenes: When building a scene context, warm the
+                character and worldbuilding context used by the most similar
+                earlier scenes (speculative; costs extra requests)
         """
         self.config = config or GeminiFileSearchConfig()
 
@@ -50,13 +375,379 @@ class ExplantsKnowledgeGraph:
 
         self.client = genai.Client(api_key=self.config.get_google_api_key())
 
+        # Generation configs are constant per response type; build each once
+        self._generation_configs: Dict[tuple, types.GenerateContentConfig] = {}
+
+        # L1: exact (question, filter, model, response type) hits. L2:
+        # embedding similarity, partitioned by (filter, model, json_response)
+        # so a filter or response-type change is never a hit.
+        self.cache_enabled = cache_enabled
+        self._l1: OrderedDict = OrderedDict()
+        self._l2: Dict[Tuple[Optional[str], str, bool], _EmbeddingIndex] = {}
+        self._cache_lock = threading.Lock()
+
+        # Memoized helper answers keyed by their (small, hashable) arguments
+        self._context_cache: OrderedDict = OrderedDict()
+        self.cache_stats = {'hits': 0, 'misses': 0}
+
+        self.cache_ttl = cache_ttl
+        self._cache_db: Optional[sqlite3.Connection] = None
+        self._answer_dir: Optional[Path] = None
+        if cache_enabled and cache_path is not None:
+            self._cache_db = self._init_cache_db(cache_path)
+
+        # Recent chapters don't depend on the scene; warm the memoized answer
+        # while the caller is still setting up
+        self._recent_chapters_ready = threading.Event()
+        self._recent_chapters_ready.set()
+        if cache_enabled and prefetch_recent_chapters:
+            self._prefetch_recent_chapters(refresh=False)
+
+        # Outline embeddings of scenes built so far, with their characters,
+        # topics and phase, for speculative prefetch of the next scene's context
+        self.prefetch_similar_scenes = cache_enabled and prefetch_similar_scenes
+        self._scene_index = _EmbeddingIndex(QUERY_CACHE_SIZE)
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+
+    def _generation_config(self,
+                           json_response: bool = False,
+                           system_instruction: Optional[str] = None) -> types.GenerateContentConfig:
+        """
+        Get the (shared) generation config for a query.
+
+        The API rejects a JSON response MIME type combined with tools, so a
+        JSON query is sent without the search retrieval tool.
+
+        Args:
+            json_response: Ask the model for a JSON answer
+            system_instruction: Static instructions sent outside the contents
+
+        Returns:
+            GenerateContentConfig reused across queries
+        """
+        key = (json_response, system_instruction)
+        config = self._generation_configs.get(key)
+        if config is None:
+            tools = None
+            if not json_response:
+                tools = [
+                    types.Tool(
+                        google_search_retrieval=types.GoogleSearchRetrieval(
+                            dynamic_retrieval_config=types.DynamicRetrievalConfig(
+                                mode="MODE_DYNAMIC",
+                                dynamic_threshold=0.3
+                            )
+                        )
+                    )
+                ]
+            config = types.GenerateContentConfig(
+                tools=tools,
+                response_modalities=["TEXT"],
+                response_mime_type="application/json" if json_response else None,
+                system_instruction=system_instruction,
+                temperature=0.3  # Lower for more factual responses
+            )
+            self._generation_configs[key] = config
+        return config
+
+    def _init_cache_db(self, cache_path: str) -> Optional[sqlite3.Connection]:
+        """
+        Open the persistent answer cache and load its semantic entries.
+
+        The SQLite file indexes entries (citations, embeddings, timestamps);
+        answer bodies, which can run to tens of KB, live in one file per hash
+        next to it and are read back on a hit.
+
+        Args:
+            cache_path: SQLite file path
+
+        Returns:
+            Open connection, or None if the cache can't be used
+        """
+        try:
+            path = Path(cache_path).expanduser()
+            answer_dir = path.parent / f"{path.stem}_answers"
+            answer_dir.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(str(path), check_same_thread=False)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS exact("
+                "hash TEXT PRIMARY KEY, citations BLOB, ts INTEGER)"
+            )
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS semantic("
+                "hash TEXT PRIMARY KEY, partition BLOB, embedding BLOB, "
+                "citations BLOB, ts INTEGER)"
+            )
+            if self.cache_ttl is not None:
+                cutoff = int(time.time()) - self.cache_ttl
+                expired = db.execute(
+                    "SELECT hash FROM exact WHERE ts < ? "
+                    "UNION SELECT hash FROM semantic WHERE ts < ?", (cutoff, cutoff)
+                ).fetchall()
+                db.execute("DELETE FROM exact WHERE ts < ?", (cutoff,))
+                db.execute("DELETE FROM semantic WHERE ts < ?", (cutoff,))
+                for (key,) in expired:
+                    still_used = db.execute(
+                        "SELECT 1 FROM exact WHERE hash = ? "
+                        "UNION SELECT 1 FROM semantic WHERE hash = ?", (key, key)
+                    ).fetchone()
+                    if still_used is None:
+                        (answer_dir / f"{key}.txt").unlink(missing_ok=True)
+            db.commit()
+
+            rows = db.execute(
+                "SELECT hash, partition, embedding, citations FROM semantic ORDER BY ts"
+            ).fetchall()
+        except (OSError, sqlite3.Error):
+            # Cache is an optimization; run with the in-memory layers only
+            return None
+
+        self._answer_dir = answer_dir
+        for key, partition_json, blob, citations in rows:
+            # Rows written before json_response joined the partition are prose
+            metadata_filter, model, *json_response = _loads(partition_json)
+            partition = (metadata_filter, model, bool(json_response and json_response[0]))
+            embedding = array('f')
+            embedding.frombytes(blob)
+            index = self._l2.get(partition)
+            if index is None:
+                index = self._l2[partition] = _EmbeddingIndex(SEMANTIC_CACHE_SIZE)
+            index.add(key, embedding.tolist(), {
+                'answer': None,
+                'citations': _loads(citations),
+                'query': None,
+                'filters': metadata_filter,
+                'model': model
+            })
+
+        return db
+
+    def _read_answer(self, key: str) -> Optional[str]:
+        """Read a persisted answer body (None if missing or unreadable)."""
+        try:
+            return (self._answer_dir / f"{key}.txt").read_bytes().decode('utf-8')
+        except (OSError, ValueError):
+            return None
+
+    def _write_answer(self, key: str, answer: str):
+        """Write an answer body atomically (raises OSError on failure)."""
+        path = self._answer_dir / f"{key}.txt"
+        tmp = path.with_suffix('.tmp')
+        tmp.write_bytes(answer.encode('utf-8'))
+        os.replace(tmp, path)
+
+    def _persisted_result(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up an exact-match answer from a previous run."""
+        if self._cache_db is None:
+            return None
+        try:
+            row = self._cache_db.execute(
+                "SELECT citations, ts FROM exact WHERE hash = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        citations, ts = row
+        if self.cache_ttl is not None and time.time() - ts > self.cache_ttl:
+            return None
+        answer = self._read_answer(key)
+        if answer is None:
+            return None
+        return {'answer': answer, 'citations': _loads(citations)}
+
+    def _persist_result(self,
+                        key: str,
+                        partition: Tuple[Optional[str], str, bool],
+                        embedding: Optional[List[float]],
+                        result: Dict[str, Any]):
+        """Write a result to the persistent cache (caller holds the lock)."""
+        if self._cache_db is None:
+            return
+        now = int(time.time())
+        try:
+            citations = _dumps(result['citations'])
+            self._write_answer(key, result['answer'])
+            self._cache_db.execute(
+                "INSERT OR REPLACE INTO exact (hash, citations, ts) VALUES (?, ?, ?)",
+                (key, citations, now)
+            )
+            if embedding is not None:
+                self._cache_db.execute(
+                    "INSERT OR REPLACE INTO semantic "
+                    "(hash, partition, embedding, citations, ts) VALUES (?, ?, ?, ?, ?)",
+                    (key, _dumps(partition), array('f', embedding).tobytes(),
+                     citations, now)
+                )
+            self._cache_db.commit()
+        except (OSError, sqlite3.Error, TypeError, ValueError):
+            # Persisting is an optimization; the answer is still cached in memory
+            pass
+
+    def clear_cache(self):
+        """Drop all cached answers and reset the hit/miss counters."""
+        with self._cache_lock:
+            self._l1.clear()
+            self._l2.clear()
+            self._context_cache.clear()
+            self.cache_stats = {'hits': 0, 'misses': 0}
+            if self._cache_db is not None:
+                try:
+                    self._cache_db.execute("DELETE FROM exact")
+                    self._cache_db.execute("DELETE FROM semantic")
+                    self._cache_db.commit()
+                    for path in self._answer_dir.glob("*.txt"):
+                        path.unlink(missing_ok=True)
+                except (OSError, sqlite3.Error):
+                    pass
+
+    def close(self):
+        """
+        Stop speculative prefetching and close the persistent cache.
+
+        Queued prefetches are cancelled rather than waited on, so exiting
+        doesn't block on Gemini requests nobody asked for. The in-memory
+        cache layers keep working after close().
+        """
+        self.prefetch_similar_scenes = False
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+        with self._cache_lock:
+            if self._cache_db is not None:
+                self._cache_db.close()
+                self._cache_db = None
+
+    def __enter__(self) -> 'ExplantsKnowledgeGraph':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _cached_answer(self, key: tuple, refresh: bool = False, **query_kwargs) -> str:
+        """
+        Answer a helper query, reusing the previous answer for the same key.
+
+        Args:
+            key: Hashable helper arguments identifying the query
+            refresh: Skip cached answers and re-query
+            **query_kwargs: Arguments passed through to query()
+
+        Returns:
+            Answer text
+        """
+        if self.cache_enabled and not refresh:
+            with self._cache_lock:
+                answer = self._context_cache.get(key)
+                if answer is not None:
+                    self._context_cache.move_to_end(key)
+                    self.cache_stats['hits'] += 1
+                    return answer
+                self.cache_stats['misses'] += 1
+
+        result = self.query(refresh=refresh, **query_kwargs)
+
+        if 'error' not in result:
+            self._remember_answer(key, result['answer'])
+
+        return result['answer']
+
+    def _remember_answer(self, key: tuple, answer: str):
+        """Memoize a helper answer under key."""
+        if not self.cache_enabled:
+            return
+        with self._cache_lock:
+            self._context_cache[key] = answer
+            while len(self._context_cache) > CONTEXT_CACHE_SIZE:
+                self._context_cache.popitem(last=False)
+
+    def _cache_key(self,
+                   question: str,
+                   metadata_filter: Optional[str],
+                   system_instruction: Optional[str] = None,
+                   json_response: bool = False) -> str:
+        """Hash a query into its exact-match cache key."""
+        query = {'question': question, 'filter': metadata_filter, 'model': self.model}
+        if system_instruction is not None:
+            query['system_instruction'] = system_instruction
+        if json_response:
+            query['json_response'] = True
+        return hashlib.sha256(_dumps(query)).hexdigest()
+
+    def _embed(self, question: str) -> Optional[List[float]]:
+        """
+        Embed a question for the semantic cache.
+
+        Args:
+            question: Question text
+
+        Returns:
+            Unit-normalized embedding, or None if embedding failed
+        """
+        try:
+            response = self.client.models.embed_content(
+                model=EMBEDDING_MODEL,
+                contents=question
+            )
+            values = list(response.embeddings[0].values)
+        except Exception:
+            return None
+
+        norm = math.sqrt(sum(v * v for v in values))
+        if not norm:
+            return None
+        return [v / norm for v in values]
+
+    def _semantic_lookup(self,
+                         partition: Tuple[Optional[str], str, bool],
+                         embedding: List[float]) -> Optional[Dict[str, Any]]:
+        """Return the cached result most similar to embedding, if close enough."""
+        index = self._l2.get(partition)
+        if index is None:
+            return None
+
+        for score, key, result in index.search(embedding):
+            if score < SEMANTIC_CACHE_THRESHOLD:
+                return None
+            if result['answer'] is None:
+                # Persisted entries load their answer body on first hit
+                answer = self._read_answer(key)
+                if answer is None:
+                    return None
+                result['answer'] = answer
+            return result
+        return None
+
+    def _cache_store(self,
+                     key: str,
+                     partition: Tuple[Optional[str], str, bool],
+                     embedding: Optional[List[float]],
+                     result: Dict[str, Any]):
+        """Insert a result into L1 and, when embedded, into L2."""
+        with self._cache_lock:
+            self._l1[key] = result
+            self._l1.move_to_end(key)
+            while len(self._l1) > QUERY_CACHE_SIZE:
+                self._l1.popitem(last=False)
+            self._persist_result(key, partition, embedding, result)
+
+            if embedding is None:
+                return
+            index = self._l2.get(partition)
+            if index is None:
+                index = self._l2[partition] = _EmbeddingIndex(SEMANTIC_CACHE_SIZE)
+            # A refreshed answer replaces (rather than shadows) the old one
+            index.add(key, embedding, result)
+
     def query(self,
               question: str,
               volume: Optional[int] = None,
               story_phase: Optional[int] = None,
               categories: Optional[List[str]] = None,
               canon_only: bool = False,
-              max_results: int = 10) -> Dict[str, Any]:
+              max_results: int = 10,
+              json_response: bool = False,
+              refresh: bool = False,
+              system_instruction: Optional[str] = None) -> Dict[str, Any]:
         """
         Query the knowledge graph with natural language.
 
@@ -67,6 +758,11 @@ class ExplantsKnowledgeGraph:
             categories: Filter by category (character, worldbuilding, scene, etc.)
             canon_only: Only query canon/final versions
             max_results: Maximum chunks to retrieve
+            json_response: Ask the model for a JSON answer
+            refresh: Skip cached answers (the new answer is still cached)
+            system_instruction: Static instructions for templated queries. These
+                queries only differ by their arguments, so they are cached by
+                exact match only, never by embedding similarity.
 
         Returns:
             Dictionary with:
@@ -75,23 +771,40 @@ class ExplantsKnowledgeGraph:
             - query: Original question
             - filters: Applied metadata filters
         """
-        # Build metadata filter
-        filters = []
-
-        if volume is not None:
-            filters.append(f'volume={volume}')
-
-        if story_phase is not None:
-            filters.append(f'story_phase={story_phase}')
-
-        if categories:
-            cat_filters = ' OR '.join([f'category="{cat}"' for cat in categories])
-            filters.append(f'({cat_filters})')
-
-        if canon_only:
-            filters.append('(status="canon" OR status="final")')
+        metadata_filter = _build_metadata_filter(
+            volume, story_phase, tuple(categories or ()), canon_only
+        )
 
-        metadata_filter = ' AND '.join(filters) if filters else None
+        if self.cache_enabled:
+            key = self._cache_key(question, metadata_filter, system_instruction, json_response)
+            partition = (metadata_filter, self.model, json_response)
+            embedding = None
+
+            if not refresh:
+                with self._cache_lock:
+                    cached = self._l1.get(key)
+                    if cached is not None:
+                        self._l1.move_to_end(key)
+                    else:
+                        persisted = self._persisted_result(key)
+                        if persisted is not None:
+                            cached = dict(persisted, query=question,
+                                          filters=metadata_filter, model=self.model)
+                            self._l1[key] = cached
+                            while len(self._l1) > QUERY_CACHE_SIZE:
+                                self._l1.popitem(last=False)
+                if cached is not None:
+                    return dict(cached)
+
+            if system_instruction is None:
+                embedding = self._embed(question)
+            if embedding is not None and not refresh:
+                with self._cache_lock:
+                    cached = self._semantic_lookup(partition, embedding)
+                if cached is not None:
+                    cached = dict(cached, query=question)
+                    self._cache_store(key, partition, None, cached)
+                    return dict(cached)
 
         try:
             # Build query request with corpus reference
@@ -99,50 +812,47 @@ class ExplantsKnowledgeGraph:
             query_config = {
                 'model': self.model,
                 'contents': question,
-                'config': types.GenerateContentConfig(
-                    tools=[
-                        types.Tool(
-                            google_search_retrieval=types.GoogleSearchRetrieval(
-                                dynamic_retrieval_config=types.DynamicRetrievalConfig(
-                                    mode="MODE_DYNAMIC",
-                                    dynamic_threshold=0.3
-                                )
-                            )
-                        )
-                    ],
-                    response_modalities=["TEXT"],
-                    temperature=0.3  # Lower for more factual responses
-                )
+                'config': self._generation_config(json_response, system_instruction)
             }
 
-            # Add corpus context if metadata filter is specified
+            # Add corpus context if metadata filter is specified, as a
+            # separate (shared) part rather than a concatenated string
             if metadata_filter:
-                # Append filter context to question
-                filtered_question = f"{question}\n\nSearch filters: {metadata_filter}"
-                query_config['contents'] = filtered_question
-
-            response = self.client.models.generate_content(**query_config)
-
-            # Extract answer
-            answer = response.text if hasattr(response, 'text') else str(response)
-
-            # Extract citations (if available)
+                query_config['contents'] = [
+                    types.Part(text=question),
+                    _filter_part(metadata_filter)
+                ]
+
+            # Stream the answer so concurrent context fetches overlap token
+            # generation instead of each waiting on a full response
+            parts = []
+            response = None
+            for response in self.client.models.generate_content_stream(**query_config):
+                text = getattr(response, 'text', None)
+                if text:
+                    parts.append(text)
+            answer = "".join(parts)
+
+            # Extract citations (if available); grounding metadata arrives
+            # on the final chunk of the stream
             citations = []
-            if hasattr(response, 'candidates'):
-                for candidate in response.candidates:
-                    if hasattr(candidate, 'grounding_metadata'):
-                        gm = candidate.grounding_metadata
-                        if hasattr(gm, 'grounding_chunks'):
-                            for chunk in gm.grounding_chunks:
-                                citation = {}
-                                if hasattr(chunk, 'text'):
-                                    citation['text'] = chunk.text
-                                if hasattr(chunk, 'source'):
-                                    citation['source'] = chunk.source
-                                if citation:
-                                    citations.append(citation)
-
-            return {
+            append = citations.append
+            for candidate in getattr(response, 'candidates', None) or ():
+                gm = getattr(candidate, 'grounding_metadata', None)
+                if gm is None:
+                    continue
+                for chunk in getattr(gm, 'grounding_chunks', None) or ():
+                    citation = {}
+                    text = getattr(chunk, 'text', None)
+                    if text is not None:
+                        citation['text'] = text
+                    source = getattr(chunk, 'source', None)
+                    if source is not None:
+                        citation['source'] = source
+                    if citation:
+                        append(citation)
+
+            result = {
                 'answer': answer,
                 'citations': citations,
                 'query': question,
@@ -151,7 +861,7 @@ class ExplantsKnowledgeGraph:
             }
 
         except Exception as e:
-            print(f"Error querying knowledge graph: {e}")
+            logger.error("Error querying knowledge graph: %s", e)
             return {
                 'answer': f"Error: {str(e)}",
                 'citations': [],
@@ -160,6 +870,14 @@ class ExplantsKnowledgeGraph:
                 'error': str(e)
             }
 
+        # Answers are generated at temperature 0.3, so they are stable enough
+        # to reuse; errors are never cached. A caching failure must not turn
+        # a good answer into an error, so it happens outside the try above.
+        if self.cache_enabled:
+            self._cache_store(key, partition, embedding, result)
+
+        return dict(result)
+
     def get_character_context(self,
                              character_name: str,
                              story_phase: Optional[int] = None) -> str:
@@ -173,25 +891,114 @@ class ExplantsKnowledgeGraph:
         Returns:
             Character context summary
         """
-        query = f"""
-        Provide a comprehensive summary of {character_name}'s:
-        1. Current psychological state and motivations
-        2. Capabilities and limitations
-        3. Key relationships with other characters
-        4. Recent developments and character arc
-        5. Voice and personality traits
+        return self._cached_answer(
+            ('character', character_name, story_phase),
+            question=f"Character: {character_name}",
+            system_instruction=self._CHAR_SYS_INSTRUCTION,
+            story_phase=story_phase,
+            categories=["character", "scene", "chapter", "voice"],
+            canon_only=True
+        )
 
-        Focus on their current state in the story.
+    def get_characters_context(self,
+                               character_names: List[str],
+                               story_phase: Optional[int] = None) -> Dict[str, str]:
         """
+        Get character context for several characters in one request.
 
+        Asks for a JSON object keyed by character name; any character the
+        response does not cover (or an unparseable response) falls back to
+        get_character_context().
+
+        Args:
+            character_names: Character names (e.g., ["Mickey", "Noni"])
+            story_phase: Filter by story phase
+
+        Returns:
+            Character name -> context summary, in the order given
+        """
+        names = list(dict.fromkeys(character_names))
+        answers = {}
+
+        if self.cache_enabled:
+            with self._cache_lock:
+                for name in names:
+                    answer = self._context_cache.get(('character', name, story_phase))
+                    if answer is not None:
+                        self._context_cache.move_to_end(('character', name, story_phase))
+                        self.cache_stats['hits'] += 1
+                        answers[name] = answer
+
+        missing = [name for name in names if name not in answers]
+        if len(missing) > 1:
+            answers.update(self._query_characters_json(missing, story_phase))
+            missing = [name for name in names if name not in answers]
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                futures = {
+                    executor.submit(self.get_character_context, name, story_phase): name
+                    for name in missing
+                }
+                for future in as_completed(futures):
+                    name = futures[future]
+                    try:
+                        answers[name] = future.result()
+                    except Exception as e:
+                        logger.warning("Could not get context for %s: %s", name, e)
+                        answers[name] = f"[Context unavailable: {e}]"
+
+        return {name: answers[name] for name in names}
+
+    def _query_characters_json(self,
+                               character_names: List[str],
+                               story_phase: Optional[int]) -> Dict[str, str]:
+        """
+        Run the batched JSON character query.
+
+        Args:
+            character_names: Character names to request
+            story_phase: Filter by story phase
+
+        Returns:
+            Formatted context for each character found in the response
+            (empty if the query failed or returned invalid JSON)
+        """
         result = self.query(
-            question=query,
+            question=f"Characters: {', '.join(character_names)}",
+            system_instruction=self._CHARS_JSON_SYS_INSTRUCTION,
             story_phase=story_phase,
             categories=["character", "scene", "chapter", "voice"],
-            canon_only=True
+            canon_only=True,
+            json_response=True
         )
+        if 'error' in result:
+            return {}
 
-        return result['answer']
+        try:
+            data = _loads(result['answer'])
+        except (TypeError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+
+        # Models don't always echo the name's exact casing back
+        by_name = {str(key).casefold(): value for key, value in data.items()}
+        answers = {}
+        for name in character_names:
+            fields = by_name.get(name.casefold())
+            if not isinstance(fields, dict):
+                continue
+            lines = [
+                f"{label}: {_field_text(fields[field])}"
+                for field, label in CHARACTER_FIELDS
+                if fields.get(field)
+            ]
+            if lines:
+                answers[name] = "\n".join(lines)
+                self._remember_answer(('character', name, story_phase), answers[name])
+
+        return answers
 
     def get_worldbuilding_context(self,
                                   topics: List[str],
@@ -206,59 +1013,116 @@ class ExplantsKnowledgeGraph:
         Returns:
             Worldbuilding context
         """
-        topic_str = ", ".join(topics)
-        query = f"""
-        Explain these worldbuilding concepts: {topic_str}
-
-        Include:
-        1. Core mechanics and how they work
-        2. Rules and limitations
-        3. How characters experience them
-        4. Current state in the story
-        5. Relevant examples from scenes
-        """
-
-        result = self.query(
-            question=query,
+        return self._cached_answer(
+            ('worldbuilding', tuple(sorted(topics)), story_phase),
+            question=f"Worldbuilding concepts: {', '.join(topics)}",
+            system_instruction=self._WORLDBUILDING_SYS_INSTRUCTION,
             story_phase=story_phase,
             categories=["worldbuilding", "scene", "chapter"],
             canon_only=True
         )
 
-        return result['answer']
-
     def get_recent_chapters(self,
                            count: int = 3,
-                           volume: Optional[int] = None) -> str:
+                           volume: Optional[int] = None,
+                           refresh: bool = False) -> str:
         """
         Get summaries of recent chapters.
 
         Args:
             count: Number of chapters to retrieve
             volume: Filter by volume
+            refresh: Re-query instead of reusing a cached summary
 
         Returns:
             Chapter summaries
         """
-        query = f"""
-        Summarize the {count} most recent chapters.
-
-        For each chapter, include:
-        1. Major events and plot developments
-        2. Character developments and decisions
-        3. Themes explored
-        4. Key scenes and moments
-        5. Plot threads continued or resolved
-        """
-
-        result = self.query(
-            question=query,
+        return self._cached_answer(
+            ('recent_chapters', count, volume),
+            refresh=refresh,
+            question=f"Number of chapters: {count}",
+            system_instruction=self._RECENT_CHAPTERS_SYS_INSTRUCTION,
             volume=volume,
             categories=["chapter"],
             canon_only=True
         )
 
-        return result['answer']
+    def refresh_recent_chapters(self):
+        """
+        Re-fetch the recent-chapter summary in the background.
+
+        Call when new chapters have been indexed mid-session.
+        build_scene_context() waits for the fetch.
+        """
+        self._prefetch_recent_chapters(refresh=True)
+
+    def _prefetch_recent_chapters(self, refresh: bool):
+        """Warm the recent-chapter summary on a background thread."""
+        self._recent_chapters_ready.clear()
+        threading.Thread(
+            target=self._warm_recent_chapters, args=(refresh,), daemon=True
+        ).start()
+
+    def _warm_recent_chapters(self, refresh: bool = False):
+        """
+        Fetch and memoize the summary build_scene_context() uses.
+
+        On construction a persisted summary is reused (refresh=False);
+        only refresh_recent_chapters() forces a new query.
+        """
+        try:
+            self.get_recent_chapters(count=3, refresh=refresh)
+        except Exception:
+            # build_scene_context() retries and reports the failure
+            pass
+        finally:
+            self._recent_chapters_ready.set()
+
+    def _prefetched_recent_chapters(self) -> str:
+        """Recent-chapter summary, waiting on an in-flight prefetch."""
+        self._recent_chapters_ready.wait()
+        return self.get_recent_chapters(count=3)
+
+    def _prefetch_for_scene(self,
+                            scene_outline: str,
+                            characters: List[str],
+                            worldbuilding_topics: List[str],
+                            story_phase: Optional[int]):
+        """
+        Warm context the next scenes are likely to ask for.
+
+        Embeds the outline, finds the most similar earlier scenes, and fetches
+        (in the background) context for their characters and topics that this
+        scene doesn't already request. Then records this scene in the index.
+        """
+        embedding = self._embed(scene_outline)
+        if embedding is None:
+            return
+
+        with self._cache_lock:
+            neighbors = [
+                entry for _, _, entry in
+                self._scene_index.search(embedding, SCENE_PREFETCH_NEIGHBORS)
+            ]
+            self._scene_index.add(
+                None, embedding, (tuple(characters), tuple(worldbuilding_topics))
+            )
+
+        wanted_characters = set(characters)
+        wanted_topics = {tuple(sorted(worldbuilding_topics))}
+        for prior_characters, prior_topics in neighbors:
+            for character in prior_characters:
+                if character not in wanted_characters:
+                    wanted_characters.add(character)
+                    self._prefetch_executor.submit(
+                        self.get_character_context, character, story_phase
+                    )
+            topics_key = tuple(sorted(prior_topics))
+            if prior_topics and topics_key not in wanted_topics:
+                wanted_topics.add(topics_key)
+                self._prefetch_executor.submit(
+                    self.get_worldbuilding_context, list(prior_topics), story_phase
+                )
 
     def find_related_scenes(self,
                            scene_outline: str,
@@ -273,21 +1137,9 @@ class ExplantsKnowledgeGraph:
         Returns:
             Related scenes description
         """
-        query = f"""
-        Find scenes similar to: {scene_outline}
-
-        Show scenes that:
-        1. Feature the same characters
-        2. Explore similar themes or conflicts
-        3. Reference related events
-        4. Use similar worldbuilding mechanics
-        5. Match the emotional tone
-
-        For each scene, briefly describe what makes it relevant.
-        """
-
         result = self.query(
-            question=query,
+            question=f"Scene outline: {scene_outline}",
+            system_instruction=self._RELATED_SCENES_SYS_INSTRUCTION,
             story_phase=story_phase,
             categories=["scene", "chapter"],
             canon_only=True
@@ -325,51 +1177,68 @@ class ExplantsKnowledgeGraph:
             'story_phase': story_phase
         }
 
-        print(f"Building context for scene: {scene_outline[:50]}...")
+        logger.info("Building context for scene: %s...", scene_outline[:50])
 
-        # Get character context
+        if self.prefetch_similar_scenes:
+            if self._prefetch_executor is None:
+                self._prefetch_executor = ThreadPoolExecutor(max_workers=4)
+            self._prefetch_executor.submit(
+                self._prefetch_for_scene, scene_outline, list(characters),
+                list(worldbuilding_topics), story_phase
+            )
+
+        # Each section is an independent Gemini round-trip, so dispatch them
+        # concurrently and collect the results as they finish.
+        jobs = {}
         if characters:
-            print(f"  Retrieving context for {len(characters)} characters...")
-            for character in characters:
-                try:
-                    context['characters'][character] = self.get_character_context(
-                        character, story_phase
-                    )
-                except Exception as e:
-                    print(f"    Warning: Could not get context for {character}: {e}")
-                    context['characters'][character] = f"[Context unavailable: {e}]"
+            logger.debug("Retrieving context for %d characters...", len(characters))
+            jobs['characters'] = (
+                self.get_characters_context, (characters, story_phase),
+                "Could not get character context", "Context unavailable"
+            )
 
-        # Get worldbuilding
         if worldbuilding_topics:
-            print(f"  Retrieving worldbuilding for {len(worldbuilding_topics)} topics...")
-            try:
-                context['worldbuilding'] = self.get_worldbuilding_context(
-                    worldbuilding_topics, story_phase
-                )
-            except Exception as e:
-                print(f"    Warning: Could not get worldbuilding: {e}")
-                context['worldbuilding'] = f"[Worldbuilding unavailable: {e}]"
-
-        # Get recent chapters
-        print("  Retrieving recent chapters...")
-        try:
-            context['recent_chapters'] = self.get_recent_chapters(count=3)
-        except Exception as e:
-            print(f"    Warning: Could not get recent chapters: {e}")
-            context['recent_chapters'] = f"[Recent chapters unavailable: {e}]"
+            logger.debug("Retrieving worldbuilding for %d topics...", len(worldbuilding_topics))
+            jobs['worldbuilding'] = (
+                self.get_worldbuilding_context, (worldbuilding_topics, story_phase),
+                "Could not get worldbuilding", "Worldbuilding unavailable"
+            )
+
+        logger.debug("Retrieving recent chapters...")
+        jobs['recent_chapters'] = (
+            self._prefetched_recent_chapters, (),
+            "Could not get recent chapters", "Recent chapters unavailable"
+        )
 
-        # Find related scenes
         if include_related_scenes:
-            print("  Finding related scenes...")
-            try:
-                context['related_scenes'] = self.find_related_scenes(
-                    scene_outline, story_phase
-                )
-            except Exception as e:
-                print(f"    Warning: Could not find related scenes: {e}")
-                context['related_scenes'] = f"[Related scenes unavailable: {e}]"
+            logger.debug("Finding related scenes...")
+            jobs['related_scenes'] = (
+                self.find_related_scenes, (scene_outline, story_phase),
+                "Could not find related scenes", "Related scenes unavailable"
+            )
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = {
+                executor.submit(func, *args): key
+                for key, (func, args, _, _) in jobs.items()
+            }
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    results[key] = future.result()
+                except Exception as e:
+                    _, _, warning, fallback = jobs[key]
+                    logger.warning("%s: %s", warning, e)
+                    results[key] = f"[{fallback}: {e}]"
+
+        for section, value in results.items():
+            if section == 'characters' and isinstance(value, str):
+                # The whole character fetch failed; mark each one unavailable
+                value = {character: value for character in characters}
+            context[section] = value
 
-        print("✓ Context building complete")
+        logger.info("✓ Context building complete")
 
         return context
 
@@ -383,40 +1252,21 @@ class ExplantsKnowledgeGraph:
         Returns:
             Formatted prompt text
         """
-        sections = []
-
-        # Scene outline
-        sections.append(f"SCENE OUTLINE:\n{context['scene_outline']}\n")
+        sections = [f"SCENE OUTLINE:\n{context['scene_outline']}\n"]
 
         # Characters
-        if context.get('characters'):
-            sections.append("=" * 80)
-            sections.append("CHARACTER CONTEXT:")
-            sections.append("=" * 80)
-            for name, info in context['characters'].items():
-                sections.append(f"\n### {name.upper()}:")
-                sections.append(info)
-
-        # Worldbuilding
-        if context.get('worldbuilding'):
-            sections.append("\n" + "=" * 80)
-            sections.append("WORLDBUILDING & MECHANICS:")
-            sections.append("=" * 80)
-            sections.append(context['worldbuilding'])
-
-        # Recent chapters
-        if context.get('recent_chapters'):
-            sections.append("\n" + "=" * 80)
-            sections.append("RECENT CHAPTERS (For Continuity):")
-            sections.append("=" * 80)
-            sections.append(context['recent_chapters'])
-
-        # Related scenes
-        if context.get('related_scenes'):
-            sections.append("\n" + "=" * 80)
-            sections.append("RELATED SCENES (For Reference):")
-            sections.append("=" * 80)
-            sections.append(context['related_scenes'])
+        characters = context.get('characters')
+        if characters:
+            sections.append(f"{_DIV}\nCHARACTER CONTEXT:\n{_DIV}")
+            sections.extend(
+                f"\n### {name}:\n{info}"
+                for name, info in zip(map(str.upper, characters), characters.values())
+            )
+
+        # Worldbuilding, recent chapters and related scenes
+        for key, title in _CONTEXT_SECTIONS:
+            if context.get(key):
+                sections.append(f"\n{_DIV}\n{title}\n{_DIV}\n{context[key]}")
 
         # Story phase note
         if context.get('story_phase'):
@@ -427,6 +1277,8 @@ class ExplantsKnowledgeGraph:
 
 # Test examples
 if __name__ == "__main__":
+    import logging.handlers
+    import queue
     import sys
 
     if len(sys.argv) < 2:
@@ -435,52 +1287,61 @@ if __name__ == "__main__":
 
     store_id = sys.argv[1]
 
+    # Worker threads hand log records to a queue; one listener thread writes
+    # them, so concurrent context fetches don't contend on stdout
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    logging.basicConfig(level=logging.INFO, format="%(message)s",
+                        handlers=[logging.handlers.QueueHandler(log_queue)])
+    listener.start()
+
     print("=" * 80)
     print("EXPLANTS KNOWLEDGE GRAPH - TEST QUERIES")
     print("=" * 80)
     print(f"Store ID: {store_id}")
     print()
 
-    kg = ExplantsKnowledgeGraph(store_id=store_id)
-
-    # Test 1: Character query
-    print("TEST 1: Character Context")
-    print("-" * 80)
-    result = kg.query(
-        question="What is Mickey Bardot's psychological state in Phase 3?",
-        story_phase=3,
-        categories=["character", "scene"],
-        canon_only=True
-    )
-    print(f"Answer: {result['answer'][:300]}...")
-    print(f"Citations: {len(result['citations'])}")
-    print()
-
-    # Test 2: Worldbuilding query
-    print("TEST 2: Worldbuilding Mechanics")
-    print("-" * 80)
-    result = kg.query(
-        question="Explain bi-location mechanics: The Line, The Tether, The Shared Vein",
-        categories=["worldbuilding"],
-        canon_only=True
-    )
-    print(f"Answer: {result['answer'][:300]}...")
-    print()
+    with ExplantsKnowledgeGraph(store_id=store_id) as kg:
+        # Test 1: Character query
+        print("TEST 1: Character Context")
+        print("-" * 80)
+        result = kg.query(
+            question="What is Mickey Bardot's psychological state in Phase 3?",
+            story_phase=3,
+            categories=["character", "scene"],
+            canon_only=True
+        )
+        print(f"Answer: {result['answer'][:300]}...")
+        print(f"Citations: {len(result['citations'])}")
+        print()
+
+        # Test 2: Worldbuilding query
+        print("TEST 2: Worldbuilding Mechanics")
+        print("-" * 80)
+        result = kg.query(
+            question="Explain bi-location mechanics: The Line, The Tether, The Shared Vein",
+            categories=["worldbuilding"],
+            canon_only=True
+        )
+        print(f"Answer: {result['answer'][:300]}...")
+        print()
+
+        # Test 3: Scene context building
+        print("TEST 3: Scene Context Package")
+        print("-" * 80)
+        context = kg.build_scene_context(
+            scene_outline="Mickey processes bi-location strain after Noni's warning",
+            characters=["Mickey", "Noni"],
+            worldbuilding_topics=["bi-location", "The Line"],
+            story_phase=3
+        )
+        formatted = kg.format_context_for_agent(context)
+        print(f"Context length: {len(formatted):,} characters")
+        print(f"Preview:\n{formatted[:500]}...")
+        print()
 
-    # Test 3: Scene context building
-    print("TEST 3: Scene Context Package")
-    print("-" * 80)
-    context = kg.build_scene_context(
-        scene_outline="Mickey processes bi-location strain after Noni's warning",
-        characters=["Mickey", "Noni"],
-        worldbuilding_topics=["bi-location", "The Line"],
-        story_phase=3
-    )
-    formatted = kg.format_context_for_agent(context)
-    print(f"Context length: {len(formatted):,} characters")
-    print(f"Preview:\n{formatted[:500]}...")
-    print()
+        print("=" * 80)
+        print("TESTS COMPLETE")
+        print("=" * 80)
 
-    print("=" * 80)
-    print("TESTS COMPLETE")
-    print("=" * 80)
+    listener.stop()
@@ -4,16 +4,264 @@ Bulk Upload with Intelligent Auto-Tagging
 Uploads all markdown files from The Explants Series with automatically detected metadata.
 """
 
+import asyncio
+import fnmatch
+import functools
+import hashlib
+import json
 import os
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, List, Tuple
-from datetime import datetime
+from typing import Optional, Dict, Iterator, List, Tuple
+import httpx
 from google import genai
 from google.genai import types
 
 from .config import GeminiFileSearchConfig
 
+# Uploads are network-bound (two REST round-trips per file), so several are
+# kept in flight at once.
+UPLOAD_CONCURRENCY = 16
+
+# Files are uploaded in batches and each batch is committed to the corpus together.
+UPLOAD_BATCH_SIZE = 32
+
+# Content hashes of uploaded files, per store, so re-runs skip unchanged files
+DEFAULT_MANIFEST_PATH = "~/.cache/explants/gemini_upload_manifest.json"
+
+# Every failure of the latest run, one JSON object per line
+DEFAULT_ERROR_LOG_PATH = "~/.cache/explants/gemini_upload_errors.jsonl"
+
+# Failures kept in memory for the end-of-run summary
+ERROR_SUMMARY_SIZE = 10
+
+DEFAULT_EXCLUDE_PATTERNS = (
+    "*/.git/*",
+    "*/node_modules/*",
+    "*/__pycache__/*",
+    "*/venv/*",
+    "*/output/*",
+    "*/.DS_Store",
+)
+
+# Scene number X.Y.Z (volume.chapter.scene) and "Chapter X" / "Chapter_X"
+_SCENE_RE = re.compile(r'(\d+)\.(\d+)\.(\d+)')
+_CHAPTER_RE = re.compile(r'Chapter[_\s](\d+)', re.IGNORECASE)
+
+# Exclude globs that name a single directory ("*/.git/*") or file ("*/.DS_Store")
+_DIR_GLOB_RE = re.compile(r"\*/([^*?\[\]/]+)/\*")
+_FILE_GLOB_RE = re.compile(r"\*/([^*?\[\]/]+)")
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_excludes(patterns: Tuple[str, ...]) -> "re.Pattern":
+    """
+    Compile exclude globs into one alternation regex over '/'-separated paths.
+
+    Paths are matched relative to the upload root with a leading '/', so
+    directories above the root never cause exclusions.
+
+    Patterns containing a slash match the end of the path, and their wildcards
+    may span directories, so "*/.git/*" excludes everything under any .git
+    directory. Patterns without a slash match the file name only, as with
+    Path.match.
+
+    Args:
+        patterns: Glob patterns
+
+    Returns:
+        Compiled regex; search() finds a match for excluded paths
+    """
+    # "*/<dir>/*" and "*/<file>" (the default excludes) only need a literal
+    # name between separators; they share one group each instead of a
+    # translated glob per pattern
+    dir_names = sorted(_pruned_dir_names(patterns))
+    file_names = sorted({m.group(1) for m in map(_FILE_GLOB_RE.fullmatch, patterns) if m})
+
+    alternatives = []
+    if dir_names:
+        alternatives.append("/(?:%s)/" % "|".join(map(re.escape, dir_names)))
+    if file_names:
+        alternatives.append("/(?:%s)\\Z" % "|".join(map(re.escape, file_names)))
+
+    for pattern in patterns:
+        if _DIR_GLOB_RE.fullmatch(pattern) or _FILE_GLOB_RE.fullmatch(pattern):
+            continue
+        translated = fnmatch.translate(pattern)
+        if pattern.startswith("/"):
+            alternatives.append(f"^{translated}")
+        elif "/" in pattern:
+            alternatives.append(f"(?:^|/){translated}")
+        else:
+            alternatives.append(f"(?:^|/)(?=[^/]*\\Z){translated}")
+    flags = re.IGNORECASE if os.name == "nt" else 0
+    return re.compile("|".join(f"(?:{a})" for a in alternatives) or "(?!)", flags)
+
+
+def _pruned_dir_names(patterns: Tuple[str, ...]) -> frozenset:
+    """
+    Directory names whose whole subtree is excluded by a "*/<name>/*" pattern.
+
+    Args:
+        patterns: Exclude glob patterns
+
+    Returns:
+        Names of directories that need not be walked at all
+    """
+    return frozenset(m.group(1) for m in map(_DIR_GLOB_RE.fullmatch, patterns) if m)
+
+
+def _walk(root: Path, file_pattern: str, exclude_patterns: Tuple[str, ...]) -> Iterator[Path]:
+    """
+    Lazily find files under root matching file_pattern and not excluded.
+
+    Walks with os.scandir, skipping directories excluded by name without
+    listing them. Symlinked directories are not followed, as with rglob.
+
+    Args:
+        root: Directory to walk
+        file_pattern: Glob matched against file names (e.g. "*.md")
+        exclude_patterns: Exclude glob patterns
+
+    Yields:
+        Paths of matching files
+    """
+    exclude_re = _compile_excludes(exclude_patterns)
+    root_prefix = str(root)
+    if not root_prefix.endswith(os.sep):
+        root_prefix += os.sep
+
+    def included(file_path: Path) -> bool:
+        # Match below root only, so a root inside e.g. ".../output/" still
+        # finds its files
+        path_str = str(file_path)
+        if path_str.startswith(root_prefix):
+            rel_path = path_str[len(root_prefix):]
+        else:
+            rel_path = str(file_path.relative_to(root))
+        if os.sep != "/":
+            rel_path = rel_path.replace(os.sep, "/")
+        return not exclude_re.search("/" + rel_path)
+
+    if "/" in file_pattern or os.sep in file_pattern or "**" in file_pattern:
+        # Patterns spanning directories keep rglob's semantics
+        yield from (p for p in root.rglob(file_pattern) if included(p))
+        return
+
+    flags = re.IGNORECASE if os.name == "nt" else 0
+    name_match = re.compile(fnmatch.translate(file_pattern), flags).match
+    pruned = _pruned_dir_names(exclude_patterns)
+
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if is_dir:
+                if entry.name not in pruned:
+                    subdirs.append(entry.path)
+            elif name_match(entry.name) and entry.is_file():
+                file_path = Path(entry.path)
+                if included(file_path):
+                    yield file_path
+
+        # Depth-first, visiting subdirectories in listing order
+        stack.extend(reversed(subdirs))
+
+
+def _file_sha256(file_path: Path) -> str:
+    """Hex SHA-256 of a file's contents, streamed in chunks."""
+    with open(file_path, 'rb') as f:
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+: hashes straight from the file into OpenSSL
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        while chunk := f.read(65536):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+def _volume(path_lower: str) -> Optional[int]:
+    """Volume number from a lowercased path."""
+    if "volume 1" in path_lower:
+        return 1
+    elif "volume 2" in path_lower:
+        return 2
+    elif "volume 3" in path_lower:
+        return 3
+
+    return None
+
+
+def _category(path_lower: str) -> str:
+    """Content category from a lowercased path."""
+    if "character" in path_lower:
+        return "character"
+    elif "world" in path_lower or "mechanics" in path_lower:
+        return "worldbuilding"
+    elif "chapter" in path_lower or "act" in path_lower:
+        return "chapter"
+    elif "scene" in path_lower:
+        return "scene"
+    elif "outline" in path_lower:
+        return "outline"
+    elif "reference" in path_lower or "knowledge_base" in path_lower:
+        return "reference"
+    elif "voice" in path_lower or "style" in path_lower:
+        return "voice"
+    elif "skill" in path_lower:
+        return "skill"
+    elif "backup" in path_lower or "archive" in path_lower:
+        return "archive"
+    else:
+        return "unknown"
+
+
+def _status(path_str: str, path_lower: str, stem_lower: str) -> str:
+    """File status from the path, its lowercased form and the lowercased file stem."""
+    if "draft" in stem_lower:
+        return "draft"
+    elif "final" in stem_lower:
+        return "final"
+    elif "archive" in path_lower or "backup" in path_lower:
+        return "archived"
+    elif "old" in path_lower:
+        return "old"
+    elif "Volume 1" in path_str or "Volume 2" in path_str:
+        # Files in main Volume directories considered canon
+        return "canon"
+    else:
+        return "unknown"
+
+
+def _scene_number(stem: str) -> Optional[str]:
+    """Scene number (e.g., 2.3.6) from a file stem."""
+    match = _SCENE_RE.search(stem)
+    if match:
+        return f"{match.group(1)}.{match.group(2)}.{match.group(3)}"
+
+    return None
+
+
+def _chapter_number(path_str: str) -> Optional[int]:
+    """Chapter number from a path string."""
+    match = _CHAPTER_RE.search(path_str)
+    if match:
+        return int(match.group(1))
+
+    return None
+
 
 class FileMetadataExtractor:
     """Extract metadata from file paths and names."""
@@ -21,86 +269,28 @@ class FileMetadataExtractor:
     @staticmethod
     def extract_volume(path: Path) -> Optional[int]:
         """Extract volume number from path."""
-        path_str = str(path)
-
-        if "Volume 1" in path_str or "volume 1" in path_str.lower():
-            return 1
-        elif "Volume 2" in path_str or "volume 2" in path_str.lower():
-            return 2
-        elif "Volume 3" in path_str or "volume 3" in path_str.lower():
-            return 3
-
-        return None
+        return _volume(str(path).lower())
 
     @staticmethod
     def extract_category(path: Path) -> str:
         """Extract content category from path."""
-        path_lower = str(path).lower()
-
-        if "character" in path_lower:
-            return "character"
-        elif "world" in path_lower or "mechanics" in path_lower:
-            return "worldbuilding"
-        elif "chapter" in path_lower or "act" in path_lower.lower():
-            return "chapter"
-        elif "scene" in path_lower:
-            return "scene"
-        elif "outline" in path_lower:
-            return "outline"
-        elif "reference" in path_lower or "knowledge_base" in path_lower:
-            return "reference"
-        elif "voice" in path_lower or "style" in path_lower:
-            return "voice"
-        elif "skill" in path_lower:
-            return "skill"
-        elif "backup" in path_lower or "archive" in path_lower:
-            return "archive"
-        else:
-            return "unknown"
+        return _category(str(path).lower())
 
     @staticmethod
     def extract_status(path: Path) -> str:
         """Extract file status from path and name."""
         path_str = str(path)
-        filename = path.stem.lower()
-
-        if "draft" in filename:
-            return "draft"
-        elif "final" in filename.lower() or "FINAL" in path.stem:
-            return "final"
-        elif "archive" in path_str.lower() or "backup" in path_str.lower():
-            return "archived"
-        elif "old" in path_str.lower():
-            return "old"
-        elif "Volume 1" in path_str or "Volume 2" in path_str:
-            # Files in main Volume directories considered canon
-            return "canon"
-        else:
-            return "unknown"
+        return _status(path_str, path_str.lower(), path.stem.lower())
 
     @staticmethod
     def extract_scene_number(path: Path) -> Optional[str]:
         """Extract scene number (e.g., 2.3.6) from filename."""
-        filename = path.stem
-
-        # Pattern: X.Y.Z (volume.chapter.scene)
-        match = re.search(r'(\d+)\.(\d+)\.(\d+)', filename)
-        if match:
-            return f"{match.group(1)}.{match.group(2)}.{match.group(3)}"
-
-        return None
+        return _scene_number(path.stem)
 
     @staticmethod
     def extract_chapter_number(path: Path) -> Optional[int]:
         """Extract chapter number from path."""
-        path_str = str(path)
-
-        # Pattern: Chapter X or Chapter_X
-        match = re.search(r'Chapter[_\s](\d+)', path_str, re.IGNORECASE)
-        if match:
-            return int(match.group(1))
-
-        return None
+        return _chapter_number(str(path))
 
     @staticmethod
     def infer_story_phase(volume: Optional[int], chapter: Optional[int]) -> Optional[int]:
@@ -139,17 +329,30 @@ class FileMetadataExtractor:
         Returns:
             Metadata dictionary
         """
-        rel_path = file_path.relative_to(root)
+        # Convert the path once and share it across the individual checks
+        path_str = str(file_path)
+        path_lower = path_str.lower()
+        stem = file_path.stem
+
+        # Files found under root share its string prefix; slicing it off
+        # avoids building an intermediate Path via relative_to()
+        root_prefix = str(root)
+        if not root_prefix.endswith(os.sep):
+            root_prefix += os.sep
+        if path_str.startswith(root_prefix):
+            rel_path = path_str[len(root_prefix):]
+        else:
+            rel_path = str(file_path.relative_to(root))
 
-        volume = cls.extract_volume(file_path)
-        category = cls.extract_category(file_path)
-        status = cls.extract_status(file_path)
-        scene_number = cls.extract_scene_number(file_path)
-        chapter_number = cls.extract_chapter_number(file_path)
+        volume = _volume(path_lower)
+        category = _category(path_lower)
+        status = _status(path_str, path_lower, stem.lower())
+        scene_number = _scene_number(stem)
+        chapter_number = _chapter_number(path_str)
         story_phase = cls.infer_story_phase(volume, chapter_number)
 
         metadata = {
-            "relative_path": str(rel_path),
+            "relative_path": rel_path,
             "filename": file_path.name,
             "category": category,
             "status": status
@@ -172,66 +375,357 @@ class BulkUploader:
 
     def __init__(self,
                  store_id: str,
-                 config: Optional[GeminiFileSearchConfig] = None):
+                 config: Optional[GeminiFileSearchConfig] = None,
+                 max_concurrency: int = UPLOAD_CONCURRENCY,
+                 manifest_path: str = DEFAULT_MANIFEST_PATH,
+                 error_log_path: str = DEFAULT_ERROR_LOG_PATH):
         """
         Initialize uploader.
 
         Args:
             store_id: File Search store ID (corpus name)
             config: Configuration instance
+            max_concurrency: Default number of uploads in flight at once
+            manifest_path: JSON manifest of uploaded file hashes
+            error_log_path: JSONL log of the failures of the latest upload run
         """
         self.config = config or GeminiFileSearchConfig()
         self.store_id = store_id
+        self.max_concurrency = max_concurrency
+        self.manifest_path = Path(manifest_path).expanduser()
+        self._manifest = self._load_manifest()
+        self.error_log_path = Path(error_log_path).expanduser()
 
         if not self.config.validate_api_key():
             raise ValueError("Google API key not configured")
 
-        self.client = genai.Client(api_key=self.config.get_google_api_key())
+        self.client = self._create_client(self.config.get_google_api_key(), max_concurrency)
         self.extractor = FileMetadataExtractor()
 
-    def upload_file(self, file_path: Path, root: Path) -> bool:
+    @staticmethod
+    def _create_client(api_key: str, pool_size: int) -> genai.Client:
+        """
+        Create a genai client whose HTTP connection pool fits the upload threads.
+
+        httpx keeps only 20 idle connections by default, so with more upload
+        threads than that connections would be torn down and re-established
+        (TLS handshake included) between requests.
+
+        Args:
+            api_key: Google API key
+            pool_size: Number of concurrent requests to keep connections for
+
+        Returns:
+            genai.Client
+        """
+        limits = httpx.Limits(
+            max_connections=max(100, pool_size),
+            max_keepalive_connections=max(20, pool_size)
+        )
+        try:
+            return genai.Client(api_key=api_key, http_options={"client_args": {"limits": limits}})
+        except (TypeError, ValueError):
+            # SDK versions without client_args keep httpx's default pool
+            return genai.Client(api_key=api_key)
+
+    def _load_manifest(self) -> Dict:
+        """Load the upload manifest ({store_id: {relative_path: entry}})."""
+        try:
+            with open(self.manifest_path, 'r') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = {}
+        manifest.setdefault(self.store_id, {})
+        return manifest
+
+    def _save_manifest(self):
+        """Write the upload manifest atomically."""
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.manifest_path.with_suffix('.tmp')
+            with open(tmp, 'w') as f:
+                json.dump(self._manifest, f)
+            os.replace(tmp, self.manifest_path)
+        except OSError as e:
+            print(f"Warning: could not save upload manifest: {e}")
+
+    def _is_unchanged(self, metadata: Dict, digest: str) -> bool:
+        """True if this file was already uploaded with the same content and metadata."""
+        entry = self._manifest[self.store_id].get(metadata["relative_path"])
+        return (entry is not None
+                and entry["sha256"] == digest
+                and entry["metadata"] == metadata)
+
+    def _record_upload(self, metadata: Dict, digest: str, uploaded_name: str):
+        """Remember a successful upload in the manifest (saved separately)."""
+        self._manifest[self.store_id][metadata["relative_path"]] = {
+            "sha256": digest,
+            "file": uploaded_name,
+            "metadata": metadata,
+        }
+
+    def upload_file(self, file_path: Path, root: Path, force: bool = False) -> bool:
         """
         Upload a single file with metadata.
 
+        Files recorded in the manifest with the same content and metadata
+        are skipped.
+
         Args:
             file_path: Path to file
             root: Root directory (for relative path)
+            force: Upload even if the file is unchanged since the last upload
 
         Returns:
-            True if successful
+            True if successful (or unchanged)
         """
         # Extract metadata
         metadata = self.extractor.extract_all_metadata(file_path, root)
 
         try:
-            # Upload file
-            uploaded_file = self.client.files.upload(
-                path=str(file_path),
-                config=types.UploadFileConfig(
-                    display_name=file_path.name,
-                    corpus_name=self.store_id
-                )
-            )
-
-            # Add to corpus with metadata
-            document = self.client.files.create_document(
-                corpus_name=self.store_id,
-                display_name=file_path.name,
-                files=[uploaded_file.name],
-                metadata=metadata
-            )
-
+            digest = _file_sha256(file_path)
+            if not force and self._is_unchanged(metadata, digest):
+                return True
+
+            uploaded_name = self._upload_bytes_only(file_path)
+            self._create_document(file_path, uploaded_name, metadata)
+            self._record_upload(metadata, digest, uploaded_name)
+            self._save_manifest()
             return True
 
         except Exception as e:
             print(f"  Error: {e}")
             return False
 
+    def _upload_bytes_only(self, file_path: Path) -> str:
+        """
+        Upload a file's contents without adding it to the corpus.
+
+        Args:
+            file_path: Path to file
+
+        Returns:
+            Name of the uploaded file
+        """
+        uploaded_file = self.client.files.upload(
+            path=str(file_path),
+            config=types.UploadFileConfig(
+                display_name=file_path.name,
+                corpus_name=self.store_id
+            )
+        )
+        return uploaded_file.name
+
+    def _create_document(self, file_path: Path, uploaded_name: str, metadata: Dict):
+        """Add an uploaded file to the corpus with its metadata."""
+        return self.client.files.create_document(
+            corpus_name=self.store_id,
+            display_name=file_path.name,
+            files=[uploaded_name],
+            metadata=metadata
+        )
+
+    async def _commit_batch(self,
+                            batch: List[Tuple[Path, str, Dict]],
+                            pool: ThreadPoolExecutor) -> List[Optional[Exception]]:
+        """
+        Add a batch of uploaded files to the corpus.
+
+        Each document carries its own metadata, so documents are created
+        individually, all in flight at once on the upload pool.
+
+        Args:
+            batch: List of (file_path, uploaded_name, metadata)
+            pool: Thread pool running the blocking SDK calls
+
+        Returns:
+            Per-file error (None once the document is created), in batch order
+        """
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(loop.run_in_executor(pool, self._create_document, file_path, uploaded_name, metadata)
+              for file_path, uploaded_name, metadata in batch),
+            return_exceptions=True
+        )
+
+        return [result if isinstance(result, Exception) else None for result in results]
+
+    async def _upload_batch(self,
+                            batch: List[Path],
+                            root: Path,
+                            pool: ThreadPoolExecutor,
+                            force: bool) -> Tuple[List[Tuple[Path, bool, Optional[Exception]]], int]:
+        """
+        Upload a batch of files concurrently, then commit them together.
+
+        Files unchanged since their last upload (per the manifest) are
+        skipped unless force is set.
+
+        Args:
+            batch: Files to upload
+            root: Root directory (for relative paths)
+            pool: Thread pool running the blocking SDK calls
+            force: Upload even unchanged files
+
+        Returns:
+            Tuple of (results, skipped_count); results holds
+            (file_path, success, error) per file, with the exception that
+            failed the file as error and skipped files counted as successes
+        """
+        loop = asyncio.get_running_loop()
+        results = []
+        extracted = []
+        for file_path in batch:
+            try:
+                metadata = self.extractor.extract_all_metadata(file_path, root)
+            except Exception as e:
+                results.append((file_path, False, e))
+                continue
+            extracted.append((file_path, metadata))
+
+        digests = await asyncio.gather(
+            *(loop.run_in_executor(pool, _file_sha256, file_path)
+              for file_path, _ in extracted),
+            return_exceptions=True
+        )
+
+        skipped = 0
+        pending = []
+        for (file_path, metadata), digest in zip(extracted, digests):
+            if isinstance(digest, Exception):
+                results.append((file_path, False, digest))
+            elif not force and self._is_unchanged(metadata, digest):
+                skipped += 1
+                results.append((file_path, True, None))
+            else:
+                pending.append((file_path, metadata, digest))
+
+        uploads = await asyncio.gather(
+            *(loop.run_in_executor(pool, self._upload_bytes_only, file_path)
+              for file_path, _, _ in pending),
+            return_exceptions=True
+        )
+
+        to_commit = []
+        for (file_path, metadata, digest), uploaded in zip(pending, uploads):
+            if isinstance(uploaded, Exception):
+                results.append((file_path, False, uploaded))
+            else:
+                to_commit.append((file_path, uploaded, metadata, digest))
+
+        commit_errors = await self._commit_batch(
+            [(file_path, uploaded, metadata) for file_path, uploaded, metadata, _ in to_commit],
+            pool
+        )
+        for (file_path, uploaded, metadata, digest), error in zip(to_commit, commit_errors):
+            if error is None:
+                self._record_upload(metadata, digest, uploaded)
+            results.append((file_path, error is None, error))
+
+        return results, skipped
+
+    async def _upload_files_async(self,
+                                  files_to_upload: List[Path],
+                                  root: Path,
+                                  start_time: float,
+                                  max_concurrency: int,
+                                  force: bool) -> Tuple[int, int, List, int]:
+        """
+        Upload files concurrently in batches, reporting progress as batches complete.
+
+        The blocking SDK calls run on a dedicated thread pool whose size bounds
+        the number of requests in flight. Only a few batches run at once (one
+        more than fills the pool), so the pool stays busy while a batch waits
+        on its slowest upload, yet each batch's documents are created, counted
+        and saved to the manifest as the run goes rather than queued behind
+        every other batch's uploads.
+
+        Args:
+            files_to_upload: Files to upload
+            root: Root directory (for relative paths)
+            start_time: time.monotonic() when the upload started (for progress rates)
+            max_concurrency: Maximum number of requests in flight at once
+            force: Upload even files unchanged since their last upload
+
+        Every failure is appended to the error log as it happens; only the
+        first ERROR_SUMMARY_SIZE are kept in memory.
+
+        Returns:
+            Tuple of (success_count, error_count, first_errors, skipped_count)
+        """
+        total = len(files_to_upload)
+        success_count = 0
+        error_count = 0
+        errors = []
+        skipped_count = 0
+        error_log = None
+
+        def record_error(file_path: Path, error: str):
+            nonlocal error_count, error_log
+            error_count += 1
+            if len(errors) < ERROR_SUMMARY_SIZE:
+                errors.append((str(file_path), error))
+            try:
+                if error_log is None:
+                    self.error_log_path.parent.mkdir(parents=True, exist_ok=True)
+                    error_log = open(self.error_log_path, 'w', encoding='utf-8')
+                error_log.write(json.dumps({"path": str(file_path), "error": error}) + "\n")
+                error_log.flush()
+            except OSError as e:
+                print(f"Warning: could not write error log: {e}")
+
+        # A log left by an earlier run would be mistaken for this run's failures
+        try:
+            self.error_log_path.unlink()
+        except OSError:
+            pass
+
+        batch_slots = asyncio.Semaphore(max(1, max_concurrency // UPLOAD_BATCH_SIZE) + 1)
+
+        async def run_batch(batch: List[Path], pool: ThreadPoolExecutor):
+            async with batch_slots:
+                return await self._upload_batch(batch, root, pool, force)
+
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as pool:
+            pending = [
+                run_batch(files_to_upload[i:i + UPLOAD_BATCH_SIZE], pool)
+                for i in range(0, total, UPLOAD_BATCH_SIZE)
+            ]
+            for next_done in asyncio.as_completed(pending):
+                results, skipped = await next_done
+                skipped_count += skipped
+                # Persist after every batch so an interrupted run keeps its progress
+                self._save_manifest()
+
+                for file_path, success, error in results:
+                    if success:
+                        success_count += 1
+                    else:
+                        record_error(file_path, str(error))
+                        print(f"  ✗ {file_path.name}: {error}")
+
+                # Show progress
+                done = success_count + error_count
+                elapsed = time.monotonic() - start_time
+                rate = done / elapsed if elapsed > 0 else 0
+                remaining = (total - done) / rate if rate > 0 else 0
+                print(f"Progress: {done}/{total} "
+                      f"({done/total*100:.1f}%) "
+                      f"- {rate:.1f} files/sec "
+                      f"- ETA: {remaining/60:.1f} min")
+
+        if error_log is not None:
+            error_log.close()
+
+        return success_count, error_count, errors, skipped_count
+
     def upload_directory(self,
                         root_dir: Optional[Path] = None,
                         file_pattern: str = "*.md",
                         exclude_patterns: Optional[List[str]] = None,
-                        dry_run: bool = False) -> Tuple[int, int, List]:
+                        dry_run: bool = False,
+                        max_concurrency: Optional[int] = None,
+                        force: bool = False) -> Tuple[int, int, List]:
         """
         Upload all matching files from directory recursively.
 
@@ -240,9 +734,15 @@ class BulkUploader:
             file_pattern: File glob pattern (default: *.md)
             exclude_patterns: Patterns to exclude
             dry_run: If True, don't actually upload
+            max_concurrency: Maximum number of uploads in flight at once
+                (default: the uploader's max_concurrency)
+            force: Re-upload files even if unchanged since their last upload
 
         Returns:
-            Tuple of (success_count, error_count, error_list)
+            Tuple of (success_count, error_count, error_list); unchanged
+            files that were skipped count as successes, and error_list holds
+            the first ERROR_SUMMARY_SIZE (path, error) pairs, with every
+            failure in the error log
         """
         if root_dir is None:
             root_dir = self.config.get_story_root_path()
@@ -260,29 +760,9 @@ class BulkUploader:
             print("DRY RUN - No files will be uploaded")
         print()
 
-        # Find all matching files
-        all_files = list(root_dir.rglob(file_pattern))
-
-        # Apply exclusions
-        exclude_patterns = exclude_patterns or [
-            "*/.git/*",
-            "*/node_modules/*",
-            "*/__pycache__/*",
-            "*/venv/*",
-            "*/output/*",
-            "*/.DS_Store"
-        ]
-
-        files_to_upload = []
-        for file_path in all_files:
-            excluded = False
-            for pattern in exclude_patterns:
-                if file_path.match(pattern):
-                    excluded = True
-                    break
-
-            if not excluded:
-                files_to_upload.append(file_path)
+        # Find all matching files, skipping excluded directories entirely
+        exclude_patterns = tuple(exclude_patterns or DEFAULT_EXCLUDE_PATTERNS)
+        files_to_upload = list(_walk(root_dir, file_pattern, exclude_patterns))
 
         print(f"Found {len(files_to_upload)} files to upload")
         print()
@@ -306,56 +786,34 @@ class BulkUploader:
             return 0, 0, []
 
         # Upload files
-        success_count = 0
-        error_count = 0
-        errors = []
+        start_time = time.monotonic()
 
-        start_time = datetime.now()
-
-        for i, file_path in enumerate(files_to_upload, 1):
-            try:
-                # Show progress
-                if i % 10 == 0 or i == 1:
-                    elapsed = (datetime.now() - start_time).total_seconds()
-                    rate = i / elapsed if elapsed > 0 else 0
-                    remaining = (len(files_to_upload) - i) / rate if rate > 0 else 0
-                    print(f"Progress: {i}/{len(files_to_upload)} "
-                          f"({i/len(files_to_upload)*100:.1f}%) "
-                          f"- {rate:.1f} files/sec "
-                          f"- ETA: {remaining/60:.1f} min")
-
-                # Upload file
-                success = self.upload_file(file_path, root_dir)
-
-                if success:
-                    success_count += 1
-                else:
-                    error_count += 1
-                    errors.append((str(file_path), "Upload failed"))
-
-            except Exception as e:
-                error_count += 1
-                errors.append((str(file_path), str(e)))
-                print(f"  ✗ {file_path.name}: {e}")
+        success_count, error_count, errors, skipped_count = asyncio.run(
+            self._upload_files_async(files_to_upload, root_dir, start_time,
+                                     max_concurrency or self.max_concurrency, force)
+        )
 
         # Summary
-        elapsed = (datetime.now() - start_time).total_seconds()
+        elapsed = time.monotonic() - start_time
         print()
         print("=" * 80)
         print("UPLOAD COMPLETE")
         print("=" * 80)
         print(f"✓ Successfully uploaded: {success_count} files")
+        if skipped_count:
+            print(f"  (of which {skipped_count} unchanged since last upload, skipped)")
         print(f"✗ Errors: {error_count} files")
         print(f"Time elapsed: {elapsed/60:.1f} minutes")
-        print(f"Average rate: {success_count/elapsed:.1f} files/sec")
+        print(f"Average rate: {success_count/elapsed if elapsed > 0 else 0:.1f} files/sec")
         print()
 
         if errors:
             print("Errors encountered:")
-            for file_path, error in errors[:10]:  # Show first 10
+            for file_path, error in errors:  # First ERROR_SUMMARY_SIZE only
                 print(f"  - {Path(file_path).name}: {error}")
-            if len(errors) > 10:
-                print(f"  ... and {len(errors) - 10} more errors")
+            if error_count > len(errors):
+                print(f"  ... and {error_count - len(errors)} more errors")
+            print(f"Full error log: {self.error_log_path}")
             print()
 
         return success_count, error_count, errors
@@ -378,12 +836,17 @@ def main():
                        help="Show what would be uploaded without uploading")
     parser.add_argument('--exclude', nargs='+',
                        help="Additional exclude patterns")
+    parser.add_argument('--force', action='store_true',
+                       help="Re-upload files even if unchanged since the last upload")
+    parser.add_argument('--concurrency', type=int, default=UPLOAD_CONCURRENCY,
+                       help=f"Concurrent uploads (default: {UPLOAD_CONCURRENCY})")
 
     args = parser.parse_args()
 
     # Initialize uploader
     config = GeminiFileSearchConfig()
-    uploader = BulkUploader(store_id=args.store_id, config=config)
+    uploader = BulkUploader(store_id=args.store_id, config=config,
+                            max_concurrency=args.concurrency)
 
     # Set root directory
     root_dir = Path(args.root_dir) if args.root_dir else None
@@ -393,7 +856,8 @@ def main():
         root_dir=root_dir,
         file_pattern=args.pattern,
         exclude_patterns=args.exclude,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        force=args.force
     )
 
     if not args.dry_run:
@@ -4,12 +4,38 @@ Configuration for Gemini File Search Integration
 Manages API keys, store IDs, and project settings.
 """
 
+import copy
+import functools
 import os
 import json
 from pathlib import Path
 from typing import Optional
 
 
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path_str: str) -> dict:
+    """
+    Load and parse a configuration file, once per path.
+
+    Args:
+        path_str: Path to credentials.json
+
+    Returns:
+        Parsed configuration (shared; callers must copy before mutating)
+    """
+    config_path = Path(path_str)
+    if not config_path.exists():
+        print(f"Warning: Config file not found at {config_path}")
+        return {}
+
+    try:
+        with open(config_path, 'r') as f:
+            return json.load(f)
+    except json.JSONDecodeError as e:
+        print(f"Error parsing config file: {e}")
+        return {}
+
+
 class GeminiFileSearchConfig:
     """Configuration for Gemini File Search API."""
 
@@ -25,19 +51,17 @@ class GeminiFileSearchConfig:
 
         self.config_path = Path(config_path)
         self.config = self._load_config()
+        self._story_root: Optional[Path] = None
 
     def _load_config(self) -> dict:
-        """Load configuration from JSON file."""
-        if not self.config_path.exists():
-            print(f"Warning: Config file not found at {self.config_path}")
-            return {}
-
-        try:
-            with open(self.config_path, 'r') as f:
-                return json.load(f)
-        except json.JSONDecodeError as e:
-            print(f"Error parsing config file: {e}")
-            return {}
+        """Load configuration from JSON file (parsed once per path and cached)."""
+        return copy.deepcopy(_load_config_cached(str(self.config_path)))
+
+    def reload(self):
+        """Re-read the configuration file, discarding cached copies."""
+        _load_config_cached.cache_clear()
+        self.config = self._load_config()
+        self._story_root = None
 
     def get_google_api_key(self) -> Optional[str]:
         """
@@ -103,6 +127,7 @@ class GeminiFileSearchConfig:
         # Save to file
         with open(self.config_path, 'w') as f:
             json.dump(self.config, f, indent=2)
+        _load_config_cached.cache_clear()
 
         print(f"✓ Saved store ID to config: {store_id}")
 
@@ -110,14 +135,21 @@ class GeminiFileSearchConfig:
         """
         Get root path to story files.
 
+        Once a location is found it is remembered for the lifetime of this
+        config; until then every call probes again.
+
         Returns:
             Path to "The Explants Series" directory
         """
+        if self._story_root is not None:
+            return self._story_root
+
         # Default path
         repo_root = Path(__file__).parent.parent.parent
         story_path = repo_root / "The Explants Series"
 
         if story_path.exists():
+            self._story_root = story_path
             return story_path
 
         # Try alternative locations
@@ -128,6 +160,7 @@ class GeminiFileSearchConfig:
 
         for path in alt_paths:
             if path.exists():
+                self._story_root = path
                 return path
 
         # Default to repo location
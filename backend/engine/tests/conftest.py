@@ -0,0 +1,54 @@
+"""
+Shared test setup.
+
+The Gemini File Search modules import google-genai (and httpx through it) at
+module level. When those SDKs are not installed, minimal stand-ins are
+registered so the modules can still be imported; tests that talk to Gemini
+replace genai.Client with their own fake either way.
+"""
+
+import sys
+import types
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+class _Config:
+    """Stand-in for SDK config classes: keeps its keyword arguments."""
+
+    def __init__(self, *args, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+def _install_stand_ins():
+    try:
+        from google import genai  # noqa: F401
+    except ImportError:
+        google = sys.modules.get("google")
+        if google is None:
+            google = types.ModuleType("google")
+            google.__path__ = []
+            sys.modules["google"] = google
+
+        genai_types = types.ModuleType("google.genai.types")
+        genai_types.__getattr__ = lambda name: type(name, (_Config,), {})
+
+        genai = types.ModuleType("google.genai")
+        genai.types = genai_types
+        genai.Client = type("Client", (_Config,), {})
+
+        google.genai = genai
+        sys.modules["google.genai"] = genai
+        sys.modules["google.genai.types"] = genai_types
+
+    try:
+        import httpx  # noqa: F401
+    except ImportError:
+        httpx = types.ModuleType("httpx")
+        httpx.Limits = type("Limits", (_Config,), {})
+        sys.modules["httpx"] = httpx
+
+
+_install_stand_ins()
@@ -0,0 +1,226 @@
+"""
+Unit tests for the Gemini File Search querier's answer cache.
+
+Run with:
+    python3 -m pytest engine/tests/test_agent_querier.py
+"""
+
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from gemini_file_search import agent_querier
+from gemini_file_search.agent_querier import ExplantsKnowledgeGraph
+
+
+class _FakeModels:
+    """Stands in for client.models: numbered answers, one-hot embeddings."""
+
+    def __init__(self):
+        self.calls = []
+        self.failures = 0
+        self.source = None
+        self.aliases = {}
+        self._axes = {}
+
+    def generate_content_stream(self, model, contents, config=None):
+        question = contents if isinstance(contents, str) else contents[0].text
+        self.calls.append(question)
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("service unavailable")
+        candidates = None
+        if self.source is not None:
+            chunk = SimpleNamespace(text="cited passage", source=self.source)
+            metadata = SimpleNamespace(grounding_chunks=[chunk])
+            candidates = [SimpleNamespace(grounding_metadata=metadata)]
+        yield SimpleNamespace(text=f"answer {len(self.calls)}", candidates=candidates)
+
+    def embed_content(self, model, contents):
+        # Questions mapped to the same alias embed identically
+        axis = self._axes.setdefault(self.aliases.get(contents, contents), len(self._axes))
+        values = [0.0] * 16
+        values[axis % 16] = 1.0
+        return SimpleNamespace(embeddings=[SimpleNamespace(values=values)])
+
+
+@pytest.fixture
+def models(monkeypatch):
+    """Fake Gemini backend shared by every querier created in a test."""
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+    fake = _FakeModels()
+    client = SimpleNamespace(models=fake)
+    monkeypatch.setattr(agent_querier.genai, "Client", lambda *args, **kwargs: client)
+    return fake
+
+
+def _querier(tmp_path, **kwargs):
+    kwargs.setdefault("prefetch_recent_chapters", False)
+    return ExplantsKnowledgeGraph(store_id="corpora/test",
+                                  cache_path=str(tmp_path / "cache.sqlite"),
+                                  **kwargs)
+
+
+class TestQueryCache:
+    """Test in-memory answer caching."""
+
+    def test_exact_repeat_is_served_from_cache(self, tmp_path, models):
+        """An identical question is answered once."""
+        kg = _querier(tmp_path)
+
+        first = kg.query("Who is Mickey?")
+        second = kg.query("Who is Mickey?")
+
+        assert first["answer"] == second["answer"] == "answer 1"
+        assert models.calls == ["Who is Mickey?"]
+
+    def test_similar_question_is_served_from_cache(self, tmp_path, models):
+        """A question embedding close enough to a cached one reuses its answer."""
+        models.aliases["who is mickey"] = "Who is Mickey?"
+        kg = _querier(tmp_path)
+
+        kg.query("Who is Mickey?")
+        result = kg.query("who is mickey")
+
+        assert result["answer"] == "answer 1"
+        assert result["query"] == "who is mickey"
+        assert models.calls == ["Who is Mickey?"]
+
+    def test_different_question_is_not_served_from_cache(self, tmp_path, models):
+        """Unrelated questions each reach the model."""
+        kg = _querier(tmp_path)
+
+        kg.query("Who is Mickey?")
+        result = kg.query("Who is Noni?")
+
+        assert result["answer"] == "answer 2"
+        assert len(models.calls) == 2
+
+    def test_json_and_prose_answers_are_cached_separately(self, tmp_path, models):
+        """A JSON query never gets the prose answer to the same question."""
+        kg = _querier(tmp_path)
+
+        prose = kg.query("Who is Mickey?")
+        as_json = kg.query("Who is Mickey?", json_response=True)
+
+        assert prose["answer"] == "answer 1"
+        assert as_json["answer"] == "answer 2"
+        assert kg.query("Who is Mickey?", json_response=True)["answer"] == "answer 2"
+        assert len(models.calls) == 2
+
+    def test_errors_are_not_cached(self, tmp_path, models):
+        """A failed query is retried on the next call."""
+        models.failures = 1
+        kg = _querier(tmp_path)
+
+        failed = kg.query("Who is Mickey?")
+        retried = kg.query("Who is Mickey?")
+
+        assert "error" in failed
+        assert "error" not in retried
+        assert retried["answer"] == "answer 2"
+
+    def test_refresh_replaces_cached_answer(self, tmp_path, models):
+        """refresh=True re-queries, and later lookups see the new answer."""
+        kg = _querier(tmp_path)
+
+        kg.query("Who is Mickey?")
+        refreshed = kg.query("Who is Mickey?", refresh=True)
+        again = kg.query("Who is Mickey?")
+
+        assert refreshed["answer"] == again["answer"] == "answer 2"
+        assert len(models.calls) == 2
+
+
+class TestPersistentCache:
+    """Test answers persisted across querier instances."""
+
+    def test_answers_reload_from_disk(self, tmp_path, models):
+        """A new querier on the same cache file reuses earlier answers."""
+        _querier(tmp_path).query("Who is Mickey?")
+
+        result = _querier(tmp_path).query("Who is Mickey?")
+
+        assert result["answer"] == "answer 1"
+        assert len(models.calls) == 1
+
+    def test_similar_question_hits_reloaded_entry(self, tmp_path, models):
+        """Persisted embeddings serve similar questions after a reload."""
+        models.aliases["who is mickey"] = "Who is Mickey?"
+        _querier(tmp_path).query("Who is Mickey?")
+
+        result = _querier(tmp_path).query("who is mickey")
+
+        assert result["answer"] == "answer 1"
+        assert len(models.calls) == 1
+
+    def test_non_json_citation_source_is_persisted(self, tmp_path, models):
+        """A citation source JSON can't encode neither fails the query nor the cache."""
+        models.source = SimpleNamespace(uri="gs://corpus/scene.md")
+        result = _querier(tmp_path).query("Who is Mickey?")
+
+        reloaded = _querier(tmp_path).query("Who is Mickey?")
+
+        assert "error" not in result
+        assert result["citations"][0]["source"] is models.source
+        assert reloaded["answer"] == "answer 1"
+        assert reloaded["citations"] == [{"text": "cited passage", "source": str(models.source)}]
+        assert len(models.calls) == 1
+
+    def test_expired_answers_are_requeried(self, tmp_path, models, monkeypatch):
+        """Answers older than cache_ttl are not served."""
+        _querier(tmp_path, cache_ttl=60).query("Who is Mickey?")
+
+        later = time.time() + 3600
+        monkeypatch.setattr(agent_querier.time, "time", lambda: later)
+        result = _querier(tmp_path, cache_ttl=60).query("Who is Mickey?")
+
+        assert result["answer"] == "answer 2"
+        assert len(models.calls) == 2
+
+    def test_startup_prefetch_reuses_persisted_summary(self, tmp_path, models):
+        """Warming recent chapters on construction does not bypass the cache."""
+        first = _querier(tmp_path)
+        summary = first.get_recent_chapters(count=3)
+
+        second = _querier(tmp_path, prefetch_recent_chapters=True)
+
+        assert second._prefetched_recent_chapters() == summary
+        assert len(models.calls) == 1
+
+    def test_refresh_recent_chapters_requeries(self, tmp_path, models):
+        """refresh_recent_chapters() always fetches a new summary."""
+        kg = _querier(tmp_path)
+        kg.get_recent_chapters(count=3)
+
+        kg.refresh_recent_chapters()
+
+        assert kg._prefetched_recent_chapters() == "answer 2"
+        assert len(models.calls) == 2
+
+
+class TestClose:
+    """Test releasing the querier's resources."""
+
+    def test_close_stops_prefetch_and_closes_cache(self, tmp_path, models):
+        """close() shuts the prefetch pool and cache file; memory caching still works."""
+        with _querier(tmp_path, prefetch_similar_scenes=True) as kg:
+            kg.build_scene_context(scene_outline="Mickey meets Noni",
+                                   characters=["Mickey"],
+                                   worldbuilding_topics=["The Line"])
+            executor = kg._prefetch_executor
+            answer = kg.query("Who is Mickey?")["answer"]
+
+        assert executor._shutdown
+        assert kg._cache_db is None
+
+        calls = len(models.calls)
+        assert kg.query("Who is Mickey?")["answer"] == answer
+        assert "error" not in kg.query("Who is Noni?")
+        assert len(models.calls) == calls + 1
@@ -0,0 +1,131 @@
+"""
+Unit tests for Gemini File Search bulk upload file discovery.
+
+Run with:
+    python3 -m pytest engine/tests/test_bulk_upload.py
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from gemini_file_search import bulk_upload
+from gemini_file_search.bulk_upload import BulkUploader, DEFAULT_EXCLUDE_PATTERNS, _walk
+
+
+def _touch(path: Path, text: str = "x"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def _found(root: Path):
+    return sorted(p.relative_to(root).as_posix() for p in _walk(root, "*.md", DEFAULT_EXCLUDE_PATTERNS))
+
+
+class _FakeFiles:
+    def __init__(self):
+        self.documents = []
+        self.calls = []
+
+    def upload(self, path, config=None):
+        self.calls.append("upload")
+        if Path(path).name.startswith("bad"):
+            raise RuntimeError("quota exceeded for " + Path(path).name)
+        return type("Uploaded", (), {"name": "files/" + Path(path).name})()
+
+    def create_document(self, corpus_name, display_name, files, metadata):
+        self.calls.append("create_document")
+        self.documents.append(metadata["relative_path"])
+
+
+class _FakeClient:
+    def __init__(self, *args, **kwargs):
+        self.files = _FakeFiles()
+
+
+class TestExcludes:
+    """Test default exclude patterns during the directory walk."""
+
+    def test_excluded_name_above_root_is_ignored(self, tmp_path):
+        """Directories above the upload root never exclude its files."""
+        for ancestor in ("output", "venv", ".git"):
+            root = tmp_path / ancestor / "The Explants Series"
+            _touch(root / "a.md")
+            _touch(root / "Volume 1" / "b.md")
+
+            assert _found(root) == ["Volume 1/b.md", "a.md"]
+
+    def test_nested_excluded_directories(self, tmp_path):
+        """Everything below an excluded directory is skipped, at any depth."""
+        _touch(tmp_path / ".git" / "x" / "y.md")
+        _touch(tmp_path / "notes" / ".git" / "x" / "y.md")
+        _touch(tmp_path / "notes" / "output" / "z.md")
+        _touch(tmp_path / "notes" / "kept.md")
+        _touch(tmp_path / "gitlike.git" / "kept.md")
+
+        assert _found(tmp_path) == ["gitlike.git/kept.md", "notes/kept.md"]
+
+    def test_upload_directory_below_excluded_name(self, tmp_path, monkeypatch):
+        """upload_directory uploads files from a root inside an "output" directory."""
+        monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+        monkeypatch.setattr(bulk_upload.genai, "Client", _FakeClient)
+        root = tmp_path / "output" / "The Explants Series"
+        _touch(root / "a.md")
+        _touch(root / "ACT 1" / "b.md")
+
+        uploader = BulkUploader(store_id="corpora/test",
+                                manifest_path=str(tmp_path / "manifest.json"),
+                                error_log_path=str(tmp_path / "errors.jsonl"))
+        success, errors, _ = uploader.upload_directory(root_dir=root)
+
+        assert (success, errors) == (2, 0)
+        assert sorted(uploader.client.files.documents) == ["ACT 1/b.md", "a.md"]
+
+
+class TestErrorLog:
+    """Test the per-file error log written during an upload."""
+
+    def test_error_log_records_exception_text(self, tmp_path, monkeypatch):
+        """Each failed file is logged with the exception that failed it."""
+        monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+        monkeypatch.setattr(bulk_upload.genai, "Client", _FakeClient)
+        root = tmp_path / "story"
+        _touch(root / "good.md")
+        _touch(root / "bad.md")
+        error_log = tmp_path / "errors.jsonl"
+
+        uploader = BulkUploader(store_id="corpora/test",
+                                manifest_path=str(tmp_path / "manifest.json"),
+                                error_log_path=str(error_log))
+        success, errors, first_errors = uploader.upload_directory(root_dir=root)
+
+        assert (success, errors) == (1, 1)
+        logged = [json.loads(line) for line in error_log.read_text().splitlines()]
+        assert logged == [{"path": str(root / "bad.md"), "error": "quota exceeded for bad.md"}]
+        assert first_errors == [(str(root / "bad.md"), "quota exceeded for bad.md")]
+
+
+class TestBatching:
+    """Test how upload batches are scheduled."""
+
+    def test_documents_are_created_as_the_run_goes(self, tmp_path, monkeypatch):
+        """Early batches are committed before later batches finish uploading."""
+        monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+        monkeypatch.setattr(bulk_upload.genai, "Client", _FakeClient)
+        root = tmp_path / "story"
+        for i in range(10 * bulk_upload.UPLOAD_BATCH_SIZE):
+            _touch(root / f"scene_{i:03d}.md", str(i))
+
+        uploader = BulkUploader(store_id="corpora/test",
+                                manifest_path=str(tmp_path / "manifest.json"),
+                                error_log_path=str(tmp_path / "errors.jsonl"),
+                                max_concurrency=4)
+        success, errors, _ = uploader.upload_directory(root_dir=root)
+
+        calls = uploader.client.files.calls
+        assert (success, errors) == (10 * bulk_upload.UPLOAD_BATCH_SIZE, 0)
+        last_upload = len(calls) - 1 - calls[::-1].index("upload")
+        assert calls.index("create_document") < last_upload / 2
@@ -0,0 +1,132 @@
+"""
+Unit tests for cross-scene character and relationship tracking.
+
+Run with:
+    python3 -m pytest engine/tests/test_character_tracker.py
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from consistency.character_tracker import CharacterStateTracker
+from consistency.models import CharacterState, RelationshipState
+
+
+MICKEY = "Mickey Bardot"
+NONI = "Noni"
+
+RANGES = ["touch", "close", "medium", "far"]
+TRUST = ["none", "low", "medium", "high", "complete"]
+EMOTIONS = ["hopeful", "desperate", "focused", "angry", "content", "tired"]
+ABILITIES = ["The Line", "The Tether", "The Shared Vein"]
+
+
+def _mickey(scene_id, days):
+    return CharacterState(MICKEY, scene_id, 1, attributes={"sobriety_days": days})
+
+
+def _trust(scene_id, level):
+    return RelationshipState(MICKEY, NONI, scene_id, 1, "professional", "", level)
+
+
+def _random_states(seed, count=60):
+    """Character and relationship states in shuffled scene order."""
+    rnd = random.Random(seed)
+    states = []
+    for n in range(count):
+        scene_id = f"1.{n // 10 + 1}.{n % 10 + 1}"
+        states.append(_mickey(scene_id, rnd.randint(0, 90)))
+        states.append(CharacterState(
+            NONI, scene_id, 1,
+            emotional_state=rnd.choice(EMOTIONS),
+            abilities=rnd.sample(ABILITIES, rnd.randint(0, len(ABILITIES))),
+            attributes={"morphic_resonance_range": rnd.choice(RANGES)},
+        ))
+        states.append(_trust(scene_id, rnd.choice(TRUST)))
+    rnd.shuffle(states)
+    return states
+
+
+def _add(tracker, state):
+    if isinstance(state, CharacterState):
+        tracker.add_character_state(state)
+    else:
+        tracker.add_relationship_state(state)
+
+
+def _fresh(states):
+    tracker = CharacterStateTracker()
+    for state in states:
+        _add(tracker, state)
+    return tracker
+
+
+def _dicts(issues):
+    return [issue.to_dict() for issue in issues]
+
+
+def _check(tracker):
+    return {
+        MICKEY: _dicts(tracker.check_character_consistency(MICKEY)),
+        NONI: _dicts(tracker.check_character_consistency(NONI)),
+        "relationship": _dicts(tracker.check_relationship_consistency(MICKEY, NONI)),
+    }
+
+
+class TestIncrementalChecks:
+    """Test that resumed checks match checking from scratch."""
+
+    def test_out_of_order_character_state_invalidates_checked_prefix(self):
+        """A state inserted before already-checked scenes is compared with its neighbours."""
+        tracker = _fresh([_mickey("1.1.1", 10), _mickey("1.1.3", 20)])
+        assert tracker.check_character_consistency(MICKEY) == []
+
+        tracker.add_character_state(_mickey("1.1.2", 30))
+        issues = tracker.check_character_consistency(MICKEY)
+
+        assert [issue.scenes_affected for issue in issues] == [["1.1.2", "1.1.3"]]
+
+    def test_out_of_order_relationship_state_invalidates_checked_prefix(self):
+        """A relationship state inserted mid-timeline re-checks both pairs around it."""
+        tracker = _fresh([_trust("1.1.1", "medium"), _trust("1.1.3", "medium")])
+        assert tracker.check_relationship_consistency(MICKEY, NONI) == []
+
+        tracker.add_relationship_state(_trust("1.1.2", "low"))
+        issues = tracker.check_relationship_consistency(MICKEY, NONI)
+
+        assert [issue.description for issue in issues] == [f"{MICKEY}/{NONI} Trust Reversal"]
+        assert issues[0].scenes_affected == ["1.1.1", "1.1.2"]
+
+    def test_repeated_checks_match_fresh_tracker(self):
+        """Checking between every batch of adds gives the same issues as one full check."""
+        for seed in range(5):
+            states = _random_states(seed)
+            tracker = CharacterStateTracker()
+            for start in range(0, len(states), 7):
+                for state in states[start:start + 7]:
+                    _add(tracker, state)
+                incremental = _check(tracker)
+                assert incremental == _check(_fresh(states[:start + 7]))
+                # Unchanged timeline: served from the stored result
+                assert _check(tracker) == incremental
+
+
+class TestCheckAll:
+    """Test running all checks at once."""
+
+    def test_process_pool_matches_in_process(self):
+        """check_all with worker processes returns the in-process issues, in order."""
+        states = _random_states(seed=42)
+        relationships = [(MICKEY, NONI), (NONI, MICKEY)]
+
+        in_process = _fresh(states).check_all([MICKEY, NONI, "Sadie"], relationships,
+                                              max_workers=1)
+        pooled = _fresh(states).check_all([MICKEY, NONI, "Sadie"], relationships,
+                                          max_workers=2)
+
+        assert in_process
+        assert _dicts(pooled) == _dicts(in_process)
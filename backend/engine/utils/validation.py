@@ -13,6 +13,21 @@ from typing import Dict, List, Tuple
 from dataclasses import dataclass
 
 
+def _compile_patterns(patterns: List[str]) -> List[re.Pattern]:
+    """Compile each pattern case-insensitively, preserving order."""
+    return [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+
+
+def _combine_patterns(patterns: List[str]) -> re.Pattern:
+    """
+    Compile patterns into one case-insensitive alternation.
+
+    Used as a single-scan pre-check: if the combined pattern finds nothing,
+    none of the individual patterns can match.
+    """
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
+
+
 @dataclass
 class ValidationResult:
     """Results from bi-location and voice validation."""
@@ -72,6 +87,14 @@ class BiLocationValidator:
         r'mind\s+operated\s+on\s+dual\s+levels',
     ]
 
+    def __init__(self):
+        self._forbidden = _compile_patterns(self.FORBIDDEN_PATTERNS)
+        self._any_forbidden = _combine_patterns(self.FORBIDDEN_PATTERNS)
+        self._indicators = _compile_patterns(self.BI_LOCATION_INDICATORS)
+        self._any_indicator = _combine_patterns(self.BI_LOCATION_INDICATORS)
+        self._announcements = _compile_patterns(self.TECHNICAL_ANNOUNCEMENTS)
+        self._any_announcement = _combine_patterns(self.TECHNICAL_ANNOUNCEMENTS)
+
     def validate(self, content: str) -> ValidationResult:
         """
         Validate scene content for bi-location mechanics and voice.
@@ -125,10 +148,11 @@ class BiLocationValidator:
 
     def _find_forbidden_jargon(self, content: str) -> List[str]:
         """Find forbidden jargon in content."""
+        if not self._any_forbidden.search(content):
+            return []
         found = []
-        for pattern in self.FORBIDDEN_PATTERNS:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
-            for match in matches:
+        for pattern in self._forbidden:
+            for match in pattern.finditer(content):
                 found.append(match.group(0))
         return list(set(found))  # Remove duplicates
 
@@ -150,9 +174,11 @@ class BiLocationValidator:
 
     def _check_bi_location_showing(self, content: str) -> bool:
         """Check if bi-location is shown through physical symptoms."""
+        if not self._any_indicator.search(content):
+            return False
         indicator_count = 0
-        for pattern in self.BI_LOCATION_INDICATORS:
-            if re.search(pattern, content, re.IGNORECASE):
+        for pattern in self._indicators:
+            if pattern.search(content):
                 indicator_count += 1
 
         # Need at least 2 indicators to consider it properly shown
@@ -160,10 +186,11 @@ class BiLocationValidator:
 
     def _find_technical_announcements(self, content: str) -> List[str]:
         """Find technical announcement violations."""
+        if not self._any_announcement.search(content):
+            return []
         found = []
-        for pattern in self.TECHNICAL_ANNOUNCEMENTS:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
-            for match in matches:
+        for pattern in self._announcements:
+            for match in pattern.finditer(content):
                 # Get surrounding context (up to 50 chars)
                 start = max(0, match.start() - 20)
                 end = min(len(content), match.end() + 30)
@@ -213,6 +240,12 @@ class VoiceValidator:
         r'clearly,',
     ]
 
+    def __init__(self):
+        self._voice_markers = _compile_patterns(self.VOICE_MARKERS)
+        self._any_voice_marker = _combine_patterns(self.VOICE_MARKERS)
+        self._anti_patterns = _compile_patterns(self.ANTI_PATTERNS)
+        self._any_anti_pattern = _combine_patterns(self.ANTI_PATTERNS)
+
     def validate_voice(self, content: str) -> Dict[str, any]:
         """
         Validate voice characteristics.
@@ -223,13 +256,15 @@ class VoiceValidator:
         voice_markers_found = 0
         anti_patterns_found = 0
 
-        for pattern in self.VOICE_MARKERS:
-            if re.search(pattern, content, re.IGNORECASE):
-                voice_markers_found += 1
+        if self._any_voice_marker.search(content):
+            for pattern in self._voice_markers:
+                if pattern.search(content):
+                    voice_markers_found += 1
 
-        for pattern in self.ANTI_PATTERNS:
-            if re.search(pattern, content, re.IGNORECASE):
-                anti_patterns_found += 1
+        if self._any_anti_pattern.search(content):
+            for pattern in self._anti_patterns:
+                if pattern.search(content):
+                    anti_patterns_found += 1
 
         # Calculate voice authenticity score (0-10)
         base_score = 7.0  # Neutral baseline